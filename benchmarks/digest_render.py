@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Benchmark email digest rendering.
+
+Usage:
+    python benchmarks/digest_render.py [num_jobs]
+
+Renders digests of synthetic jobs (1,000 by default) cold and warm, streams
+one chunk by chunk into memory with iter_digest, and reports timings and
+payload size.
+"""
+
+import io
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from scrapers.base import Job
+from notifier.render import DigestRenderer
+
+
+def make_jobs(count: int) -> list[Job]:
+    """Build synthetic scored jobs."""
+    return [
+        Job(
+            id=f"job{i:06d}",
+            title=f"Program Manager <Livelihoods> #{i}",
+            organization=f"Organization {i % 50}",
+            location="Addis Ababa, Ethiopia",
+            description="",
+            url=f"https://example.org/jobs/{i}",
+            source="bench",
+            deadline="2026-03-01",
+            salary="~$5,000/month" if i % 3 else None,
+            score=50 + (i % 50),
+        )
+        for i in range(count)
+    ]
+
+
+def timed(label: str, func, repeat: int = 5) -> float:
+    """Run func repeat times and print the best wall time."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    print(f"{label:<32} {best * 1000:8.2f} ms")
+    return best
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    jobs = make_jobs(count)
+    high = [j for j in jobs if j.score >= 70]
+    good = [j for j in jobs if j.score < 70]
+    stats = {"total_scanned": count, "high_matches": len(high), "good_matches": len(good)}
+
+    print(f"Digest of {count} jobs ({len(high)} high, {len(good)} good)")
+
+    timed("cold render (empty cache)", lambda: DigestRenderer(cache_size=count).render_digest(high, good, stats))
+
+    renderer = DigestRenderer(cache_size=count)
+    html_doc = renderer.render_digest(high, good, stats)
+    timed("warm render (cached fragments)", lambda: renderer.render_digest(high, good, stats))
+
+    def stream():
+        out = io.StringIO()
+        for chunk in renderer.iter_digest(high, good, stats):
+            out.write(chunk)
+    timed("streamed render (warm)", stream)
+
+    payload = len(html_doc.encode())
+    print(f"{'payload size':<32} {payload / 1024:8.1f} KiB ({payload / count:.0f} B/job)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Benchmark Job memory use and serialisation.
+
+Usage:
+    python benchmarks/job_memory.py [num_jobs]
+
+Loads synthetic job dicts (100,000 by default) into the slotted Job and
+into a copy of the old dataclass. Reports load and to_dict time, memory
+held once the source dicts are freed, and peak memory for each, plus the
+same for Job with deferred descriptions.
+"""
+
+import gc
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from scrapers.base import Job
+
+
+@dataclass
+class LegacyJob:
+    """The Job dataclass as it was before slots and interning."""
+
+    id: str
+    title: str
+    organization: str
+    location: str
+    description: str
+    url: str
+    source: str
+    posted_date: Optional[str] = None
+    deadline: Optional[str] = None
+    salary: Optional[str] = None
+    job_type: Optional[str] = None
+    experience_required: Optional[str] = None
+    scraped_at: str = field(default_factory=lambda: datetime.utcnow().isoformat())
+    score: Optional[float] = None
+    cover_letter_path: Optional[str] = None
+    content_hash: Optional[str] = None
+    deadline_date: Optional[str] = None
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "LegacyJob":
+        return cls(**{k: v for k, v in data.items() if k in cls.__dataclass_fields__})
+
+
+ORGANIZATIONS = ["UNICEF", "World Food Programme", "Save the Children", "Mercy Corps", "GIZ"]
+LOCATIONS = ["Addis Ababa, Ethiopia", "Nairobi, Kenya", "Juba, South Sudan", "Kampala, Uganda"]
+PARAGRAPH = "The incumbent will lead programme delivery and donor reporting. " * 20
+
+
+def make_dicts(count: int) -> list[dict]:
+    """Job dicts shaped like jobs.json, with strings built per record as json.load does."""
+    return [
+        {
+            "id": f"{i:012x}",
+            "title": f"Program Manager #{i}",
+            "organization": "".join(ORGANIZATIONS[i % len(ORGANIZATIONS)]),
+            "location": "".join(LOCATIONS[i % len(LOCATIONS)]),
+            "description": f"{PARAGRAPH}Reference {i}.",
+            "url": f"https://example.org/jobs/{i}",
+            "source": "".join(["relief", "web"]),
+            "deadline": "30 Nov 2026",
+            "job_type": "".join(["Full", "-time"]),
+            "scraped_at": "2026-10-18T06:00:00",
+            "score": 50 + (i % 50),
+        }
+        for i in range(count)
+    ]
+
+
+def measure(label: str, build):
+    """Print build()'s wall time, and the memory its result retains and peaks at."""
+    gc.collect()
+    start = time.perf_counter()
+    build()
+    elapsed = time.perf_counter() - start
+
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<34} {elapsed * 1000:8.1f} ms {retained / 2**20:8.1f} MiB held {peak / 2**20:8.1f} MiB peak")
+    return result
+
+
+def timed(label: str, func):
+    start = time.perf_counter()
+    func()
+    print(f"{label:<34} {(time.perf_counter() - start) * 1000:8.1f} ms")
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    print(f"{count} jobs")
+
+    rows = measure("Legacy load", lambda: [LegacyJob.from_dict(d) for d in make_dicts(count)])
+    timed("Legacy to_dict", lambda: [j.to_dict() for j in rows])
+    del rows
+
+    rows = measure("Job load", lambda: [Job.from_dict(d) for d in make_dicts(count)])
+    timed("Job to_dict", lambda: [j.to_dict() for j in rows])
+    del rows
+
+    def deferred():
+        jobs = []
+        for d in make_dicts(count):
+            d.pop("description")
+            job = Job.from_dict({**d, "description": None})
+            job.defer_description(lambda i=d["id"]: f"{PARAGRAPH}Reference {int(i, 16)}.")
+            jobs.append(job)
+        return jobs
+
+    rows = measure("Job load, deferred descriptions", deferred)
+    timed("Job first description read", lambda: [j.description for j in rows])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Benchmark CLI startup: the import cost of each main.py command.
+
+Usage:
+    python benchmarks/startup.py [--check]
+
+For every command, a fresh interpreter imports main.py plus the modules
+the command (and the helpers and commands it calls) imports, and reports
+the median time of several runs and which heavy dependencies got loaded.
+Commands are not run, so imports made while running (the scorer's
+scikit-learn, the scrapers' lxml) are not counted, and helpers in DEFERRED
+are not followed. With --check, exits non-zero if a lookup command (list,
+apply, search) loads a heavy dependency or takes longer than
+LOOKUP_BUDGET_MS.
+"""
+
+import inspect
+import re
+import statistics
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import main
+
+HEAVY = [
+    "sklearn", "numpy", "scipy", "requests", "lxml", "bs4", "feedparser", "tenacity", "sendgrid",
+    "google",
+]
+LOOKUP_COMMANDS = ["list", "apply", "search"]
+LOOKUP_BUDGET_MS = 100  # About twice a typical lookup, so noise alone does not fail --check
+RUNS = 7
+
+# Helpers that run only once a command has real work to do, e.g. apply's
+# letter generation, whose imports are part of that work, not of startup
+DEFERRED = {"_generate_letter"}
+
+COMMANDS = {
+    "scrape": "cmd_scrape",
+    "match": "cmd_match",
+    "generate": "cmd_generate",
+    "notify": "cmd_notify",
+    "run": "cmd_run",
+    "stream": "cmd_stream",
+    "watch": "cmd_watch",
+    "test-email": "cmd_test_email",
+    "send-outbox": "cmd_send_outbox",
+    "reparse": "cmd_reparse",
+    "apply": "cmd_apply",
+    "list": "cmd_list",
+    "search": "cmd_search",
+}
+
+IMPORT_LINE = re.compile(r"^\s*(from \S+ import .+|import \S+)$")
+CALL = re.compile(r"\b(_?[a-z_]+)\(")
+
+
+def command_imports(func_name: str, seen: set = None) -> list[str]:
+    """Import statements in a command and the main.py functions it calls."""
+    seen = seen if seen is not None else set()
+    if func_name in seen:
+        return []
+    seen.add(func_name)
+
+    source = textwrap.dedent(inspect.getsource(getattr(main, func_name)))
+    lines = [m.group(1) for m in map(IMPORT_LINE.match, source.splitlines()[1:]) if m]
+    for callee in CALL.findall(source):
+        if callee != func_name and callee not in DEFERRED and inspect.isfunction(getattr(main, callee, None)):
+            lines.extend(command_imports(callee, seen))
+    return list(dict.fromkeys(lines))
+
+
+def measure(lines: list[str]) -> tuple[float, list[str]]:
+    """Median import time in ms over RUNS fresh interpreters, and heavy modules loaded."""
+    probe = "\n".join([
+        "import sys, time",
+        "start = time.perf_counter()",
+        "import main",
+        *lines,
+        "elapsed = time.perf_counter() - start",
+        f"heavy = [m for m in {HEAVY!r} if m in sys.modules]",
+        "print(elapsed * 1000, ','.join(heavy))",
+    ])
+    times, heavy = [], []
+    for _ in range(RUNS):
+        out = subprocess.run(
+            [sys.executable, "-c", probe], cwd=ROOT, capture_output=True, text=True, check=True,
+        ).stdout.split()
+        times.append(float(out[0]))
+        heavy = out[1].split(",") if len(out) > 1 else []
+    return statistics.median(times), heavy
+
+
+def report():
+    check = "--check" in sys.argv
+    failures = []
+
+    print(f"{'Command':<12} {'Import':>9}  Heavy modules")
+    for command, func_name in COMMANDS.items():
+        elapsed, heavy = measure(command_imports(func_name))
+        print(f"{command:<12} {elapsed:7.1f} ms  {', '.join(heavy) or '-'}")
+        if command in LOOKUP_COMMANDS and (heavy or elapsed > LOOKUP_BUDGET_MS):
+            failures.append(command)
+
+    if failures:
+        print(f"\nOver budget ({LOOKUP_BUDGET_MS} ms, no heavy modules): {', '.join(failures)}")
+        if check:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    report()
@@ -5,29 +5,114 @@ from pathlib import Path
 
 # Paths
 BASE_DIR = Path(__file__).parent
-DATA_DIR = BASE_DIR / "data"
+DATA_DIR = Path(os.getenv("DATA_DIR", BASE_DIR / "data"))
 TEMPLATES_DIR = BASE_DIR / "templates"
 
 # Ensure data directory exists
 DATA_DIR.mkdir(exist_ok=True)
 
 # Data files
-JOBS_FILE = DATA_DIR / "jobs.json"
+JOBS_DIR = DATA_DIR / "jobs"  # One shard per scrape month, e.g. 2026-10.json
+JOBS_MANIFEST_FILE = JOBS_DIR / "manifest.json"
+JOBS_FILE = DATA_DIR / "jobs.json"  # Pre-shard single file, migrated on first load
 MATCHES_FILE = DATA_DIR / "matches.json"
+JOBS_ARCHIVE_FILE = DATA_DIR / "jobs_archive.jsonl"  # Closed postings, one per line
 APPLIED_FILE = DATA_DIR / "applied.json"
 CV_PROFILE_FILE = DATA_DIR / "cv_profile.json"
+SENT_LEDGER_FILE = DATA_DIR / "sent_ledger.json"
+WATCH_STATE_FILE = DATA_DIR / "watch_state.json"
+POLL_HISTORY_FILE = DATA_DIR / "poll_history.json"
+CIRCUIT_STATE_FILE = DATA_DIR / "circuit_state.json"
+RESPONSE_ARCHIVE_DIR = DATA_DIR / "responses"
+DESCRIPTION_STORE_DIR = DATA_DIR / "descriptions"
+SEARCH_DB_FILE = DATA_DIR / "search.db"  # Local cache, rebuilt from the job store
+SCORER_CACHE_DIR = DATA_DIR / "cache"  # Fitted scorer state, keyed by profile hash
+METRICS_DIR = DATA_DIR / "metrics"  # Last report per command, e.g. scrape.json and scrape.prom
 
 # API Keys (from environment/GitHub Secrets)
 GOOGLE_API_KEY = os.getenv("GOOGLE_API_KEY", "")
 SENDGRID_API_KEY = os.getenv("SENDGRID_API_KEY", "")
 EMAIL_TO = os.getenv("EMAIL_TO", "")
 EMAIL_FROM = os.getenv("EMAIL_FROM", "jobhunter@noreply.com")
+SENDGRID_API_HOST = os.getenv("SENDGRID_API_HOST", "https://api.sendgrid.com")
+
+# Email delivery backend: "sendgrid" (HTTP API) or "smtp" (outbox + SMTP)
+EMAIL_BACKEND = os.getenv("EMAIL_BACKEND", "sendgrid")
+SMTP_HOST = os.getenv("SMTP_HOST", "localhost")
+SMTP_PORT = int(os.getenv("SMTP_PORT", "587"))
+SMTP_USER = os.getenv("SMTP_USER", "")
+SMTP_PASSWORD = os.getenv("SMTP_PASSWORD", "")
+SMTP_STARTTLS = os.getenv("SMTP_STARTTLS", "true").lower() == "true"
+SMTP_POOL_SIZE = 2  # Persistent connections used to drain the outbox
+OUTBOX_DIR = DATA_DIR / "outbox"
+OUTBOX_MAX_ATTEMPTS = 5
+OUTBOX_RETRY_DELAY = 60  # seconds, doubled after each failed attempt
 
 # Scraping settings
 REQUEST_TIMEOUT = 30
 REQUEST_DELAY = 2  # seconds between requests to same domain
 MAX_RETRIES = 3
 USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+SCRAPER_MAX_PAGES = 1  # Listing pages followed per query when a source has pagination
+DEADLINE_GUESS_GRACE_DAYS = 30  # Days a deadline without a year stays open past its date
+ARCHIVE_RESPONSES = os.getenv("ARCHIVE_RESPONSES", "true").lower() == "true"
+HTTP_POOL_HOSTS = 10  # Hosts with a kept-alive connection pool
+HTTP_POOL_SIZE = 4  # Connections kept alive per host
+# Hosts fetched over HTTP/2 when httpx[http2] is installed, e.g. "reliefweb.int"
+HTTP2_HOSTS = {h.strip() for h in os.getenv("HTTP2_HOSTS", "").split(",") if h.strip()}
+RETRY_BUDGET = 30  # Retries shared by all scrapers, refilled at this rate per hour
+CIRCUIT_FAILURE_THRESHOLD = 5  # Consecutive failed requests before a source is skipped
+CIRCUIT_COOLDOWN = 1800  # seconds before an open circuit lets a probe through
+CIRCUIT_MAX_COOLDOWN = 24 * 3600  # Cooldown doubles after each failed probe, up to this
+
+# Query planner: derive search URLs from profile roles and locations
+USE_QUERY_PLANNER = os.getenv("USE_QUERY_PLANNER", "true").lower() == "true"
+QUERY_PLANNER_PROFILES = [
+    Path(p) for p in os.getenv("QUERY_PLANNER_PROFILES", "").split(",") if p.strip()
+] or [CV_PROFILE_FILE]
+QUERY_PLANNER_MAX_QUERIES = 10  # Per source and run, never more than its built-in list
+QUERY_PLANNER_ROTATION_PERIOD = 6 * 3600  # seconds; queries over the cap rotate each period
+QUERY_PLANNER_KEYWORD_SCOPE = "africa"  # Appended to keyword searches
+REGION_COUNTRIES = {
+    "East Africa": ["Ethiopia", "Kenya", "Somalia", "South Sudan", "Uganda", "Tanzania"],
+    "Horn of Africa": ["Ethiopia", "Somalia", "Djibouti", "Eritrea"],
+}
+NON_GEOGRAPHIC_LOCATIONS = {"remote", "home-based", "global"}
+
+# Description store: job descriptions kept as deduplicated paragraphs,
+# compressed with zlib, or zstd (needs zstandard everywhere the store is read)
+DESCRIPTION_STORE = os.getenv("DESCRIPTION_STORE", "true").lower() == "true"
+DESCRIPTION_CODEC = os.getenv("DESCRIPTION_CODEC", "zlib")  # New stores only; pinned in the manifest
+DESCRIPTION_DICT_SIZE = 32 * 1024  # bytes; zlib only uses the last 32 KiB
+DESCRIPTION_DICT_MIN_PARAGRAPHS = 500  # Dictionary is trained once this many are stored
+DESCRIPTION_BOILERPLATE_MIN_JOBS = 5  # Paragraph in this many jobs is left out of skills matching
+
+# Full-text search index, kept in sync whenever jobs are saved
+SEARCH_INDEX = os.getenv("SEARCH_INDEX", "true").lower() == "true"
+SEARCH_RESULTS = 20  # Rows shown by 'search' and 'list <terms>'
+
+# Streaming pipeline settings
+STREAM_QUEUE_SIZE = 50  # Max jobs waiting between two stages
+STREAM_ALERT_HIGH_MATCHES = True  # Email each new high match as soon as it is ready
+
+# Watch daemon polling intervals (seconds)
+WATCH_DEFAULT_INTERVAL = 3600
+WATCH_POLL_INTERVALS = {
+    "reliefweb": 900,  # RSS feeds are cheap to poll
+    "devex": 1800,
+    "unjobs": 1800,
+    "ethiojobs": 3600,
+    "developmentaid": 3600,
+}
+
+# Adaptive per-query polling (seconds)
+ADAPTIVE_POLLING = os.getenv("ADAPTIVE_POLLING", "true").lower() == "true"
+POLL_BASE_INTERVAL = 6 * 3600  # Starting interval, matches the scrape cron
+POLL_MIN_INTERVAL = 900
+POLL_MAX_INTERVAL = 7 * 24 * 3600  # Even dead queries are retried weekly
+POLL_BACKOFF_FACTOR = 1.5  # Interval growth after a fetch with no new jobs
+POLL_DUE_TOLERANCE = 600  # Treat queries due within this window as due now
+POLL_HISTORY_SIZE = 20  # Fetches kept per query
 
 # Matching settings
 SCORE_THRESHOLD_HIGH = 70  # Generate cover letter
@@ -42,6 +127,23 @@ SCORING_WEIGHTS = {
     "donor_match": 0.10,
 }
 
+# Listing pre-filter: skip detail pages for listings estimated to fall below
+# SCORE_THRESHOLD_LOW. "on", "off", or "audit" (the default: fetch everything
+# and log the listings that would have been skipped).
+# A profile can override mode, min_score and ceilings under "prefilter".
+PREFILTER_MODE = os.getenv("PREFILTER_MODE", "audit").lower()
+# Assumed best scores for the components a listing does not show, capped by
+# what the profile can reach. With all at 100 nothing could ever be skipped
+# (no listing estimates below 56), so skills and donor are set to what a
+# strong description realistically scores. A listing with no title match in
+# an untargeted location then estimates 45.5 and is flagged. That is a
+# heuristic: check the audit log before setting PREFILTER_MODE=on.
+PREFILTER_CEILINGS = {
+    "skills": 70,
+    "experience": 100,
+    "donor": 70,
+}
+
 # Location scoring
 LOCATION_SCORES = {
     "ethiopia": 100,
@@ -54,9 +156,18 @@ LOCATION_SCORES = {
     "global": 60,
 }
 
+# Email digest settings
+DIGEST_MAX_JOBS = 10  # Per section: high and good matches
+SENT_LEDGER_RETENTION_DAYS = 180  # Forget sent jobs after this many days
+DIGEST_FRAGMENT_CACHE_SIZE = 4096  # Rendered job cards kept in memory per process
+SENDGRID_MAX_PERSONALIZATIONS = 1000  # Recipients per API call (SendGrid limit)
+SENDGRID_SUBSTITUTION_LIMIT = 10000  # Bytes of substitutions per personalization
+SENDGRID_MAX_REQUEST_BYTES = 20 * 1024 * 1024  # Stay well under the 30MB message cap
+
 # Gemini API settings
 GEMINI_MODEL = "gemini-pro"
 MAX_COVER_LETTERS_PER_RUN = 10
+TEMPLATE_DRAFTS_FOR_GOOD_MATCHES = True  # Local drafts for matches below the LLM threshold
 
 # Salary filtering
 MIN_SALARY_USD = 3000  # Minimum monthly salary in USD
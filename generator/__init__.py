@@ -1,5 +1,18 @@
-"""Cover letter generation package."""
+"""Cover letter generation package, with generators imported on first use."""
 
-from .cover_letter import CoverLetterGenerator
+import importlib
 
-__all__ = ["CoverLetterGenerator"]
+_EXPORTS = {
+    "CoverLetterGenerator": ".cover_letter",
+    "TemplateLetterGenerator": ".template",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
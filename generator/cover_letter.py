@@ -1,14 +1,19 @@
 """Cover letter generator using Google Gemini API."""
 
 import json
+import os
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Iterator, Optional
 
-import google.generativeai as genai
+try:
+    import google.generativeai as genai
+except ImportError:  # Optional dependency, see requirements.txt
+    genai = None
 
 import config
-from scrapers.base import Job
+import metrics
+from scrapers.job import Job
 from matcher.profile import CVProfile
 
 
@@ -19,7 +24,13 @@ class CoverLetterGenerator:
         """Initialize with CV profile."""
         self.profile = profile or CVProfile.load()
         self.model = None
-        if config.GOOGLE_API_KEY:
+        self.unavailable: Optional[str] = None  # Why letters cannot be generated
+        if genai is None:
+            self.unavailable = "google-generativeai is not installed (pip install google-generativeai)"
+            print(f"[CoverLetter] {self.unavailable}")
+        elif not config.GOOGLE_API_KEY:
+            self.unavailable = "No Google API key configured"
+        else:
             genai.configure(api_key=config.GOOGLE_API_KEY)
             self.model = genai.GenerativeModel(config.GEMINI_MODEL)
 
@@ -70,38 +81,53 @@ Do NOT include:
 Start directly with "Dear Hiring Manager," or "Dear [Position] Selection Committee,"
 """
 
+    def generate_stream(self, job: Job, partial: str = "") -> Iterator[str]:
+        """
+        Stream a cover letter for a job, yielding text chunks as they arrive.
+        If partial holds the start of a letter from an interrupted run, the
+        model is asked to continue it instead of starting over.
+        """
+        if not self.model:
+            print(f"[CoverLetter] {self.unavailable}, skipping generation")
+            return
+
+        prompt = self._get_prompt(job)
+        if partial:
+            prompt += f"""
+## Resume
+The letter below was interrupted. Continue it exactly where it stops, without repeating any of it:
+
+{partial}"""
+
+        response = self.model.generate_content(prompt, stream=True)
+        for chunk in response:
+            if chunk.text:
+                yield chunk.text
+
+    @metrics.timed("stage_seconds", stage="cover_letter")
     def generate(self, job: Job) -> Optional[str]:
         """Generate a cover letter for a job."""
         if not self.model:
-            print("[CoverLetter] No Google API key configured, skipping generation")
+            print(f"[CoverLetter] {self.unavailable}, skipping generation")
             return None
 
         try:
-            response = self.model.generate_content(self._get_prompt(job))
-            cover_letter = response.text
-            return cover_letter
+            cover_letter = "".join(self.generate_stream(job))
+            if cover_letter:
+                metrics.inc("jobs_total", stage="cover_letter")
+            return cover_letter or None
 
         except Exception as e:
             print(f"[CoverLetter] Error generating: {e}")
             return None
 
-    def generate_and_save(self, job: Job) -> Optional[Path]:
-        """Generate cover letter and save to file."""
-        cover_letter = self.generate(job)
+    def _partial_path(self, job: Job) -> Path:
+        """Path of the in-progress file for a job, kept across runs."""
+        return self.output_dir / f".{job.id}.md.part"
 
-        if not cover_letter:
-            return None
-
-        # Generate filename
-        safe_title = "".join(c if c.isalnum() or c in " -_" else "" for c in job.title)
-        safe_title = safe_title[:50].strip().replace(" ", "_")
-        timestamp = datetime.now().strftime("%Y%m%d")
-        filename = f"{timestamp}_{safe_title}_{job.id}.md"
-
-        filepath = self.output_dir / filename
-
-        # Write cover letter with metadata
-        content = f"""# Cover Letter: {job.title}
+    def _letter_header(self, job: Job) -> str:
+        """Metadata block written above the letter body."""
+        return f"""# Cover Letter: {job.title}
 
 **Organization:** {job.organization}
 **Location:** {job.location}
@@ -111,15 +137,78 @@ Start directly with "Dear Hiring Manager," or "Dear [Position] Selection Committ
 
 ---
 
-{cover_letter}
+"""
+
+    def _letter_footer(self) -> str:
+        """Review notice written below the letter body."""
+        return """
 
 ---
 *This cover letter was auto-generated. Please review and customize before submitting.*
 """
 
-        with open(filepath, "w") as f:
-            f.write(content)
+    def _letter_path(self, job: Job) -> Path:
+        """Output path for a job's finished letter."""
+        safe_title = "".join(c if c.isalnum() or c in " -_" else "" for c in job.title)
+        safe_title = safe_title[:50].strip().replace(" ", "_")
+        timestamp = datetime.now().strftime("%Y%m%d")
+        return self.output_dir / f"{timestamp}_{safe_title}_{job.id}.md"
+
+    @metrics.timed("stage_seconds", stage="cover_letter")
+    def generate_and_save(
+        self, job: Job, on_chunk: Optional[Callable[[str], None]] = None
+    ) -> Optional[Path]:
+        """
+        Generate cover letter and save to file.
+
+        Chunks are appended to a hidden .part file as they stream in and the
+        file is renamed into place once the letter is complete. If a previous
+        run was interrupted, its partial letter is resumed rather than lost.
+        """
+        if not self.model:
+            print(f"[CoverLetter] {self.unavailable}, skipping generation")
+            return None
+
+        filepath = self._letter_path(job)
+        part_path = self._partial_path(job)
+
+        # Pick up where an interrupted run stopped
+        partial = ""
+        if part_path.exists():
+            _, sep, partial = part_path.read_text().partition("\n---\n\n")
+            if not sep:
+                partial = ""
+            if partial:
+                print(f"[CoverLetter] Resuming partial letter ({len(partial)} chars)")
+
+        if not partial:
+            part_path.write_text(self._letter_header(job))
+        elif on_chunk:
+            on_chunk(partial)
 
+        try:
+            with open(part_path, "a") as f:
+                received = False  # A resumed letter is only finished by new text
+                for chunk in self.generate_stream(job, partial=partial):
+                    f.write(chunk)
+                    f.flush()
+                    received = True
+                    if on_chunk:
+                        on_chunk(chunk)
+
+                if not received:
+                    raise RuntimeError("the model returned no text")
+
+                f.write(self._letter_footer())
+                f.flush()
+                os.fsync(f.fileno())
+
+        except Exception as e:
+            print(f"[CoverLetter] Error generating (partial kept for resume): {e}")
+            return None
+
+        os.replace(part_path, filepath)
+        metrics.inc("jobs_total", stage="cover_letter")
         return filepath
 
     def generate_for_high_matches(
@@ -134,6 +223,11 @@ Start directly with "Dear Hiring Manager," or "Dear [Position] Selection Committ
             if (job.score or 0) < threshold:
                 continue
 
+            # Letters are only rewritten when the job changes, which clears its path
+            if job.cover_letter_path and not job.cover_letter_path.endswith("_draft.md") \
+                    and Path(job.cover_letter_path).exists():
+                continue
+
             if generated_count >= config.MAX_COVER_LETTERS_PER_RUN:
                 print(f"[CoverLetter] Reached max {config.MAX_COVER_LETTERS_PER_RUN} letters per run")
                 break
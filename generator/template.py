@@ -0,0 +1,219 @@
+"""Cover letter drafts rendered locally from the CV profile."""
+
+import os
+import re
+from pathlib import Path
+from typing import Optional
+
+import config
+from scrapers.job import Job
+from matcher.profile import CVProfile
+from .cover_letter import CoverLetterGenerator
+
+
+_PLACEHOLDER = re.compile(r"\[([^\]]+)\]")
+
+
+def load_key_phrases(path: Path) -> list[str]:
+    """Bullets under the "Key Phrases" heading of the cover letter template."""
+    if not path.exists():
+        return []
+    phrases = []
+    in_section = False
+    for line in path.read_text().splitlines():
+        if line.startswith("## "):
+            in_section = line[3:].startswith("Key Phrases")
+        elif in_section and line.startswith("- "):
+            phrases.append(line[2:].strip())
+    return phrases
+
+
+class TemplateLetterGenerator(CoverLetterGenerator):
+    """
+    Assemble cover letter drafts without any API call.
+
+    Follows the structure in templates/cover_letter_base.md and uses its key
+    phrases, filling their placeholders ([sector], [donor], [languages]) from
+    the profile terms found in the job. A phrase is left out when the profile
+    has nothing to fill it with, such as team size or budget, so a draft only
+    states what the profile records. Everything that depends only on the
+    profile is built once up front, so a draft costs a handful of substring
+    checks and one string join.
+    """
+
+    def __init__(self, profile: Optional[CVProfile] = None, template_path: Optional[Path] = None):
+        """Initialize with CV profile."""
+        self.profile = profile or CVProfile.load()
+        self.model = None
+
+        self.output_dir = config.DATA_DIR / "cover_letters"
+        self.output_dir.mkdir(exist_ok=True)
+
+        p = self.profile
+        self._skills = self._lowered(p.skills + p.certifications)
+        self._sectors = self._lowered(p.sectors)
+        self._donors = self._lowered(p.donors_experience)
+
+        # Template phrases: those without placeholders are kept only when
+        # they restate a profile skill, e.g. "Experience in consortium management"
+        skill_terms = [lower for _, lower in self._lowered(p.skills)]
+        self._phrases = []
+        for phrase in load_key_phrases(template_path or config.TEMPLATES_DIR / "cover_letter_base.md"):
+            if _PLACEHOLDER.search(phrase) or any(term in phrase.lower() for term in skill_terms):
+                self._phrases.append(phrase)
+
+        organizations = self._join(p.organizations_worked[:3])
+        self._organizations = f" I have worked with {organizations}." if organizations else ""
+        self._years = f"{p.years_experience} years of experience" if p.years_experience else "my experience"
+        self._default_skills = self._join([d for d, _ in self._skills[:3]])
+        self._closing = (
+            "Thank you for considering my application. I would welcome the opportunity "
+            "to discuss how I can contribute to your team.\n\n"
+            f"Kind regards,\n{p.name}"
+        )
+
+    @staticmethod
+    def _display(term: str) -> str:
+        """
+        In-sentence form of a term: a capitalized first word is lowercased,
+        while acronyms and mixed-case words such as ECHO or EU-funded keep
+        their case.
+        """
+        first, sep, rest = term.partition(" ")
+        if first[:1].isupper() and first[1:].islower():
+            first = first.lower()
+        return f"{first}{sep}{rest}"
+
+    @classmethod
+    def _lowered(cls, terms: list[str]) -> list[tuple[str, str]]:
+        """
+        Pair each term's in-sentence form with its lowercase search form,
+        dropping duplicates.
+        """
+        seen = set()
+        pairs = []
+        for term in terms:
+            lower = term.lower()
+            if lower in seen:
+                continue
+            seen.add(lower)
+            pairs.append((cls._display(term), lower))
+        return pairs
+
+    @staticmethod
+    def _join(items: list[str]) -> str:
+        """Join items as natural-language list."""
+        if len(items) <= 1:
+            return "".join(items)
+        return f"{', '.join(items[:-1])} and {items[-1]}"
+
+    @staticmethod
+    def _matched(pairs: list[tuple[str, str]], text: str, limit: int) -> list[str]:
+        """Return up to limit terms that occur in text."""
+        found = [term for term, lower in pairs if lower in text]
+        return found[:limit]
+
+    def _fill(self, phrase: str, values: dict[str, str]) -> Optional[str]:
+        """A template phrase with its placeholders filled, or None if one has no value."""
+        missing = False
+
+        def value(match: re.Match) -> str:
+            nonlocal missing
+            filled = values.get(match.group(1).lower())
+            missing = missing or not filled
+            return filled or ""
+
+        filled = _PLACEHOLDER.sub(value, phrase)
+        return None if missing else self._display(filled)
+
+    def generate(self, job: Job) -> Optional[str]:
+        """Render a cover letter draft for a job."""
+        text = f"{job.title} {job.description or ''}".lower()
+
+        skills = self._matched(self._skills, text, 4)
+        sectors = self._matched(self._sectors, text, 3)
+        donors = self._matched(self._donors, text, 3)
+
+        # Opening
+        where = f" advertised on {job.source.title()}" if job.source else ""
+        location = f" in {job.location}" if job.location else ""
+        focus = f" in {self._join(sectors)}" if sectors else ""
+        opening = (
+            f"Dear Hiring Manager,\n\n"
+            f"I was excited to see the {job.title} position with {job.organization}"
+            f"{where}. With {self._years}{focus}, I would welcome the chance to "
+            f"contribute to {job.organization}'s work{location}."
+        )
+
+        # Body - relevant experience and skills, from the template's key phrases
+        values = {
+            "sector": self._join(sectors),
+            "donor": self._join(donors),
+            "languages": self._join(self.profile.languages),
+        }
+        background, languages = [], ""
+        for phrase in self._phrases:
+            filled = self._fill(phrase, values)
+            if not filled:
+                continue
+            if "[languages]" in phrase.lower():
+                languages = f" I am {filled}."
+            else:
+                background.append(filled)
+
+        experience = self._organizations.strip()
+        if background:
+            experience = f"{experience} My background includes {self._join(background)}.".strip()
+
+        skill_text = self._join(skills) if skills else self._default_skills
+        value = f"Your requirements closely match my strengths in {skill_text}.{languages}"
+
+        return "\n\n".join(part for part in [opening, experience, value, self._closing] if part)
+
+    def _letter_footer(self) -> str:
+        """Review notice written below the letter body."""
+        return """
+
+---
+*This draft was assembled from a template. Please review and customize before submitting.*
+"""
+
+    def _letter_path(self, job: Job) -> Path:
+        """Drafts get their own name so a later LLM letter replaces them."""
+        path = super()._letter_path(job)
+        return path.with_name(f"{path.stem}_draft.md")
+
+    def generate_and_save(self, job: Job, on_chunk=None) -> Optional[Path]:
+        """Render a cover letter draft and save to file."""
+        cover_letter = self.generate(job)
+
+        filepath = self._letter_path(job)
+        tmp_path = filepath.with_name(f".{filepath.name}.tmp")
+        with open(tmp_path, "w") as f:
+            f.write(self._letter_header(job) + cover_letter + self._letter_footer())
+        os.replace(tmp_path, filepath)
+
+        if on_chunk:
+            on_chunk(cover_letter)
+
+        return filepath
+
+    def generate_for_good_matches(
+        self, jobs: list[Job], low: float = None, high: float = None
+    ) -> list[tuple[Job, Optional[Path]]]:
+        """Render drafts for jobs scoring between the low and high thresholds."""
+        low = low or config.SCORE_THRESHOLD_LOW
+        high = high or config.SCORE_THRESHOLD_HIGH
+        results = []
+
+        for job in jobs:
+            if not low <= (job.score or 0) < high:
+                continue
+            if job.cover_letter_path and Path(job.cover_letter_path).exists():
+                continue
+
+            filepath = self.generate_and_save(job)
+            job.cover_letter_path = str(filepath)
+            results.append((job, filepath))
+
+        return results
@@ -8,127 +8,191 @@ Usage:
     python main.py generate    # Generate cover letters for high matches
     python main.py notify      # Send email digest
     python main.py run         # Run full pipeline
+    python main.py stream      # Run full pipeline, streaming jobs between stages
+    python main.py watch       # Keep polling sources and alert on high matches
     python main.py test-email  # Send test email
+    python main.py send-outbox # Deliver queued SMTP messages
+    python main.py reparse     # Rebuild jobs from archived responses, offline
+    python main.py search      # Full-text search over all jobs
 """
 
 import argparse
-import json
 import sys
 from datetime import datetime
 from pathlib import Path
+from typing import TYPE_CHECKING, Optional
 
 import config
-from scrapers import get_all_scrapers, Job
-from matcher import JobScorer, CVProfile
-from notifier import EmailNotifier
+import metrics
 
+# Each command imports what it uses, so 'list' does not pay for
+# scikit-learn, lxml and sendgrid. See benchmarks/startup.py.
+if TYPE_CHECKING:
+    from pipeline import PipelineContext, SearchIndex
+    from scrapers import Job
 
-def load_jobs() -> list[Job]:
-    """Load jobs from JSON file."""
-    if not config.JOBS_FILE.exists():
-        return []
-
-    with open(config.JOBS_FILE, "r") as f:
-        data = json.load(f)
-
-    return [Job.from_dict(j) for j in data.get("jobs", [])]
-
-
-def save_jobs(jobs: list[Job]):
-    """Save jobs to JSON file."""
-    data = {
-        "jobs": [job.to_dict() for job in jobs],
-        "last_updated": datetime.utcnow().isoformat()
-    }
-
-    with open(config.JOBS_FILE, "w") as f:
-        json.dump(data, f, indent=2)
-
-
-def load_matches() -> list[Job]:
-    """Load matched jobs from JSON file."""
-    if not config.MATCHES_FILE.exists():
-        return []
-
-    with open(config.MATCHES_FILE, "r") as f:
-        data = json.load(f)
-
-    return [Job.from_dict(j) for j in data.get("matches", [])]
-
-
-def save_matches(jobs: list[Job]):
-    """Save matched jobs to JSON file."""
-    data = {
-        "matches": [job.to_dict() for job in jobs],
-        "last_updated": datetime.utcnow().isoformat()
-    }
 
-    with open(config.MATCHES_FILE, "w") as f:
-        json.dump(data, f, indent=2)
-
-
-def cmd_scrape():
+def cmd_scrape(ctx: Optional["PipelineContext"] = None):
     """Scrape jobs from all sources."""
+    from scrapers import get_all_scrapers, get_client
+    from pipeline import PipelineContext, ChangeDetector, PollScheduler, archive_expired, NEW, MODIFIED
+
     print("=" * 60)
     print("SCRAPING JOBS")
     print("=" * 60)
 
+    standalone = ctx is None
+    ctx = ctx or PipelineContext()
+
     # Load existing jobs for deduplication
-    existing_jobs = load_jobs()
+    existing_jobs = ctx.jobs
     existing_ids = {job.id for job in existing_jobs}
 
     all_jobs = []
     scrapers = get_all_scrapers()
 
+    scheduler = None
+    if config.ADAPTIVE_POLLING:
+        scheduler = PollScheduler(existing_ids)
+        scheduler.attach(scrapers)
+
+    try:
+        ctx.scorer.attach_prefilter(scrapers)
+    except FileNotFoundError as e:
+        print(f"[Prefilter] {e}; fetching every listing")
+
     for scraper in scrapers:
         jobs = scraper.run()
         all_jobs.extend(jobs)
 
-    # Deduplicate
+    if scheduler:
+        scheduler.save()
+        scheduler.report()
+    get_client().report()
+
+    # Deduplicate and fold edits and re-posts into the stored jobs
+    detector = ChangeDetector(existing_jobs)
     new_jobs = []
+    modified_jobs = []
     for job in all_jobs:
-        if job.id not in existing_ids:
+        status, stored = detector.apply(job)
+        if status == NEW:
             new_jobs.append(job)
-            existing_ids.add(job.id)
+        elif status == MODIFIED:
+            modified_jobs.append(stored)
 
     print(f"\nTotal jobs scraped: {len(all_jobs)}")
     print(f"New jobs: {len(new_jobs)}")
+    print(f"Modified jobs: {len(modified_jobs)}")
 
     # Merge with existing
     all_jobs = existing_jobs + new_jobs
-    save_jobs(all_jobs)
+    if new_jobs or modified_jobs:
+        ctx.jobs = all_jobs
+
+    # Closed postings leave the working set before anything scores them
+    archive_expired(ctx)
+    if standalone:
+        ctx.commit()
 
-    print(f"Total jobs in database: {len(all_jobs)}")
+    print(f"Total jobs in database: {len(ctx.jobs)}")
     return new_jobs
 
 
-def cmd_match():
+def cmd_reparse(source: Optional[str] = None):
+    """Rebuild jobs by running the current parsers over archived responses."""
+    from scrapers import get_all_scrapers, get_archive
+    from pipeline import PipelineContext, ChangeDetector, NEW, MODIFIED
+
+    print("=" * 60)
+    print("RE-PARSING ARCHIVED RESPONSES")
+    print("=" * 60)
+
+    archive = get_archive()
+    ctx = PipelineContext()
+
+    # Every archived version of each listing page, oldest first, with its
+    # detail pages as fetched at the time
+    reparsed = []
+    for scraper in get_all_scrapers():
+        if source and scraper.name != source:
+            continue
+        scraper.archive = None
+        for query, fetched_at in archive.snapshots(scraper.name):
+            scraper.replay = archive.as_of(fetched_at)
+            scraper.query_overrides = [query]
+            reparsed.extend(scraper.run())
+
+    # Parser fixes show up as modified jobs, which get re-scored by 'match'
+    detector = ChangeDetector(ctx.jobs)
+    new_jobs = []
+    updated = 0
+    for job in reparsed:
+        status, _ = detector.apply(job)
+        if status == NEW:
+            new_jobs.append(job)
+        elif status == MODIFIED:
+            updated += 1
+
+    if new_jobs or updated:
+        ctx.jobs = ctx.jobs + new_jobs
+        ctx.commit()
+
+    print(f"\nRe-parsed: {len(reparsed)} jobs ({len(new_jobs)} new, {updated} updated)")
+    print("Run 'match' to re-score them.")
+    return reparsed
+
+
+def cmd_match(ctx: Optional["PipelineContext"] = None):
     """Score and filter jobs."""
+    from pipeline import PipelineContext
+
     print("=" * 60)
     print("MATCHING JOBS")
     print("=" * 60)
 
-    jobs = load_jobs()
+    standalone = ctx is None
+    ctx = ctx or PipelineContext()
+
+    jobs = ctx.jobs
     if not jobs:
         print("No jobs to match. Run 'scrape' first.")
         return []
 
-    scorer = JobScorer()
-    scored_jobs = scorer.score_jobs(jobs)
+    scorer = ctx.scorer
 
-    # Save all jobs with scores
-    save_jobs(scored_jobs)
+    # Only new and modified jobs need scores, unless the profile changed
+    if ctx.jobs_meta.get("scorer") != scorer.fingerprint:
+        print("Scoring profile changed; re-scoring all jobs")
+        to_score = jobs
+    else:
+        to_score = [job for job in jobs if job.score is None]
+    pending = {job.id for job in jobs if job.score is None}
+
+    scorer.score_jobs(to_score)
+
+    # Keep all jobs with scores
+    ctx.jobs_meta["scorer"] = scorer.fingerprint
+    ctx.jobs = jobs
+
+    # Letters written in earlier runs stay with unchanged jobs
+    letters = {m.id: m.cover_letter_path for m in ctx.matches if m.cover_letter_path}
+    for job in jobs:
+        if not job.cover_letter_path and job.id not in pending and job.id in letters:
+            job.cover_letter_path = letters[job.id]
 
     # Filter matches
-    matches = scorer.filter_matches(scored_jobs)
+    matches = scorer.filter_matches(jobs)
     matches.sort(key=lambda j: j.score or 0, reverse=True)
 
-    save_matches(matches)
+    ctx.matches = matches
+    if standalone:
+        ctx.commit()
 
     high_matches = [j for j in matches if (j.score or 0) >= config.SCORE_THRESHOLD_HIGH]
     good_matches = [j for j in matches if config.SCORE_THRESHOLD_LOW <= (j.score or 0) < config.SCORE_THRESHOLD_HIGH]
 
-    print(f"\nTotal jobs scored: {len(jobs)}")
+    print(f"\nJobs scored: {len(to_score)} of {len(jobs)}")
     print(f"High matches (>={config.SCORE_THRESHOLD_HIGH}%): {len(high_matches)}")
     print(f"Good matches (>={config.SCORE_THRESHOLD_LOW}%): {len(good_matches)}")
 
@@ -140,28 +204,37 @@ def cmd_match():
     return matches
 
 
-def cmd_generate():
+def cmd_generate(ctx: Optional["PipelineContext"] = None):
     """Generate cover letters for high-scoring jobs."""
+    from generator import CoverLetterGenerator, TemplateLetterGenerator
+    from pipeline import PipelineContext
+
     print("=" * 60)
     print("GENERATING COVER LETTERS")
     print("=" * 60)
 
-    try:
-        from generator import CoverLetterGenerator
-    except ImportError:
-        print("Cover letter generation not available. Install google-generativeai.")
-        return []
+    standalone = ctx is None
+    ctx = ctx or PipelineContext()
 
-    matches = load_matches()
+    matches = ctx.matches
     if not matches:
         print("No matches found. Run 'match' first.")
         return []
 
-    generator = CoverLetterGenerator()
+    generator = CoverLetterGenerator(ctx.profile)
     results = generator.generate_for_high_matches(matches)
 
+    # Good matches get a local template draft instead of an API call
+    if config.TEMPLATE_DRAFTS_FOR_GOOD_MATCHES:
+        drafts = TemplateLetterGenerator(generator.profile).generate_for_good_matches(matches)
+        print(f"Template drafts rendered: {len(drafts)}")
+        results.extend(drafts)
+
     # Update matches with cover letter paths
-    save_matches(matches)
+    if results:
+        ctx.matches = matches
+    if standalone:
+        ctx.commit()
 
     generated = [r for r in results if r[1] is not None]
     print(f"\nCover letters generated: {len(generated)}")
@@ -172,18 +245,23 @@ def cmd_generate():
     return results
 
 
-def cmd_notify():
+def cmd_notify(ctx: Optional["PipelineContext"] = None):
     """Send email digest of job matches."""
+    from notifier import get_notifier, DigestRecipient, SMTPNotifier, SentLedger
+    from pipeline import PipelineContext
+
     print("=" * 60)
     print("SENDING EMAIL DIGEST")
     print("=" * 60)
 
-    matches = load_matches()
+    ctx = ctx or PipelineContext()
+
+    matches = ctx.matches
     if not matches:
         print("No matches to notify about.")
         return False
 
-    jobs = load_jobs()
+    jobs = ctx.jobs
 
     high_matches = [j for j in matches if (j.score or 0) >= config.SCORE_THRESHOLD_HIGH]
     good_matches = [j for j in matches if config.SCORE_THRESHOLD_LOW <= (j.score or 0) < config.SCORE_THRESHOLD_HIGH]
@@ -195,10 +273,54 @@ def cmd_notify():
         "cover_letters": len([j for j in matches if j.cover_letter_path]),
     }
 
-    notifier = EmailNotifier()
-    success = notifier.send_digest(high_matches[:10], good_matches[:10], stats)
+    notifier = get_notifier()
+    recipients = [e.strip() for e in config.EMAIL_TO.split(",") if e.strip()]
+    if not recipients:
+        print("[Email] No recipient email configured")
+        return False
 
-    if success:
+    # Only send matches each recipient has not seen; count the rest. The SMTP
+    # outbox records jobs in the ledger on delivery, so queued ones count too
+    ledger = SentLedger()
+    queues = isinstance(notifier, SMTPNotifier)
+    queued = notifier.outbox.queued_jobs() if queues else {}
+    digests = []
+    for email in recipients:
+        new_high, seen_high = ledger.split(email, high_matches, queued.get(email, ()))
+        new_good, seen_good = ledger.split(email, good_matches, queued.get(email, ()))
+        if not new_high and not new_good:
+            print(f"No new matches for {email} since the last digest.")
+            continue
+        digests.append(DigestRecipient(
+            email,
+            new_high[:config.DIGEST_MAX_JOBS],
+            new_good[:config.DIGEST_MAX_JOBS],
+            {**stats, "already_notified": seen_high + seen_good},
+        ))
+
+    if not digests:
+        return True
+
+    if len(digests) > 1:
+        # Several recipients: one batched API call instead of one per person
+        results = notifier.send_batch(digests)
+    else:
+        digest = digests[0]
+        sent = notifier.send_digest(digest.high_matches, digest.good_matches, digest.stats, digest.email)
+        results = {digest.email: None if sent else "Send failed"}
+
+    if not queues:
+        for digest in digests:
+            if results.get(digest.email) is None:
+                ledger.record(digest.email, digest.high_matches + digest.good_matches)
+    ledger.prune()
+    ledger.save()
+
+    success = all(error is None for error in results.values())
+
+    if queues:
+        print("Digest queued. Run 'send-outbox' to deliver." if success else "Failed to queue email.")
+    elif success:
         print("Email sent successfully!")
     else:
         print("Failed to send email.")
@@ -206,28 +328,58 @@ def cmd_notify():
     return success
 
 
+def cmd_send_outbox():
+    """Deliver messages queued in the SMTP outbox."""
+    from notifier import SMTPNotifier
+
+    print("=" * 60)
+    print("DELIVERING OUTBOX")
+    print("=" * 60)
+
+    notifier = SMTPNotifier()
+    if not len(notifier.outbox):
+        print("Outbox is empty.")
+        return 0, 0
+
+    return notifier.drain()
+
+
 def cmd_run():
     """Run the full pipeline."""
+    from pipeline import PipelineContext
+
     print("=" * 60)
     print("JOB HUNTER - FULL PIPELINE")
     print(f"Started at: {datetime.now().isoformat()}")
     print("=" * 60)
 
+    # Stages share jobs, matches and the fitted scorer in memory
+    ctx = PipelineContext()
+
     # Step 1: Scrape
-    new_jobs = cmd_scrape()
+    new_jobs = cmd_scrape(ctx)
     print()
 
+    # Checkpoint: scraped jobs are the expensive part to lose
+    ctx.commit()
+
     # Step 2: Match
-    matches = cmd_match()
+    matches = cmd_match(ctx)
     print()
 
     # Step 3: Generate cover letters
-    results = cmd_generate()
+    results = cmd_generate(ctx)
     print()
 
     # Step 4: Send notification (only if there are matches)
-    if matches:
-        cmd_notify()
+    try:
+        if matches:
+            cmd_notify(ctx)
+            if config.EMAIL_BACKEND == "smtp":
+                cmd_send_outbox()
+    finally:
+        # Single write of scores, matches and letter paths
+        ctx.commit()
 
     print()
     print("=" * 60)
@@ -236,11 +388,68 @@ def cmd_run():
     print("=" * 60)
 
 
+def cmd_stream():
+    """Run the pipeline with jobs streaming from scrapers to alerts."""
+    from scrapers import get_all_scrapers, get_client
+    from pipeline import PipelineContext, PollScheduler, StreamingPipeline, archive_expired
+
+    print("=" * 60)
+    print("JOB HUNTER - STREAMING PIPELINE")
+    print(f"Started at: {datetime.now().isoformat()}")
+    print("=" * 60)
+
+    ctx = PipelineContext()
+    scrapers = get_all_scrapers()
+    scheduler = None
+    if config.ADAPTIVE_POLLING:
+        scheduler = PollScheduler(job.id for job in ctx.jobs)
+        scheduler.attach(scrapers)
+    ctx.scorer.attach_prefilter(scrapers)
+
+    pipeline = StreamingPipeline(ctx, scrapers=scrapers)
+    try:
+        matches = pipeline.run()
+        archive_expired(ctx)
+    finally:
+        ctx.commit()
+        if scheduler:
+            scheduler.save()
+    if scheduler:
+        scheduler.report()
+    get_client().report()
+
+    if config.EMAIL_BACKEND == "smtp" and pipeline.alerts_sent:
+        cmd_send_outbox()
+
+    print()
+    print(f"New jobs: {len(pipeline.new_jobs)}")
+    print(f"New matches: {len(matches)}")
+    print(f"Alerts sent: {pipeline.alerts_sent}")
+    print(f"Finished at: {datetime.now().isoformat()}")
+    return matches
+
+
+def cmd_watch():
+    """Poll sources continuously from a warm process."""
+    from pipeline import WatchDaemon
+
+    print("=" * 60)
+    print("JOB HUNTER - WATCH MODE")
+    print(f"Started at: {datetime.now().isoformat()}")
+    print("=" * 60)
+
+    WatchDaemon().run()
+
+
 def cmd_test_email():
     """Send a test email."""
+    from notifier import get_notifier, SMTPNotifier
+
     print("Sending test email...")
-    notifier = EmailNotifier()
+    notifier = get_notifier()
     success = notifier.send_test_email()
+    if success and isinstance(notifier, SMTPNotifier):
+        success = notifier.drain()[1] == 0
 
     if success:
         print("Test email sent successfully!")
@@ -248,42 +457,83 @@ def cmd_test_email():
         print("Failed to send test email. Check your SENDGRID_API_KEY and EMAIL_TO settings.")
 
 
+def _open_search_index() -> "SearchIndex":
+    """Search index, synced first if the job store changed since it was last updated."""
+    from pipeline import SearchIndex, load_jobs, store_version
+
+    index = SearchIndex()
+    version = store_version()
+    if version != index.version:
+        index.sync(load_jobs(), version)
+    return index
+
+
+def _find_job(search_term: str, ctx: "PipelineContext") -> Optional["Job"]:
+    """Job by match number, job ID, or best full-text hit (matches first)."""
+    matches = ctx.matches
+    match_ids = [job.id for job in matches]
+    if search_term.isdigit() and 0 < int(search_term) <= len(matches):
+        return matches[int(search_term) - 1]
+
+    index = _open_search_index()
+    job_id = search_term if len(search_term.split()) == 1 else None
+    hits = index.search(search_term, ids=match_ids, limit=1) or index.search(search_term, limit=1)
+    if hits:
+        job_id = hits[0]["id"]
+
+    candidates = matches + ctx.jobs
+    job = next((job for job in candidates if job.id == job_id), None)
+    if job is None and not hits:
+        # Substring of the title or organization, as in "country dir"
+        term = search_term.lower()
+        job = next(
+            (job for job in candidates if term in job.title.lower() or term in job.organization.lower()),
+            None,
+        )
+    return job
+
+
+def _generate_letter(job: "Job") -> Optional[Path]:
+    """
+    Stream one job's cover letter to the terminal and save it. The generator
+    (and google-generativeai, when installed) is only imported here, once a
+    letter is due.
+    """
+    from generator import CoverLetterGenerator
+
+    generator = CoverLetterGenerator()
+    # Echo the letter as it streams in so the user sees progress immediately
+    path = generator.generate_and_save(job, on_chunk=lambda c: print(c, end="", flush=True))
+    print()
+    return path
+
+
 def cmd_apply(search_term: str = None):
     """Generate cover letter for a specific job."""
+    from pipeline import PipelineContext
+
     print("=" * 60)
     print("APPLY FOR JOB")
     print("=" * 60)
 
-    matches = load_matches()
-    if not matches:
-        print("No matches found. Run 'match' first.")
-        return None
+    ctx = PipelineContext()
+    matches = ctx.matches
 
     # List jobs if no search term
     if not search_term:
+        if not matches:
+            print("No matches found. Run 'match' first.")
+            return None
         print("\nAvailable matches (use job number or search term):\n")
         for i, job in enumerate(matches[:20], 1):
             salary_info = f" | {job.salary}" if job.salary else ""
             print(f"  {i:2}. [{job.score:.0f}%] {job.title[:50]}")
             print(f"      {job.organization[:40]} - {job.location[:30]}{salary_info}")
             print()
-        print("Usage: python main.py apply <number or search term>")
+        print("Usage: python main.py apply <number, job ID or search term>")
         return None
 
-    # Find job by number or search term
-    job = None
-    try:
-        idx = int(search_term) - 1
-        if 0 <= idx < len(matches):
-            job = matches[idx]
-    except ValueError:
-        # Search by title/org
-        search_lower = search_term.lower()
-        for j in matches:
-            if search_lower in j.title.lower() or search_lower in j.organization.lower():
-                job = j
-                break
-
+    job = _find_job(search_term, ctx)
     if not job:
         print(f"No job found matching '{search_term}'")
         return None
@@ -296,30 +546,53 @@ def cmd_apply(search_term: str = None):
     print(f"  URL: {job.url}")
     print()
 
-    try:
-        from generator import CoverLetterGenerator
-    except ImportError:
-        print("Cover letter generation not available. Install google-generativeai.")
-        return None
-
-    generator = CoverLetterGenerator()
-    path = generator.generate_and_save(job)
-
+    path = _generate_letter(job)
     if path:
         job.cover_letter_path = str(path)
-        save_matches(matches)
+        if any(m is job for m in matches):
+            ctx.matches = matches
+        else:
+            ctx.jobs = ctx.jobs
+        ctx.commit()
         print(f"Cover letter saved to: {path}")
         print(f"\nNext steps:")
         print(f"  1. Review and customize: {path}")
         print(f"  2. Apply at: {job.url}")
     else:
-        print("Failed to generate cover letter. Check ANTHROPIC_API_KEY.")
+        print("Failed to generate cover letter. Check GOOGLE_API_KEY.")
 
     return path
 
 
-def cmd_list():
-    """List all matched jobs."""
+def cmd_search(query: str = "", matches_only: bool = False, **filters):
+    """Search all jobs (or only matches) by text and filters, best first."""
+    from pipeline import load_matches
+
+    index = _open_search_index()
+    ids = [job.id for job in load_matches()] if matches_only else None
+    results = index.search(query, ids=ids, limit=config.SEARCH_RESULTS, **filters)
+    if not results:
+        print(f"No jobs found matching '{query}'")
+        return []
+
+    print(f"\n{'Score':>5}  {'Title':<45}  {'Organization':<25}  {'Deadline':<10}  {'ID':<12}")
+    print("-" * 107)
+    for row in results:
+        score = f"{row['score']:.0f}%" if row["score"] is not None else "-"
+        print(f"{score:>5}  {row['title'][:45]:<45}  {row['organization'][:25]:<25}  "
+              f"{row['deadline_date'] or '':<10}  {row['id']:<12}")
+
+    print(f"\nShowing {len(results)} jobs. Use: python main.py apply <ID>")
+    return results
+
+
+def cmd_list(search_term: str = "", **filters):
+    """List all matched jobs, or the matches a search selects."""
+    from pipeline import load_matches
+
+    if search_term or any(v is not None for v in filters.values()):
+        return cmd_search(search_term, matches_only=True, **filters)
+
     matches = load_matches()
     if not matches:
         print("No matches found. Run 'scrape' and 'match' first.")
@@ -343,16 +616,31 @@ def main():
     )
     parser.add_argument(
         "command",
-        choices=["scrape", "match", "generate", "notify", "run", "test-email", "apply", "list"],
+        choices=["scrape", "match", "generate", "notify", "run", "test-email", "apply", "list", "send-outbox", "stream", "watch", "reparse", "search"],
         help="Command to run"
     )
     parser.add_argument(
         "args",
         nargs="*",
-        help="Additional arguments (e.g., job number for 'apply')"
+        help="Additional arguments (e.g., job number for 'apply', source for 'reparse', terms for 'search')"
     )
+    parser.add_argument("--source", help="'search'/'list': only jobs from this source")
+    parser.add_argument("--location", help="'search'/'list': only jobs whose location contains this")
+    parser.add_argument("--min-score", type=float, help="'search'/'list': minimum score")
+    parser.add_argument("--max-score", type=float, help="'search'/'list': maximum score")
+    parser.add_argument("--closing-after", help="'search'/'list': deadline on or after YYYY-MM-DD")
+    parser.add_argument("--closing-before", help="'search'/'list': deadline on or before YYYY-MM-DD")
 
     args = parser.parse_args()
+    terms = " ".join(args.args)
+    filters = {
+        "source": args.source,
+        "location": args.location,
+        "min_score": args.min_score,
+        "max_score": args.max_score,
+        "closing_after": args.closing_after,
+        "closing_before": args.closing_before,
+    }
 
     commands = {
         "scrape": cmd_scrape,
@@ -361,8 +649,13 @@ def main():
         "notify": cmd_notify,
         "run": cmd_run,
         "test-email": cmd_test_email,
-        "apply": lambda: cmd_apply(args.args[0] if args.args else None),
-        "list": cmd_list,
+        "apply": lambda: cmd_apply(terms or None),
+        "list": lambda: cmd_list(terms, **filters),
+        "send-outbox": cmd_send_outbox,
+        "stream": cmd_stream,
+        "watch": cmd_watch,
+        "reparse": lambda: cmd_reparse(args.args[0] if args.args else None),
+        "search": lambda: cmd_search(terms, **filters),
     }
 
     try:
@@ -370,6 +663,8 @@ def main():
     except Exception as e:
         print(f"Error: {e}")
         sys.exit(1)
+    finally:
+        metrics.write_report(args.command)
 
 
 if __name__ == "__main__":
@@ -1,6 +1,18 @@
-"""Job matching package."""
+"""Job matching package. JobScorer (and scikit-learn) is imported on first use."""
 
-from .scorer import JobScorer
-from .profile import CVProfile
+import importlib
 
-__all__ = ["JobScorer", "CVProfile"]
+_EXPORTS = {
+    "JobScorer": ".scorer",
+    "CVProfile": ".profile",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
@@ -23,6 +23,7 @@ class CVProfile:
     organizations_worked: list[str] = field(default_factory=list)
     donors_experience: list[str] = field(default_factory=list)
     keywords_boost: list[str] = field(default_factory=list)
+    prefilter: dict = field(default_factory=dict)  # mode, min_score, ceilings
 
     @classmethod
     def load(cls, path: Optional[Path] = None) -> "CVProfile":
@@ -47,6 +48,7 @@ class CVProfile:
             organizations_worked=data.get("organizations_worked", []),
             donors_experience=data.get("donors_experience", []),
             keywords_boost=data.get("keywords_boost", []),
+            prefilter=data.get("prefilter", {}),
         )
 
     def get_all_keywords(self) -> list[str]:
@@ -1,15 +1,32 @@
 """Job scoring engine using TF-IDF and keyword matching."""
 
+import hashlib
+import json
+import os
 import re
+from dataclasses import asdict
 from typing import Optional
 
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
-import numpy as np
-
 import config
-from scrapers.base import Job
+import metrics
+from pipeline.descriptions import get_description_store
+from scrapers.job import Job
 from .profile import CVProfile
+from .tfidf import TfidfModel
+
+
+# Salary patterns, compiled once; _extract_salary relies on this order
+_SALARY_PATTERNS = [re.compile(p) for p in (
+    # USD amounts: $5,000, $5000, USD 5000, 5000 USD
+    r'(?:\$|usd)\s*([\d,]+(?:\.\d{2})?)\s*(?:per\s*month|/\s*month|monthly|p\.?m\.?)?',
+    r'([\d,]+(?:\.\d{2})?)\s*(?:usd|dollars?)\s*(?:per\s*month|/\s*month|monthly|p\.?m\.?)?',
+    # EUR amounts (convert roughly)
+    r'(?:€|eur)\s*([\d,]+(?:\.\d{2})?)\s*(?:per\s*month|/\s*month|monthly|p\.?m\.?)?',
+    r'([\d,]+(?:\.\d{2})?)\s*(?:eur|euros?)\s*(?:per\s*month|/\s*month|monthly|p\.?m\.?)?',
+    # Annual salary patterns
+    r'(?:\$|usd)\s*([\d,]+(?:\.\d{2})?)\s*(?:per\s*(?:year|annum)|/\s*(?:year|annum)|annually|p\.?a\.?)',
+    r'([\d,]+(?:\.\d{2})?)\s*(?:usd|dollars?)\s*(?:per\s*(?:year|annum)|/\s*(?:year|annum)|annually|p\.?a\.?)',
+)]
 
 
 class JobScorer:
@@ -18,19 +35,14 @@ class JobScorer:
     def __init__(self, profile: Optional[CVProfile] = None):
         """Initialize scorer with CV profile."""
         self.profile = profile or CVProfile.load()
-        self.vectorizer = TfidfVectorizer(
-            stop_words="english",
-            ngram_range=(1, 2),
-            max_features=5000,
-        )
         self._fit_vectorizer()
 
     def _fit_vectorizer(self):
-        """Fit the TF-IDF vectorizer on profile keywords."""
+        """Fit TF-IDF on profile keywords, or load the cached fit for this profile."""
         profile_text = self.profile.get_skills_text()
         # Fit on profile to establish vocabulary
-        self.vectorizer.fit([profile_text])
-        self.profile_vector = self.vectorizer.transform([profile_text])
+        self.tfidf = TfidfModel.cached(profile_text)
+        self.profile_vector = self.tfidf.transform(profile_text)
 
     def score_job(self, job: Job) -> float:
         """
@@ -45,8 +57,8 @@ class JobScorer:
         # Location match (20%)
         scores["location"] = self._score_location_match(job.location)
 
-        # Skills overlap via TF-IDF (25%)
-        scores["skills"] = self._score_skills_overlap(job.description)
+        # Skills overlap via TF-IDF (25%), without boilerplate paragraphs
+        scores["skills"] = self._score_skills_overlap(get_description_store().body(job))
 
         # Experience fit (15%)
         scores["experience"] = self._score_experience_fit(job)
@@ -66,6 +78,67 @@ class JobScorer:
 
         return round(total_score, 1)
 
+    @property
+    def fingerprint(self) -> str:
+        """Hash of the profile and settings that scores depend on."""
+        data = json.dumps(
+            [
+                asdict(self.profile), config.SCORING_WEIGHTS, config.LOCATION_SCORES,
+                config.DESCRIPTION_STORE and config.DESCRIPTION_BOILERPLATE_MIN_JOBS,
+            ],
+            sort_keys=True,
+        )
+        return hashlib.md5(data.encode()).hexdigest()[:12]
+
+    @property
+    def prefilter_mode(self) -> str:
+        """Pre-filter mode: PREFILTER_MODE from the environment wins over the profile."""
+        if "PREFILTER_MODE" in os.environ:
+            return config.PREFILTER_MODE
+        return self.profile.prefilter.get("mode", config.PREFILTER_MODE)
+
+    def max_reachable_score(self, title: str, location: str, organization: str = "") -> float:
+        """
+        Estimated best score of a job, given only its listing.
+
+        Title and location are scored exactly, and the organization gives a
+        floor for the donor match. The signals the listing lacks (skills,
+        experience and the rest of the donor match, all read from the
+        description) count at their weight times a ceiling: the one from
+        PREFILTER_CEILINGS or the profile, lowered to the most the profile
+        can score (one listed donor reaches 70, none 30).
+        """
+        ceilings = {**config.PREFILTER_CEILINGS, **self.profile.prefilter.get("ceilings", {})}
+        donors = len(self.profile.donors_experience)
+        donor_max = 100 if donors >= 2 else 70 if donors == 1 else 30
+        donor = max(min(ceilings["donor"], donor_max), self._score_donor_match("", organization))
+        skills = min(ceilings["skills"], 100 if self.profile_vector else 30)
+
+        weights = config.SCORING_WEIGHTS
+        total_score = (
+            self._score_title_match(title) * weights["title_match"] +
+            self._score_location_match(location) * weights["location_match"] +
+            skills * weights["skills_overlap"] +
+            ceilings["experience"] * weights["experience_fit"] +
+            donor * weights["donor_match"]
+        )
+
+        return round(total_score, 1)
+
+    def passes_prefilter(self, title: str, location: str, organization: str = "") -> bool:
+        """Whether a listing's estimated best score reaches the pre-filter threshold."""
+        min_score = self.profile.prefilter.get("min_score", config.SCORE_THRESHOLD_LOW)
+        return self.max_reachable_score(title, location, organization) >= min_score
+
+    def attach_prefilter(self, scrapers: list):
+        """Have scrapers skip detail pages for listings that cannot match."""
+        mode = self.prefilter_mode
+        if mode == "off":
+            return
+        for scraper in scrapers:
+            scraper.prefilter = self.passes_prefilter
+            scraper.prefilter_audit = mode == "audit"
+
     def _score_title_match(self, title: str) -> float:
         """Score based on job title matching target roles."""
         title_lower = title.lower()
@@ -123,10 +196,10 @@ class JobScorer:
 
         try:
             # Transform job description
-            job_vector = self.vectorizer.transform([description])
+            job_vector = self.tfidf.transform(description)
 
             # Calculate cosine similarity
-            similarity = cosine_similarity(self.profile_vector, job_vector)[0][0]
+            similarity = TfidfModel.similarity(self.profile_vector, job_vector)
 
             # Scale to 0-100
             return min(100, similarity * 150)  # Boost factor
@@ -189,21 +262,8 @@ class JobScorer:
         """
         text = f"{job.salary or ''} {job.description or ''}".lower()
 
-        # Common salary patterns
-        patterns = [
-            # USD amounts: $5,000, $5000, USD 5000, 5000 USD
-            r'(?:\$|usd)\s*([\d,]+(?:\.\d{2})?)\s*(?:per\s*month|/\s*month|monthly|p\.?m\.?)?',
-            r'([\d,]+(?:\.\d{2})?)\s*(?:usd|dollars?)\s*(?:per\s*month|/\s*month|monthly|p\.?m\.?)?',
-            # EUR amounts (convert roughly)
-            r'(?:€|eur)\s*([\d,]+(?:\.\d{2})?)\s*(?:per\s*month|/\s*month|monthly|p\.?m\.?)?',
-            r'([\d,]+(?:\.\d{2})?)\s*(?:eur|euros?)\s*(?:per\s*month|/\s*month|monthly|p\.?m\.?)?',
-            # Annual salary patterns
-            r'(?:\$|usd)\s*([\d,]+(?:\.\d{2})?)\s*(?:per\s*(?:year|annum)|/\s*(?:year|annum)|annually|p\.?a\.?)',
-            r'([\d,]+(?:\.\d{2})?)\s*(?:usd|dollars?)\s*(?:per\s*(?:year|annum)|/\s*(?:year|annum)|annually|p\.?a\.?)',
-        ]
-
-        for i, pattern in enumerate(patterns):
-            matches = re.findall(pattern, text)
+        for i, pattern in enumerate(_SALARY_PATTERNS):
+            matches = pattern.findall(text)
             for match in matches:
                 try:
                     amount = float(match.replace(',', ''))
@@ -237,8 +297,10 @@ class JobScorer:
 
     def score_jobs(self, jobs: list[Job]) -> list[Job]:
         """Score multiple jobs and add scores to them."""
-        for job in jobs:
-            job.score = self.score_job(job)
+        with metrics.timed("stage_seconds", stage="score"):
+            for job in jobs:
+                job.score = self.score_job(job)
+        metrics.inc("jobs_total", len(jobs), stage="score")
         return jobs
 
     def filter_matches(self, jobs: list[Job], min_score: float = None) -> list[Job]:
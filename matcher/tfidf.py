@@ -0,0 +1,130 @@
+"""TF-IDF model fitted with scikit-learn, cached on disk and applied without it."""
+
+import hashlib
+import json
+import math
+import os
+import pickle
+import re
+from collections import Counter
+from importlib import metadata
+from typing import Optional
+
+import config
+
+# Bump when the cached state or how it is applied changes
+CACHE_VERSION = 1
+
+VECTORIZER_PARAMS = {
+    "stop_words": "english",
+    "ngram_range": (1, 2),
+    "max_features": 5000,
+}
+
+# TfidfVectorizer's default token_pattern
+_TOKEN = re.compile(r"(?u)\b\w\w+\b")
+
+
+def _sklearn_version() -> Optional[str]:
+    """Installed scikit-learn version, read without importing it."""
+    try:
+        return metadata.version("scikit-learn")
+    except metadata.PackageNotFoundError:
+        return None
+
+
+class TfidfModel:
+    """
+    Vocabulary and IDF weights of a fitted TfidfVectorizer.
+
+    transform() repeats the vectorizer's default analysis (lowercase,
+    token pattern, stop words, then n-grams) and L2 normalization in plain
+    Python, so a model loaded from the cache scores jobs without importing
+    scikit-learn, which takes longer than the rest of the scorer's start-up.
+    """
+
+    def __init__(self, vocabulary: dict[str, int], idf: list[float], stop_words: frozenset,
+                 ngram_range: tuple[int, int]):
+        self.vocabulary = vocabulary
+        self.idf = idf
+        self.stop_words = stop_words
+        self.ngram_range = ngram_range
+
+    @classmethod
+    def fit(cls, texts: list[str]) -> "TfidfModel":
+        from sklearn.feature_extraction.text import TfidfVectorizer
+
+        vectorizer = TfidfVectorizer(**VECTORIZER_PARAMS).fit(texts)
+        return cls(
+            vocabulary={term: int(i) for term, i in vectorizer.vocabulary_.items()},
+            idf=vectorizer.idf_.tolist(),
+            stop_words=frozenset(vectorizer.get_stop_words() or ()),
+            ngram_range=tuple(VECTORIZER_PARAMS["ngram_range"]),
+        )
+
+    @classmethod
+    def cached(cls, text: str) -> "TfidfModel":
+        """
+        Model fitted on text, loaded from SCORER_CACHE_DIR when a cached fit
+        of the same text, settings and scikit-learn version (which supplies
+        the stop words) exists, otherwise fitted and cached.
+        """
+        key = json.dumps([CACHE_VERSION, _sklearn_version(), VECTORIZER_PARAMS, text], sort_keys=True)
+        path = config.SCORER_CACHE_DIR / f"tfidf-{hashlib.sha1(key.encode()).hexdigest()[:16]}.pkl"
+
+        model = cls._load(path)
+        if model is None:
+            model = cls.fit([text])
+            model._save(path)
+        return model
+
+    @classmethod
+    def _load(cls, path) -> Optional["TfidfModel"]:
+        if not path.exists():
+            return None
+        try:
+            with open(path, "rb") as f:
+                state = pickle.load(f)
+            return cls(**state)
+        except Exception as e:
+            print(f"[Scorer] Ignoring unreadable cache {path.name}: {e}")
+            return None
+
+    def _save(self, path):
+        config.SCORER_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        for stale in config.SCORER_CACHE_DIR.glob("tfidf-*.pkl"):
+            stale.unlink()
+        state = {
+            "vocabulary": self.vocabulary,
+            "idf": self.idf,
+            "stop_words": self.stop_words,
+            "ngram_range": self.ngram_range,
+        }
+        tmp_path = path.with_name(f".{path.name}.tmp")
+        with open(tmp_path, "wb") as f:
+            pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+
+    def _ngrams(self, text: str) -> list[str]:
+        tokens = [t for t in _TOKEN.findall(text.lower()) if t not in self.stop_words]
+        min_n, max_n = self.ngram_range
+        grams = list(tokens) if min_n == 1 else []
+        for n in range(max(min_n, 2), max_n + 1):
+            grams.extend(" ".join(tokens[i:i + n]) for i in range(len(tokens) - n + 1))
+        return grams
+
+    def transform(self, text: str) -> dict[int, float]:
+        """L2-normalized TF-IDF vector of text, as {term index: weight}."""
+        counts = Counter(self.vocabulary[g] for g in self._ngrams(text) if g in self.vocabulary)
+        weights = {i: count * self.idf[i] for i, count in counts.items()}
+        norm = math.sqrt(sum(w * w for w in weights.values()))
+        if not norm:
+            return {}
+        return {i: w / norm for i, w in weights.items()}
+
+    @staticmethod
+    def similarity(a: dict[int, float], b: dict[int, float]) -> float:
+        """Cosine similarity of two normalized vectors."""
+        if len(a) > len(b):
+            a, b = b, a
+        return sum(w * b.get(i, 0.0) for i, w in a.items())
@@ -0,0 +1,163 @@
+"""
+Run metrics: counters, stage timers and peak memory for one process.
+
+Stages record into a process-wide registry:
+
+    metrics.inc("http_requests_total", source="devex")
+    with metrics.timed("stage_seconds", stage="score"):
+        ...
+
+main.py writes the registry at exit as a JSON report and a Prometheus
+text file (for node_exporter's textfile collector) named after the
+command, e.g. METRICS_DIR/scrape.json and scrape.prom. Every Prometheus
+sample carries a command label, so the files of separate commands can
+be collected side by side.
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import ContextDecorator
+from datetime import datetime
+from typing import Optional
+
+import config
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+PREFIX = "jobhunter_"
+
+Labels = tuple[tuple[str, str], ...]
+
+
+class Registry:
+    """Thread-safe counters and timers, each keyed by name and labels."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.started = time.time()
+        self.counters: dict[tuple[str, Labels], float] = {}
+        self.timers: dict[tuple[str, Labels], list[float]] = {}  # [count, total, max]
+
+    def inc(self, name: str, value: float = 1, **labels):
+        key = (name, tuple(sorted((k, str(v)) for k, v in labels.items())))
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    def observe(self, name: str, seconds: float, **labels):
+        key = (name, tuple(sorted((k, str(v)) for k, v in labels.items())))
+        with self._lock:
+            stats = self.timers.setdefault(key, [0, 0.0, 0.0])
+            stats[0] += 1
+            stats[1] += seconds
+            stats[2] = max(stats[2], seconds)
+
+    def __bool__(self) -> bool:
+        return bool(self.counters or self.timers)
+
+    def report(self, command: Optional[str] = None) -> dict:
+        """Everything recorded so far, as a JSON-serialisable dict."""
+        with self._lock:
+            counters = [
+                {"name": name, "labels": dict(labels), "value": value}
+                for (name, labels), value in sorted(self.counters.items())
+            ]
+            timers = [
+                {"name": name, "labels": dict(labels), "count": count,
+                 "total_seconds": round(total, 4), "max_seconds": round(longest, 4)}
+                for (name, labels), (count, total, longest) in sorted(self.timers.items())
+            ]
+        return {
+            "command": command,
+            "started_at": datetime.utcfromtimestamp(self.started).isoformat(),
+            "duration_seconds": round(time.time() - self.started, 3),
+            "peak_rss_bytes": peak_rss_bytes(),
+            "counters": counters,
+            "timers": timers,
+        }
+
+    def prometheus(self, report: dict) -> str:
+        """A report in the Prometheus text exposition format."""
+        lines = []
+        typed = set()
+        command = {"command": report["command"] or ""}
+
+        def sample(name: str, kind: str, labels: dict, value, suffix: str = ""):
+            if name not in typed:
+                lines.append(f"# TYPE {PREFIX}{name} {kind}")
+                typed.add(name)
+            label_text = ",".join(f'{k}="{v}"' for k, v in {**command, **labels}.items())
+            lines.append(f"{PREFIX}{name}{suffix}{{{label_text}}} {value}")
+
+        for c in report["counters"]:
+            sample(c["name"], "counter", c["labels"], c["value"])
+        for t in report["timers"]:
+            sample(t["name"], "summary", t["labels"], t["total_seconds"], "_sum")
+            sample(t["name"], "summary", t["labels"], t["count"], "_count")
+        for t in report["timers"]:
+            sample(f"{t['name']}_max", "gauge", t["labels"], t["max_seconds"])
+
+        sample("run_duration_seconds", "gauge", {}, report["duration_seconds"])
+        if report["peak_rss_bytes"] is not None:
+            sample("run_peak_rss_bytes", "gauge", {}, report["peak_rss_bytes"])
+        sample("run_finished_timestamp_seconds", "gauge", {}, round(time.time()))
+        return "\n".join(lines) + "\n"
+
+
+class timed(ContextDecorator):
+    """Time a block, or every call of a function, into a timer."""
+
+    def __init__(self, name: str, **labels):
+        self.name = name
+        self.labels = labels
+
+    def _recreate_cm(self):
+        return timed(self.name, **self.labels)  # Fresh start time per decorated call
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        registry.observe(self.name, time.perf_counter() - self._start, **self.labels)
+        return False
+
+
+def peak_rss_bytes() -> Optional[int]:
+    """Peak resident memory of this process so far."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024  # Linux reports KiB
+
+
+def inc(name: str, value: float = 1, **labels):
+    registry.inc(name, value, **labels)
+
+
+def write_report(command: str = "run"):
+    """Write the command's JSON report and Prometheus file, if anything was recorded."""
+    if not registry:
+        return
+    report = registry.report(command)
+    config.METRICS_DIR.mkdir(parents=True, exist_ok=True)
+    for path, text in (
+        (config.METRICS_DIR / f"{command}.json", json.dumps(report, indent=2)),
+        (config.METRICS_DIR / f"{command}.prom", registry.prometheus(report)),
+    ):
+        tmp_path = path.with_name(f".{path.name}.tmp")
+        with open(tmp_path, "w") as f:
+            f.write(text)
+        os.replace(tmp_path, path)
+
+    peak = report["peak_rss_bytes"]
+    memory = f", peak memory {peak / 2**20:.0f} MiB" if peak else ""
+    print(f"[Metrics] {command}: {report['duration_seconds']:.1f}s{memory}; report in {config.METRICS_DIR}")
+
+
+registry = Registry()
@@ -1,5 +1,34 @@
-"""Email notification package."""
+"""Email notification package. The SendGrid client is imported on first use."""
 
-from .email import EmailNotifier
+import importlib
 
-__all__ = ["EmailNotifier"]
+import config
+
+_EXPORTS = {
+    "EmailNotifier": ".email",
+    "DigestRecipient": ".email",
+    "DigestRenderer": ".render",
+    "SentLedger": ".ledger",
+    "SMTPNotifier": ".smtp",
+    "Outbox": ".smtp",
+}
+
+__all__ = list(_EXPORTS) + ["get_notifier"]
+
+
+def __getattr__(name: str):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def get_notifier():
+    """Return the notifier for the configured EMAIL_BACKEND."""
+    from .email import EmailNotifier
+    from .smtp import SMTPNotifier
+
+    if config.EMAIL_BACKEND == "smtp":
+        return SMTPNotifier()
+    return EmailNotifier()
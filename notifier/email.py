@@ -1,14 +1,37 @@
 """Email notification system using SendGrid."""
 
+import hashlib
+import re
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
+from python_http_client.exceptions import HTTPError
 from sendgrid import SendGridAPIClient
-from sendgrid.helpers.mail import Mail, Email, To, Content
+from sendgrid.helpers.mail import (
+    Mail, Email, To, Content, Personalization, Section, Substitution,
+)
 
 import config
-from scrapers.base import Job
+import metrics
+from scrapers.job import Job
+from .render import DigestRenderer
+
+
+EMAIL_PATTERN = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+ERROR_FIELD_PATTERN = re.compile(r"^personalizations\.(\d+)\.")
+DIGEST_TOKEN = "-digest-"
+
+
+@dataclass
+class DigestRecipient:
+    """One recipient of a batched digest, with their own matches."""
+
+    email: str
+    high_matches: list[Job] = field(default_factory=list)
+    good_matches: list[Job] = field(default_factory=list)
+    stats: dict = field(default_factory=dict)
 
 
 class EmailNotifier:
@@ -18,7 +41,10 @@ class EmailNotifier:
         """Initialize SendGrid client."""
         self.client = None
         if config.SENDGRID_API_KEY:
-            self.client = SendGridAPIClient(api_key=config.SENDGRID_API_KEY)
+            self.client = SendGridAPIClient(
+                api_key=config.SENDGRID_API_KEY, host=config.SENDGRID_API_HOST
+            )
+        self.renderer = DigestRenderer(read_cover_letter=self._read_cover_letter)
 
     def _read_cover_letter(self, path: str) -> Optional[str]:
         """Read cover letter content from file."""
@@ -36,67 +62,7 @@ class EmailNotifier:
 
     def _format_job_html(self, job: Job, include_cover_letter: bool = False) -> str:
         """Format a single job for HTML email."""
-        score = job.score or 0
-
-        # Determine badge color
-        if score >= 70:
-            badge = "HIGH MATCH"
-            color = "#22c55e"  # Green
-        elif score >= 50:
-            badge = "GOOD MATCH"
-            color = "#eab308"  # Yellow
-        else:
-            badge = "MATCH"
-            color = "#6b7280"  # Gray
-
-        # Cover letter section - include full content inline
-        cover_letter_html = ""
-        if include_cover_letter and job.cover_letter_path:
-            letter_content = self._read_cover_letter(job.cover_letter_path)
-            if letter_content:
-                # Convert line breaks to HTML
-                letter_html = letter_content.replace('\n\n', '</p><p>').replace('\n', '<br>')
-                cover_letter_html = f'''
-                <div style="margin-top: 16px; padding: 16px; background: #f0fdf4; border-radius: 8px; border-left: 4px solid #22c55e;">
-                    <h4 style="margin: 0 0 12px 0; color: #166534;">📝 Cover Letter Draft</h4>
-                    <div style="font-size: 14px; color: #374151; line-height: 1.6;">
-                        <p>{letter_html}</p>
-                    </div>
-                    <p style="margin: 12px 0 0 0; font-size: 12px; color: #6b7280; font-style: italic;">
-                        ⚠️ Review and customize before submitting
-                    </p>
-                </div>
-                '''
-
-        # Salary info
-        salary_html = f' | 💰 {job.salary}' if job.salary else ''
-
-        return f"""
-        <div style="border: 1px solid #e5e7eb; border-radius: 8px; padding: 16px; margin-bottom: 16px; background: #fff;">
-            <div style="display: flex; justify-content: space-between; align-items: start; margin-bottom: 8px;">
-                <span style="background: {color}; color: white; padding: 4px 8px; border-radius: 4px; font-size: 12px; font-weight: bold;">
-                    {badge} ({score:.0f}%)
-                </span>
-            </div>
-            <h3 style="margin: 8px 0; color: #1f2937;">
-                <a href="{job.url}" style="color: #1f2937; text-decoration: none;">{job.title}</a>
-            </h3>
-            <p style="margin: 4px 0; color: #4b5563;">
-                <strong>{job.organization}</strong>
-            </p>
-            <p style="margin: 4px 0; color: #6b7280; font-size: 14px;">
-                📍 {job.location or 'Location not specified'}
-                {f' | ⏰ Deadline: {job.deadline}' if job.deadline else ''}
-                {salary_html}
-            </p>
-            <div style="margin-top: 12px;">
-                <a href="{job.url}" style="background: #3b82f6; color: white; padding: 8px 16px; border-radius: 4px; text-decoration: none; font-size: 14px;">
-                    View Job & Apply
-                </a>
-            </div>
-            {cover_letter_html}
-        </div>
-        """
+        return self.renderer.render_job(job, include_cover_letter)
 
     def _build_digest_html(
         self,
@@ -105,69 +71,14 @@ class EmailNotifier:
         stats: dict
     ) -> str:
         """Build the full HTML email digest."""
-        date_str = datetime.now().strftime("%B %d, %Y")
-
-        # High matches section
-        high_matches_html = ""
-        if high_matches:
-            high_matches_html = f"""
-            <h2 style="color: #22c55e; border-bottom: 2px solid #22c55e; padding-bottom: 8px;">
-                🟢 High Matches - Cover Letters Ready ({len(high_matches)})
-            </h2>
-            {''.join(self._format_job_html(job, include_cover_letter=True) for job in high_matches)}
-            """
-
-        # Good matches section
-        good_matches_html = ""
-        if good_matches:
-            good_matches_html = f"""
-            <h2 style="color: #eab308; border-bottom: 2px solid #eab308; padding-bottom: 8px; margin-top: 24px;">
-                🟡 Good Matches ({len(good_matches)})
-            </h2>
-            {''.join(self._format_job_html(job) for job in good_matches)}
-            """
-
-        # Stats section
-        stats_html = f"""
-        <div style="background: #f3f4f6; border-radius: 8px; padding: 16px; margin-top: 24px;">
-            <h3 style="margin: 0 0 12px 0; color: #374151;">📊 Stats</h3>
-            <ul style="margin: 0; padding-left: 20px; color: #4b5563;">
-                <li>Jobs scanned: {stats.get('total_scanned', 0)}</li>
-                <li>High matches: {stats.get('high_matches', 0)}</li>
-                <li>Good matches: {stats.get('good_matches', 0)}</li>
-                <li>Cover letters generated: {stats.get('cover_letters', 0)}</li>
-            </ul>
-        </div>
-        """
+        return self.renderer.render_digest(high_matches, good_matches, stats)
 
-        return f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <meta charset="utf-8">
-            <meta name="viewport" content="width=device-width, initial-scale=1.0">
-        </head>
-        <body style="font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; background: #f9fafb; padding: 20px; margin: 0;">
-            <div style="max-width: 600px; margin: 0 auto; background: white; border-radius: 12px; overflow: hidden; box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
-                <div style="background: linear-gradient(135deg, #3b82f6, #1d4ed8); padding: 24px; color: white;">
-                    <h1 style="margin: 0; font-size: 24px;">🎯 Job Match Digest</h1>
-                    <p style="margin: 8px 0 0 0; opacity: 0.9;">{date_str}</p>
-                </div>
-                <div style="padding: 24px;">
-                    {high_matches_html if high_matches_html else '<p style="color: #6b7280;">No high matches today.</p>'}
-                    {good_matches_html}
-                    {stats_html}
-                    <hr style="border: none; border-top: 1px solid #e5e7eb; margin: 24px 0;">
-                    <p style="color: #9ca3af; font-size: 12px; text-align: center;">
-                        This digest was automatically generated by Job Hunter.
-                        <br>Manage your preferences in the repository settings.
-                    </p>
-                </div>
-            </div>
-        </body>
-        </html>
-        """
+    def _digest_subject(self, high_matches: list[Job], good_matches: list[Job]) -> str:
+        """Subject line for a digest."""
+        total_matches = len(high_matches) + len(good_matches)
+        return f"🎯 {total_matches} New Job Matches - {datetime.now().strftime('%b %d, %Y')}"
 
+    @metrics.timed("stage_seconds", stage="digest")
     def send_digest(
         self,
         high_matches: list[Job],
@@ -185,9 +96,7 @@ class EmailNotifier:
             print("[Email] No recipient email configured")
             return False
 
-        total_matches = len(high_matches) + len(good_matches)
-        subject = f"🎯 {total_matches} New Job Matches - {datetime.now().strftime('%b %d, %Y')}"
-
+        subject = self._digest_subject(high_matches, good_matches)
         html_content = self._build_digest_html(high_matches, good_matches, stats)
 
         message = Mail(
@@ -200,11 +109,150 @@ class EmailNotifier:
         try:
             response = self.client.send(message)
             print(f"[Email] Sent successfully (status: {response.status_code})")
-            return response.status_code in [200, 201, 202]
+            sent = response.status_code in [200, 201, 202]
+            if sent:
+                metrics.inc("jobs_total", len(high_matches) + len(good_matches), stage="digest")
+            return sent
         except Exception as e:
             print(f"[Email] Error sending: {e}")
             return False
 
+    def send_batch(self, recipients: list[DigestRecipient]) -> dict[str, Optional[str]]:
+        """
+        Send each recipient their own digest in as few API calls as possible.
+
+        Recipients are packed into messages of up to
+        SENDGRID_MAX_PERSONALIZATIONS personalizations. Job cards are shared
+        between recipients as SendGrid sections, so each personalization only
+        carries its own headings plus section tags as a substitution.
+
+        Returns a mapping of recipient email to None when the message was
+        accepted, or to an error message when it was not.
+        """
+        if not self.client:
+            print("[Email] No SendGrid API key configured")
+            return {r.email: "No SendGrid API key configured" for r in recipients}
+
+        results: dict[str, Optional[str]] = {}
+        batch: list[tuple[DigestRecipient, str]] = []
+        sections: dict[str, str] = {}
+        batch_bytes = 0
+
+        for recipient in recipients:
+            if not EMAIL_PATTERN.match(recipient.email):
+                results[recipient.email] = "Invalid email address"
+                continue
+
+            new_sections: dict[str, str] = {}
+            body = self._batch_body(recipient, sections, new_sections)
+
+            # Too large to be a substitution: fall back to a message of its own
+            if len(body.encode()) > config.SENDGRID_SUBSTITUTION_LIMIT:
+                ok = self.send_digest(
+                    recipient.high_matches, recipient.good_matches, recipient.stats, recipient.email
+                )
+                results[recipient.email] = None if ok else "Send failed"
+                continue
+
+            added = len(body.encode()) + sum(len(v.encode()) for v in new_sections.values())
+            if batch and (
+                len(batch) >= config.SENDGRID_MAX_PERSONALIZATIONS
+                or batch_bytes + added > config.SENDGRID_MAX_REQUEST_BYTES
+            ):
+                results.update(self._send_batch_message(batch, sections))
+                batch, sections, batch_bytes = [], {}, 0
+                new_sections = {}
+                body = self._batch_body(recipient, sections, new_sections)
+                added = len(body.encode()) + sum(len(v.encode()) for v in new_sections.values())
+
+            sections.update(new_sections)
+            batch.append((recipient, body))
+            batch_bytes += added
+
+        if batch:
+            results.update(self._send_batch_message(batch, sections))
+
+        delivered = sum(1 for error in results.values() if error is None)
+        print(f"[Email] Batch accepted for {delivered}/{len(recipients)} recipients")
+        for email, error in results.items():
+            if error:
+                print(f"[Email] Failed for {email}: {error}")
+
+        return results
+
+    def _batch_body(
+        self, recipient: DigestRecipient, sections: dict[str, str], new_sections: dict[str, str]
+    ) -> str:
+        """Render a recipient's digest with job cards replaced by section tags."""
+        def section_tag(job: Job, include_cover_letter: bool) -> str:
+            fragment = self.renderer.render_job(job, include_cover_letter)
+            tag = f"-job_{hashlib.md5(fragment.encode()).hexdigest()[:12]}-"
+            if tag not in sections:
+                new_sections[tag] = fragment
+            return tag
+
+        return self.renderer.render_digest(
+            recipient.high_matches, recipient.good_matches, recipient.stats, render_job=section_tag
+        )
+
+    def _send_batch_message(
+        self, batch: list[tuple[DigestRecipient, str]], sections: dict[str, str]
+    ) -> dict[str, Optional[str]]:
+        """Send one multi-personalization message and report per recipient."""
+        message = Mail(
+            from_email=Email(config.EMAIL_FROM, "Job Hunter"),
+            subject="Job Match Digest",
+            html_content=Content("text/html", DIGEST_TOKEN),
+        )
+        for tag, fragment in sections.items():
+            message.add_section(Section(tag, fragment))
+
+        for i, (recipient, body) in enumerate(batch):
+            personalization = Personalization()
+            personalization.add_to(To(recipient.email))
+            personalization.subject = self._digest_subject(
+                recipient.high_matches, recipient.good_matches
+            )
+            personalization.add_substitution(Substitution(DIGEST_TOKEN, body))
+            message.add_personalization(personalization, index=i)
+
+        try:
+            response = self.client.send(message)
+            print(f"[Email] Batch of {len(batch)} sent (status: {response.status_code})")
+            if response.status_code in [200, 201, 202]:
+                return {recipient.email: None for recipient, _ in batch}
+            error = f"Unexpected status {response.status_code}"
+            return {recipient.email: error for recipient, _ in batch}
+
+        except HTTPError as e:
+            rejected = self._rejected_personalizations(e)
+            if not rejected or len(rejected) >= len(batch):
+                error = f"HTTP {e.status_code}: {e.reason}"
+                return {recipient.email: error for recipient, _ in batch}
+
+            # Drop the rejected recipients and resend the rest once
+            results = {batch[i][0].email: reason for i, reason in rejected.items()}
+            remaining = [item for i, item in enumerate(batch) if i not in rejected]
+            results.update(self._send_batch_message(remaining, sections))
+            return results
+
+        except Exception as e:
+            return {recipient.email: str(e) for recipient, _ in batch}
+
+    def _rejected_personalizations(self, error: HTTPError) -> dict[int, str]:
+        """Map personalization index to message from a 400 error response."""
+        try:
+            errors = error.to_dict.get("errors", [])
+        except Exception:
+            return {}
+
+        rejected = {}
+        for item in errors:
+            match = ERROR_FIELD_PATTERN.match(item.get("field") or "")
+            if match:
+                rejected[int(match.group(1))] = item.get("message", "Rejected")
+        return rejected
+
     def send_test_email(self, to_email: Optional[str] = None) -> bool:
         """Send a test email to verify configuration."""
         test_job = Job(
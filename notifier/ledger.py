@@ -0,0 +1,82 @@
+"""Ledger of job matches already sent to each recipient."""
+
+import json
+import os
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Iterable, Optional
+
+import config
+from scrapers.job import Job
+
+
+class SentLedger:
+    """
+    Persistent index of job IDs each recipient has been notified about.
+
+    Stored as {recipient: {job_id: sent_date}}, so membership checks are
+    dictionary lookups and a digest only needs to render unseen matches.
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        """Load the ledger from disk."""
+        self.path = path or config.SENT_LEDGER_FILE
+        self._index: dict[str, dict[str, str]] = {}
+        self._dirty = False
+
+        if self.path.exists():
+            with open(self.path, "r") as f:
+                self._index = json.load(f).get("recipients", {})
+
+    def seen(self, recipient: str, job_id: str) -> bool:
+        """Whether a job was already sent to a recipient."""
+        return job_id in self._index.get(recipient, {})
+
+    def split(self, recipient: str, jobs: list[Job],
+              pending: Iterable[str] = ()) -> tuple[list[Job], int]:
+        """
+        Return the jobs not yet sent to a recipient and the count of the rest.
+        Job IDs in pending (queued but not yet delivered) count as sent.
+        """
+        sent = self._index.get(recipient, {})
+        pending = set(pending)
+        unseen = [job for job in jobs if job.id not in sent and job.id not in pending]
+        return unseen, len(jobs) - len(unseen)
+
+    def record(self, recipient: str, jobs: list[Job]):
+        """Mark jobs as sent to a recipient."""
+        self.record_ids(recipient, [job.id for job in jobs])
+
+    def record_ids(self, recipient: str, job_ids: list[str]):
+        """Mark job IDs as sent to a recipient."""
+        if not job_ids:
+            return
+        today = datetime.utcnow().date().isoformat()
+        sent = self._index.setdefault(recipient, {})
+        for job_id in job_ids:
+            sent.setdefault(job_id, today)
+        self._dirty = True
+
+    def prune(self, max_age_days: int = None):
+        """Forget entries older than the retention window."""
+        max_age_days = max_age_days or config.SENT_LEDGER_RETENTION_DAYS
+        cutoff = (datetime.utcnow().date() - timedelta(days=max_age_days)).isoformat()
+        for recipient, sent in self._index.items():
+            stale = [job_id for job_id, date in sent.items() if date < cutoff]
+            for job_id in stale:
+                del sent[job_id]
+            self._dirty = self._dirty or bool(stale)
+
+    def save(self):
+        """Write the ledger to disk if it changed."""
+        if not self._dirty:
+            return
+        data = {
+            "recipients": self._index,
+            "last_updated": datetime.utcnow().isoformat(),
+        }
+        tmp_path = self.path.with_name(f".{self.path.name}.tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(data, f, indent=2)
+        os.replace(tmp_path, self.path)
+        self._dirty = False
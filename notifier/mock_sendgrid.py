@@ -0,0 +1,123 @@
+"""Local stand-in for the SendGrid v3 mail/send endpoint.
+
+Usage:
+    python -m notifier.mock_sendgrid [port]
+
+Then point the notifier at it with SENDGRID_API_HOST=http://127.0.0.1:<port>
+and any non-empty SENDGRID_API_KEY.
+"""
+
+import json
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+import config
+
+
+class MockSendGridServer:
+    """
+    Record mail/send requests and expand them into delivered messages.
+
+    Enforces the personalization count and substitution size limits, and
+    rejects addresses listed in reject with a SendGrid-style 400 response
+    so per-recipient failure handling can be exercised.
+    """
+
+    def __init__(self, port: int = 0, reject: Optional[set[str]] = None):
+        self.reject = set(reject or ())
+        self.requests: list[dict] = []
+        self.delivered: list[dict] = []
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                body = json.loads(self.rfile.read(length) or b"{}")
+                status, payload = server.handle(self.path, body)
+                data = json.dumps(payload).encode() if payload else b""
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", port), Handler)
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def handle(self, path: str, body: dict) -> tuple[int, Optional[dict]]:
+        """Validate a request and record what each recipient would receive."""
+        if not path.endswith("/v3/mail/send"):
+            return 404, {"errors": [{"message": "Not found", "field": None}]}
+
+        self.requests.append(body)
+        personalizations = body.get("personalizations") or []
+
+        errors = []
+        if not personalizations:
+            errors.append({"message": "At least one personalization is required", "field": "personalizations"})
+        if len(personalizations) > config.SENDGRID_MAX_PERSONALIZATIONS:
+            errors.append({"message": "Too many personalizations", "field": "personalizations"})
+
+        for i, personalization in enumerate(personalizations):
+            substitutions = personalization.get("substitutions") or {}
+            size = sum(len(k.encode()) + len(v.encode()) for k, v in substitutions.items())
+            if size > config.SENDGRID_SUBSTITUTION_LIMIT:
+                errors.append({"message": "Substitutions too large", "field": f"personalizations.{i}.substitutions"})
+            for j, to in enumerate(personalization.get("to") or []):
+                if to.get("email") in self.reject:
+                    errors.append({"message": "Rejected recipient", "field": f"personalizations.{i}.to.{j}.email"})
+
+        if errors:
+            return 400, {"errors": errors}
+
+        html = next((c["value"] for c in body.get("content", []) if c.get("type") == "text/html"), "")
+        sections = body.get("sections") or {}
+        for personalization in personalizations:
+            text = html
+            for key, value in (personalization.get("substitutions") or {}).items():
+                text = text.replace(key, value)
+            for key, value in sections.items():
+                text = text.replace(key, value)
+            for to in personalization.get("to") or []:
+                self.delivered.append({
+                    "to": to.get("email"),
+                    "subject": personalization.get("subject") or body.get("subject"),
+                    "html": text,
+                })
+
+        return 202, None
+
+    def start(self) -> "MockSendGridServer":
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self) -> "MockSendGridServer":
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+if __name__ == "__main__":
+    mock = MockSendGridServer(port=int(sys.argv[1]) if len(sys.argv) > 1 else 8025)
+    print(f"Mock SendGrid listening on {mock.url}")
+    try:
+        mock.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
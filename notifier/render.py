@@ -0,0 +1,209 @@
+"""Precompiled rendering of the HTML email digest."""
+
+import html
+import re
+from collections import OrderedDict
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, Optional, Union
+
+import config
+from scrapers.job import Job
+
+
+BLOCK_PATTERN = re.compile(
+    r"<!-- BEGIN (\w+) -->(.*?)<!-- END \1 -->", re.DOTALL
+)
+FIELD_PATTERN = re.compile(r"\{\{(\w+)\}\}")
+COMMENT_PATTERN = re.compile(r"<!--.*?-->", re.DOTALL)
+
+Value = Union[str, Iterable[str]]
+
+
+class CompiledTemplate:
+    """
+    A template split once into literal text and {{FIELD}} slots.
+
+    Rendering is a single pass over a tuple, with no parsing or regex work.
+    Indentation and comments are stripped at compile time, which also keeps
+    the email payload small.
+    """
+
+    def __init__(self, source: str):
+        source = COMMENT_PATTERN.sub("", source)
+        source = "\n".join(line.strip() for line in source.splitlines() if line.strip())
+
+        parts = []
+        pos = 0
+        for match in FIELD_PATTERN.finditer(source):
+            parts.append((False, source[pos:match.start()]))
+            parts.append((True, match.group(1)))
+            pos = match.end()
+        parts.append((False, source[pos:]))
+        self.parts = tuple((is_field, text) for is_field, text in parts if text)
+
+    def render(self, values: dict[str, str]) -> str:
+        """Render with plain string values."""
+        return "".join(values.get(text, "") if is_field else text for is_field, text in self.parts)
+
+    def iter_render(self, values: dict[str, Value]) -> Iterator[str]:
+        """Render lazily; values may be strings or iterables of strings."""
+        for is_field, text in self.parts:
+            if not is_field:
+                yield text
+                continue
+            value = values.get(text, "")
+            if isinstance(value, str):
+                yield value
+            else:
+                yield from value
+
+
+@lru_cache(maxsize=None)
+def load_template(path: Path) -> dict[str, CompiledTemplate]:
+    """Compile a template file and its named blocks, once per process."""
+    source = path.read_text()
+
+    templates = {}
+    for match in BLOCK_PATTERN.finditer(source):
+        templates[match.group(1)] = CompiledTemplate(match.group(2))
+    templates["document"] = CompiledTemplate(BLOCK_PATTERN.sub("", source))
+
+    return templates
+
+
+class DigestRenderer:
+    """Render the job digest from templates/email_digest.html."""
+
+    def __init__(
+        self,
+        read_cover_letter: Optional[Callable[[str], Optional[str]]] = None,
+        template_path: Optional[Path] = None,
+        cache_size: int = None,
+    ):
+        """Compile the template and set up the per-job fragment cache."""
+        self.templates = load_template(template_path or config.TEMPLATES_DIR / "email_digest.html")
+        self.read_cover_letter = read_cover_letter or (lambda path: None)
+        self.cache_size = cache_size or config.DIGEST_FRAGMENT_CACHE_SIZE
+        self._fragments: OrderedDict[tuple, str] = OrderedDict()
+
+    def _fragment_key(self, job: Job, include_cover_letter: bool) -> tuple:
+        """Cache key covering every job field shown in the fragment."""
+        return (
+            job.id, job.title, job.organization, job.location, job.url,
+            job.deadline, job.salary, round(job.score or 0),
+            job.cover_letter_path if include_cover_letter else None,
+        )
+
+    def render_job(self, job: Job, include_cover_letter: bool = False) -> str:
+        """Render a single job card, reusing a cached fragment when possible."""
+        key = self._fragment_key(job, include_cover_letter)
+        fragment = self._fragments.get(key)
+        if fragment is not None:
+            self._fragments.move_to_end(key)
+            return fragment
+
+        fragment = self._render_job(job, include_cover_letter)
+
+        self._fragments[key] = fragment
+        if len(self._fragments) > self.cache_size:
+            self._fragments.popitem(last=False)
+
+        return fragment
+
+    def _render_job(self, job: Job, include_cover_letter: bool) -> str:
+        """Render a job card without the cache."""
+        score = job.score or 0
+
+        # Determine badge color
+        if score >= config.SCORE_THRESHOLD_HIGH:
+            badge, color = "HIGH MATCH", "#22c55e"  # Green
+        elif score >= config.SCORE_THRESHOLD_LOW:
+            badge, color = "GOOD MATCH", "#eab308"  # Yellow
+        else:
+            badge, color = "MATCH", "#6b7280"  # Gray
+
+        # Cover letter section - include full content inline
+        cover_letter_html = ""
+        if include_cover_letter and job.cover_letter_path:
+            letter_content = self.read_cover_letter(job.cover_letter_path)
+            if letter_content:
+                # Convert line breaks to HTML
+                letter_html = html.escape(letter_content).replace("\n\n", "</p><p>").replace("\n", "<br>")
+                cover_letter_html = self.templates["cover_letter"].render({"LETTER": letter_html})
+
+        esc = html.escape
+        return self.templates["job"].render({
+            "COLOR": color,
+            "BADGE": badge,
+            "SCORE": f"{score:.0f}",
+            "URL": esc(job.url),
+            "TITLE": esc(job.title),
+            "ORGANIZATION": esc(job.organization),
+            "LOCATION": esc(job.location or "Location not specified"),
+            "DEADLINE": f" | ⏰ Deadline: {esc(job.deadline)}" if job.deadline else "",
+            "SALARY": f" | 💰 {esc(job.salary)}" if job.salary else "",
+            "COVER_LETTER": cover_letter_html,
+        })
+
+    def _section(
+        self, name: str, jobs: list[Job], render_job: Callable[[Job, bool], str]
+    ) -> Iterator[str]:
+        """Stream a section heading followed by its job cards."""
+        yield from self.templates[name].iter_render({
+            "COUNT": str(len(jobs)),
+            "JOBS": (render_job(job, True) for job in jobs),
+        })
+
+    def iter_digest(
+        self,
+        high_matches: list[Job],
+        good_matches: list[Job],
+        stats: dict,
+        render_job: Optional[Callable[[Job, bool], str]] = None,
+    ) -> Iterator[str]:
+        """
+        Stream the full digest document chunk by chunk.
+        render_job replaces the job card renderer, e.g. to emit placeholders.
+        """
+        render_job = render_job or self.render_job
+
+        if high_matches:
+            high = self._section("high_section", high_matches, render_job)
+        else:
+            high = self.templates["no_high_section"].render({})
+
+        good = self._section("good_section", good_matches, render_job) if good_matches else ""
+
+        # Matches sent in earlier digests are only counted, not rendered again
+        earlier_count = stats.get("already_notified", 0)
+        earlier = (
+            self.templates["earlier_section"].render({"COUNT": str(earlier_count)})
+            if earlier_count else ""
+        )
+
+        stats_html = self.templates["stats"].render({
+            "TOTAL_SCANNED": str(stats.get("total_scanned", 0)),
+            "HIGH_COUNT": str(stats.get("high_matches", 0)),
+            "GOOD_COUNT": str(stats.get("good_matches", 0)),
+            "COVER_LETTERS": str(stats.get("cover_letters", 0)),
+        })
+
+        yield from self.templates["document"].iter_render({
+            "DATE": datetime.now().strftime("%B %d, %Y"),
+            "HIGH_MATCHES": high,
+            "GOOD_MATCHES": good,
+            "EARLIER": earlier,
+            "STATS": stats_html,
+        })
+
+    def render_digest(
+        self,
+        high_matches: list[Job],
+        good_matches: list[Job],
+        stats: dict,
+        render_job: Optional[Callable[[Job, bool], str]] = None,
+    ) -> str:
+        """Render the full digest document."""
+        return "".join(self.iter_digest(high_matches, good_matches, stats, render_job))
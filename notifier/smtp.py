@@ -0,0 +1,322 @@
+"""SMTP delivery backend with an on-disk outbox queue."""
+
+import asyncio
+import json
+import os
+import queue
+import smtplib
+import threading
+import time
+import uuid
+from email import message_from_bytes, policy
+from email.message import EmailMessage
+from email.utils import formataddr, make_msgid
+from pathlib import Path
+from typing import Optional
+
+import config
+import metrics
+from scrapers.job import Job
+from .email import EmailNotifier, DigestRecipient
+from .ledger import SentLedger
+from .render import DigestRenderer
+
+
+class Outbox:
+    """
+    Directory of queued messages, one .eml file each.
+
+    Delivery state lives in a .json sidecar next to each message, along
+    with the recipient and job IDs it carries, so the sent ledger is only
+    updated once the message is delivered. Messages that keep failing are
+    moved to a dead/ subdirectory after OUTBOX_MAX_ATTEMPTS so they stop
+    blocking the queue.
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = path or config.OUTBOX_DIR
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.dead_path = self.path / "dead"
+
+    def put(self, message: EmailMessage, recipient: Optional[str] = None,
+            job_ids: Optional[list[str]] = None) -> Path:
+        """Queue a message, writing it atomically."""
+        name = f"{time.strftime('%Y%m%d%H%M%S')}_{uuid.uuid4().hex[:8]}.eml"
+        path = self.path / name
+        if recipient and job_ids:
+            self._write_state(path, {
+                "attempts": 0, "next_attempt": 0, "recipient": recipient, "job_ids": job_ids,
+            })
+        tmp_path = self.path / f".{name}.tmp"
+        tmp_path.write_bytes(message.as_bytes())
+        os.replace(tmp_path, path)
+        return path
+
+    def _state_path(self, path: Path) -> Path:
+        return path.with_suffix(".json")
+
+    def _state(self, path: Path) -> dict:
+        state_path = self._state_path(path)
+        if not state_path.exists():
+            return {"attempts": 0, "next_attempt": 0}
+        with open(state_path, "r") as f:
+            return json.load(f)
+
+    def _write_state(self, path: Path, state: dict):
+        state_path = self._state_path(path)
+        tmp_path = state_path.with_name(f".{state_path.name}.tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(state, f, indent=2)
+        os.replace(tmp_path, state_path)
+
+    def due(self) -> list[Path]:
+        """Queued messages whose next attempt is due, oldest first."""
+        now = time.time()
+        return [
+            path for path in sorted(self.path.glob("*.eml"))
+            if self._state(path)["next_attempt"] <= now
+        ]
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self.path.glob("*.eml"))
+
+    def queued_jobs(self) -> dict[str, set[str]]:
+        """Job IDs in messages still waiting for delivery, by recipient."""
+        queued: dict[str, set[str]] = {}
+        for path in self.path.glob("*.eml"):
+            state = self._state(path)
+            if state.get("recipient"):
+                queued.setdefault(state["recipient"], set()).update(state.get("job_ids", []))
+        return queued
+
+    def done(self, path: Path) -> dict:
+        """Remove a delivered message; returns its delivery state."""
+        state = self._state(path)
+        path.unlink(missing_ok=True)
+        self._state_path(path).unlink(missing_ok=True)
+        return state
+
+    def failed(self, path: Path, error: str):
+        """Record a failed attempt and schedule the next one with backoff."""
+        state = self._state(path)
+        state["attempts"] += 1
+        state["last_error"] = error
+        state["next_attempt"] = time.time() + config.OUTBOX_RETRY_DELAY * 2 ** (state["attempts"] - 1)
+
+        if state["attempts"] >= config.OUTBOX_MAX_ATTEMPTS:
+            self.dead_path.mkdir(exist_ok=True)
+            os.replace(path, self.dead_path / path.name)
+            self._state_path(path).unlink(missing_ok=True)
+            path = self.dead_path / path.name
+
+        self._write_state(path, state)
+
+
+class SMTPConnectionPool:
+    """A small pool of persistent, authenticated SMTP connections."""
+
+    def __init__(self, size: int = None):
+        self.size = size or config.SMTP_POOL_SIZE
+        self._idle: queue.LifoQueue = queue.LifoQueue()
+        self._created = 0
+        self._lock = threading.Lock()
+
+    def _connect(self) -> smtplib.SMTP:
+        conn = smtplib.SMTP(config.SMTP_HOST, config.SMTP_PORT, timeout=config.REQUEST_TIMEOUT)
+        if config.SMTP_STARTTLS:
+            conn.starttls()
+        if config.SMTP_USER:
+            conn.login(config.SMTP_USER, config.SMTP_PASSWORD)
+        return conn
+
+    def acquire(self) -> smtplib.SMTP:
+        """
+        Take an idle connection, opening one if the pool is not full, or wait
+        up to REQUEST_TIMEOUT for one to be released.
+        """
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                can_open = self._created < self.size
+                if can_open:
+                    self._created += 1
+            if can_open:
+                try:
+                    return self._connect()
+                except Exception:
+                    with self._lock:
+                        self._created -= 1
+                    raise
+            try:
+                conn = self._idle.get(timeout=config.REQUEST_TIMEOUT)
+            except queue.Empty:
+                raise TimeoutError("no SMTP connection became free") from None
+
+        # Reconnect if the server dropped an idle connection
+        try:
+            if conn.noop()[0] == 250:
+                return conn
+        except (smtplib.SMTPException, OSError):
+            pass
+        self._close(conn)
+        try:
+            return self._connect()
+        except Exception:
+            with self._lock:
+                self._created -= 1
+            raise
+
+    def release(self, conn: smtplib.SMTP, broken: bool = False):
+        """Return a connection to the pool, or replace it if broken."""
+        if broken:
+            self._close(conn)
+            with self._lock:
+                self._created -= 1
+        else:
+            self._idle.put(conn)
+
+    def _close(self, conn: smtplib.SMTP):
+        try:
+            conn.quit()
+        except Exception:
+            conn.close()
+
+    def close(self):
+        """Close all idle connections."""
+        while True:
+            try:
+                self._close(self._idle.get_nowait())
+                with self._lock:
+                    self._created -= 1
+            except queue.Empty:
+                break
+
+
+class SMTPNotifier(EmailNotifier):
+    """
+    Queue digests in the outbox and deliver them over SMTP.
+
+    send_digest and send_batch only write to the outbox, so they return as
+    soon as the message is on disk. drain() delivers queued messages over
+    pooled connections, concurrently and with retries, and records
+    delivered jobs in the sent ledger.
+    """
+
+    def __init__(self, outbox: Optional[Outbox] = None):
+        """Initialize outbox and connection pool."""
+        self.client = None
+        self.outbox = outbox if outbox is not None else Outbox()
+        self.pool = SMTPConnectionPool()
+        self.renderer = DigestRenderer(read_cover_letter=self._read_cover_letter)
+
+    def _build_message(self, to_email: str, subject: str, html_content: str) -> EmailMessage:
+        message = EmailMessage()
+        message["From"] = formataddr(("Job Hunter", config.EMAIL_FROM))
+        message["To"] = to_email
+        message["Subject"] = subject
+        message["Message-ID"] = make_msgid(domain=config.EMAIL_FROM.split("@")[-1])
+        message.set_content("Your job match digest is best viewed in an HTML email client.")
+        message.add_alternative(html_content, subtype="html")
+        return message
+
+    @metrics.timed("stage_seconds", stage="digest")
+    def send_digest(
+        self,
+        high_matches: list[Job],
+        good_matches: list[Job],
+        stats: dict,
+        to_email: Optional[str] = None
+    ) -> bool:
+        """Queue the job digest email for delivery."""
+        to_email = to_email or config.EMAIL_TO
+        if not to_email:
+            print("[Email] No recipient email configured")
+            return False
+
+        message = self._build_message(
+            to_email,
+            self._digest_subject(high_matches, good_matches),
+            self._build_digest_html(high_matches, good_matches, stats),
+        )
+        job_ids = [job.id for job in high_matches + good_matches]
+        path = self.outbox.put(message, to_email, job_ids)
+        print(f"[Email] Queued digest for {to_email} ({path.name})")
+        metrics.inc("jobs_total", len(high_matches) + len(good_matches), stage="digest")
+        return True
+
+    def send_batch(self, recipients: list[DigestRecipient]) -> dict[str, Optional[str]]:
+        """Queue one digest per recipient."""
+        results = {}
+        for recipient in recipients:
+            ok = self.send_digest(
+                recipient.high_matches, recipient.good_matches, recipient.stats, recipient.email
+            )
+            results[recipient.email] = None if ok else "Could not queue message"
+        return results
+
+    def _deliver(self, path: Path) -> Optional[str]:
+        """Send one queued message; returns an error message on failure."""
+        message = message_from_bytes(path.read_bytes(), policy=policy.default)
+
+        error = "Not attempted"
+        for attempt in range(config.MAX_RETRIES):
+            conn = None
+            try:
+                conn = self.pool.acquire()
+                conn.send_message(message)
+                self.pool.release(conn)
+                return None
+            except (smtplib.SMTPServerDisconnected, smtplib.SMTPConnectError, OSError) as e:
+                # Transient: drop the connection and retry on a fresh one
+                if conn is not None:
+                    self.pool.release(conn, broken=True)
+                error = str(e) or e.__class__.__name__
+                time.sleep(min(2 ** attempt, 10))
+            except smtplib.SMTPException as e:
+                if conn is not None:
+                    self.pool.release(conn)
+                return str(e)
+
+        return error
+
+    async def drain_async(self, concurrency: int = None) -> tuple[int, int]:
+        """Deliver all due messages; returns (sent, failed) counts."""
+        concurrency = concurrency or config.SMTP_POOL_SIZE
+        pending: asyncio.Queue = asyncio.Queue()
+        for path in self.outbox.due():
+            pending.put_nowait(path)
+
+        counts = {"sent": 0, "failed": 0}
+        ledger = SentLedger()
+
+        async def worker():
+            while True:
+                try:
+                    path = pending.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                error = await asyncio.to_thread(self._deliver, path)
+                if error is None:
+                    state = self.outbox.done(path)
+                    if state.get("recipient"):
+                        ledger.record_ids(state["recipient"], state.get("job_ids", []))
+                    counts["sent"] += 1
+                else:
+                    self.outbox.failed(path, error)
+                    counts["failed"] += 1
+                    print(f"[Email] Delivery failed for {path.name}: {error}")
+
+        try:
+            await asyncio.gather(*(worker() for _ in range(concurrency)))
+        finally:
+            self.pool.close()
+            ledger.save()
+
+        return counts["sent"], counts["failed"]
+
+    def drain(self, concurrency: int = None) -> tuple[int, int]:
+        """Deliver all due messages from the outbox."""
+        sent, failed = asyncio.run(self.drain_async(concurrency))
+        print(f"[Email] Outbox drained: {sent} sent, {failed} failed, {len(self.outbox)} queued")
+        return sent, failed
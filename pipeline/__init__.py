@@ -0,0 +1,39 @@
+"""
+Pipeline state and persistence package.
+
+Names are imported from their submodules on first access: reading the
+job store does not load the scorer, scrapers or notifier.
+"""
+
+import importlib
+
+_EXPORTS = {
+    "DescriptionStore": ".descriptions",
+    "get_description_store": ".descriptions",
+    "load_jobs": ".store",
+    "save_jobs": ".store",
+    "load_matches": ".store",
+    "save_matches": ".store",
+    "store_version": ".store",
+    "DeadlineIndex": ".expiry",
+    "archive_expired": ".expiry",
+    "SearchIndex": ".search",
+    "PipelineContext": ".context",
+    "ChangeDetector": ".changes",
+    "NEW": ".changes",
+    "UNCHANGED": ".changes",
+    "MODIFIED": ".changes",
+    "PollScheduler": ".polling",
+    "StreamingPipeline": ".streaming",
+    "WatchDaemon": ".watch",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
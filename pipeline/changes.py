@@ -0,0 +1,80 @@
+"""Classify scraped jobs as new, unchanged or modified by content fingerprint."""
+
+from typing import Optional
+
+from scrapers.job import Job
+
+NEW = "new"
+UNCHANGED = "unchanged"
+MODIFIED = "modified"
+
+# Fields copied onto the stored job when a posting is edited or re-posted
+CONTENT_FIELDS = (
+    "title", "organization", "location", "description", "url", "posted_date",
+    "deadline", "deadline_date", "salary", "job_type", "experience_required",
+)
+
+
+class ChangeDetector:
+    """
+    Match scraped jobs to stored ones by ID, or by organization and
+    description when a posting comes back under a new title or URL.
+
+    A match with the same content hash is unchanged. One with a different
+    hash is modified: the stored job takes the new content, keeps its ID,
+    and loses its score and letter so only it is re-scored and re-drafted.
+
+    A scraped job with no description keeps the stored one: an empty
+    description means the detail page could not be fetched, not that the
+    posting was emptied.
+    """
+
+    def __init__(self, jobs: list[Job]):
+        self.by_id: dict[str, Job] = {}
+        self.by_repost: dict[str, Job] = {}
+        for job in jobs:
+            self._index(job)
+
+    def _index(self, job: Job):
+        if not job.content_hash:
+            job.content_hash = job.compute_content_hash()
+        self.by_id[job.id] = job
+        key = job.repost_key()
+        if key:
+            self.by_repost.setdefault(key, job)
+
+    def classify(self, job: Job) -> tuple[str, Optional[Job]]:
+        """Status of a scraped job and the stored job it matches, if any."""
+        job.content_hash = job.compute_content_hash()
+        existing = self.by_id.get(job.id)
+        if existing is None:
+            key = job.repost_key()
+            existing = self.by_repost.get(key) if key else None
+
+        if existing is None:
+            return NEW, None
+        if not job.description and existing.description:
+            job.description = existing.description
+            job.content_hash = job.compute_content_hash()
+        if existing.content_hash == job.content_hash:
+            return UNCHANGED, existing
+        return MODIFIED, existing
+
+    def apply(self, job: Job) -> tuple[str, Job]:
+        """Classify a scraped job and fold it into the stored jobs."""
+        status, existing = self.classify(job)
+        if status == NEW:
+            self._index(job)
+            return status, job
+
+        if status == MODIFIED:
+            for name in CONTENT_FIELDS:
+                setattr(existing, name, getattr(job, name))
+            existing.content_hash = job.content_hash
+            existing.score = None
+            existing.cover_letter_path = None
+            self._index(existing)
+        else:
+            existing.url = job.url  # A re-post may have moved
+
+        return status, existing
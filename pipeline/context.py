@@ -0,0 +1,138 @@
+"""In-memory state shared between pipeline stages."""
+
+import sqlite3
+from typing import TYPE_CHECKING, Optional
+
+import config
+from scrapers.job import Job
+from .expiry import DeadlineIndex
+from .search import SearchIndex
+from .store import _shard_name, read_jobs, save_jobs, load_matches, save_matches, store_version
+
+if TYPE_CHECKING:
+    from matcher import JobScorer, CVProfile
+
+
+class PipelineContext:
+    """
+    Jobs, matches and scorer passed between pipeline stages in memory.
+
+    Each dataset is loaded from disk at most once, on first access. Stages
+    modify the context instead of rewriting the job shards and matches.json,
+    and commit() writes only what changed: jobs are compared with their
+    state when loaded, so only the shards holding added, changed or removed
+    jobs are serialised.
+    """
+
+    def __init__(self):
+        self._jobs: Optional[list[Job]] = None
+        self._jobs_meta: dict = {}
+        self._saved: Optional[dict[str, tuple]] = None  # Job id -> (shard, state) when loaded
+        self._deadlines: Optional[DeadlineIndex] = None
+        self._matches: Optional[list[Job]] = None
+        self._profile: Optional["CVProfile"] = None
+        self._scorer: Optional["JobScorer"] = None
+        self.jobs_dirty = False
+        self.matches_dirty = False
+
+    def load(self):
+        """Load jobs and matches now rather than on first access."""
+        if self._jobs is None:
+            self._read_jobs()
+        if self._matches is None:
+            self._matches = load_matches()
+
+    @property
+    def jobs(self) -> list[Job]:
+        """All jobs, loaded from the job shards on first access."""
+        if self._jobs is None:
+            self._read_jobs()
+        return self._jobs
+
+    @jobs.setter
+    def jobs(self, jobs: list[Job]):
+        self._jobs = jobs
+        self._deadlines = None
+        self.jobs_dirty = True
+
+    @property
+    def deadlines(self) -> DeadlineIndex:
+        """Jobs sorted by deadline, rebuilt after jobs is re-assigned."""
+        if self._deadlines is None:
+            self._deadlines = DeadlineIndex(self.jobs)
+        return self._deadlines
+
+    @property
+    def jobs_meta(self) -> dict:
+        """Metadata stored with the jobs; mark changes by re-assigning jobs."""
+        if self._jobs is None:
+            self._read_jobs()
+        return self._jobs_meta
+
+    @property
+    def matches(self) -> list[Job]:
+        """Matched jobs, loaded from matches.json on first access."""
+        if self._matches is None:
+            self._matches = load_matches()
+        return self._matches
+
+    @matches.setter
+    def matches(self, matches: list[Job]):
+        self._matches = matches
+        self.matches_dirty = True
+
+    @property
+    def profile(self) -> "CVProfile":
+        """The CV profile, loaded once."""
+        if self._profile is None:
+            from matcher import CVProfile
+
+            self._profile = CVProfile.load()
+        return self._profile
+
+    @property
+    def scorer(self) -> "JobScorer":
+        """A scorer fitted on the profile, built once and reused."""
+        if self._scorer is None:
+            from matcher import JobScorer
+
+            self._scorer = JobScorer(self.profile)
+        return self._scorer
+
+    def _read_jobs(self):
+        self._jobs, self._jobs_meta = read_jobs()
+        self._snapshot()
+
+    def _snapshot(self):
+        self._saved = {job.id: (_shard_name(job), job.state()) for job in self._jobs}
+
+    def _dirty_shards(self) -> Optional[set[str]]:
+        """Shards with jobs added, changed or removed since load, or None if jobs were never loaded."""
+        if self._saved is None:
+            return None
+        dirty = set()
+        for job in self._jobs:
+            name = _shard_name(job)
+            saved = self._saved.get(job.id)
+            if saved != (name, job.state()):
+                dirty.add(name)
+                if saved:
+                    dirty.add(saved[0])
+        ids = {job.id for job in self._jobs}
+        dirty.update(name for job_id, (name, _) in self._saved.items() if job_id not in ids)
+        return dirty
+
+    def commit(self):
+        """Write changed jobs and matches to disk, and bring the search index up to date."""
+        if self.jobs_dirty:
+            save_jobs(self._jobs, self._jobs_meta, self._dirty_shards())
+            self._snapshot()
+            self.jobs_dirty = False
+            if config.SEARCH_INDEX:
+                try:
+                    SearchIndex().sync(self._jobs, store_version())
+                except sqlite3.Error as e:
+                    print(f"[Search] Index not updated: {e}")
+        if self.matches_dirty:
+            save_matches(self._matches)
+            self.matches_dirty = False
@@ -0,0 +1,241 @@
+"""Deduplicated, compressed storage of job descriptions."""
+
+import hashlib
+import json
+import os
+import sys
+import threading
+import zlib
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, Optional
+
+import config
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+def paragraph_hash(paragraph: str) -> str:
+    return hashlib.sha1(paragraph.encode()).hexdigest()[:16]
+
+
+class StoredDescription:
+    """Loader for a description kept in the store as a list of paragraph hashes."""
+
+    __slots__ = ("store", "refs")
+
+    def __init__(self, store: "DescriptionStore", refs: list[str]):
+        self.store = store
+        self.refs = refs
+
+    def __call__(self) -> str:
+        return self.store.text(self.refs)
+
+
+class DescriptionStore:
+    """
+    Job descriptions split into lines, with each unique paragraph stored once.
+
+    Jobs keep a list of paragraph hashes instead of the text, which is
+    rebuilt on first access. Paragraphs live in segments listed in the
+    manifest, each a JSON object compressed with a shared dictionary. The
+    codec (zlib, or zstd if DESCRIPTION_CODEC asks for it) is fixed in the
+    manifest when the store is created, so every machine writes the same
+    one. New paragraphs go to the current day's segment, so a save only
+    rewrites that day's few paragraphs, and older segments never change:
+    git can't delta-compress a compressed file that keeps growing.
+
+    The dictionary is trained once, when DESCRIPTION_DICT_MIN_PARAGRAPHS
+    paragraphs are stored, and never replaced, so older segments stay
+    readable. A paragraph shared by DESCRIPTION_BOILERPLATE_MIN_JOBS jobs
+    or more counts as boilerplate, such as an agency disclaimer. Counts
+    grow with the store, and a job's skills score is not recomputed when
+    one of its paragraphs later becomes boilerplate; only a scoring
+    settings change re-scores every job.
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = path or config.DESCRIPTION_STORE_DIR
+        self.manifest_path = self.path / "manifest.json"
+        self.paragraphs: dict[str, str] = {}
+        self.ref_counts: Counter = Counter()
+        self._manifest: dict = {"segments": {}, "dictionaries": {}}
+        self._members: dict[str, list[str]] = {}  # Segment -> paragraph hashes
+        self._new: list[str] = []
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    def _load(self):
+        with self._lock:
+            if self._loaded:
+                return
+            if self.manifest_path.exists():
+                with open(self.manifest_path, "r") as f:
+                    self._manifest = json.load(f)
+            for name, segment in self._manifest["segments"].items():
+                data = (self.path / segment["file"]).read_bytes()
+                dictionary = self._dictionary(segment["codec"]) if segment["dictionary"] else None
+                paragraphs = json.loads(_decompress(data, segment["codec"], dictionary))
+                self.paragraphs.update(paragraphs)
+                self._members[name] = list(paragraphs)
+            self._loaded = True
+
+    def _dictionary(self, codec: str) -> Optional[bytes]:
+        entry = self._manifest["dictionaries"].get(codec)
+        return (self.path / entry["file"]).read_bytes() if entry else None
+
+    def text(self, refs: Iterable[str], skip_boilerplate: bool = False) -> str:
+        """Rebuild a description from its paragraph hashes."""
+        if not self._loaded:
+            self._load()
+        if skip_boilerplate:
+            refs = [h for h in refs if not self.is_boilerplate(h)]
+        return "\n".join(self.paragraphs[h] for h in refs)
+
+    def is_boilerplate(self, ref: str) -> bool:
+        return self.ref_counts[ref] >= config.DESCRIPTION_BOILERPLATE_MIN_JOBS
+
+    def body(self, job) -> str:
+        """
+        A job's description without boilerplate paragraphs, the same whether
+        the job was just scraped or loaded from the store.
+        """
+        source = job.description_loader
+        if isinstance(source, StoredDescription) and source.store is self:
+            return self.text(source.refs, skip_boilerplate=True)
+        paragraphs = (job.description or "").split("\n")
+        return "\n".join(p for p in paragraphs if not self.is_boilerplate(paragraph_hash(p)))
+
+    def loader(self, refs: list[str]) -> StoredDescription:
+        """Description loader for a job stored with these paragraph hashes."""
+        return StoredDescription(self, [sys.intern(h) for h in refs])
+
+    def refs(self, job) -> list[str]:
+        """Paragraph hashes for a job's description, adding unseen paragraphs."""
+        source = job.description_loader
+        if isinstance(source, StoredDescription) and source.store is self:
+            return source.refs  # Unchanged since load; skip re-reading the text
+
+        if not self._loaded:
+            self._load()
+        refs = []
+        for paragraph in (job.description or "").split("\n"):
+            h = paragraph_hash(paragraph)
+            if h not in self.paragraphs:
+                self.paragraphs[h] = paragraph
+                self._new.append(h)
+            refs.append(h)
+        return refs
+
+    def recount(self, all_refs: Iterable[list[str]]):
+        """Reset boilerplate counts to the given jobs' paragraphs."""
+        self.ref_counts = Counter(h for refs in all_refs for h in set(refs))
+
+    def save(self):
+        """Write paragraphs added since the last save to today's segment."""
+        if not self._new:
+            return
+        self.path.mkdir(parents=True, exist_ok=True)
+        codec = self._codec()
+        dictionaries = self._manifest["dictionaries"]
+        if codec not in dictionaries and len(self.paragraphs) >= config.DESCRIPTION_DICT_MIN_PARAGRAPHS:
+            self._train(codec)
+
+        name = datetime.utcnow().strftime("%Y-%m-%d")
+        members = self._members.setdefault(name, [])
+        members.extend(self._new)
+        data = json.dumps({h: self.paragraphs[h] for h in members}).encode()
+        dictionary = self._dictionary(codec)
+        segment = {
+            "file": f"{name}.json.{codec}",
+            "codec": codec,
+            "dictionary": dictionary is not None,
+            "paragraphs": len(members),
+        }
+
+        old = self._manifest["segments"].get(name)
+        _write_atomic(self.path / segment["file"], _compress(data, codec, dictionary))
+        if old and old["file"] != segment["file"]:
+            (self.path / old["file"]).unlink(missing_ok=True)
+        self._manifest["segments"][name] = segment
+        _write_atomic(self.manifest_path, json.dumps(self._manifest, indent=2).encode())
+        print(f"[Descriptions] Stored {len(self._new)} new paragraphs ({len(self.paragraphs)} total)")
+        self._new = []
+
+    def _codec(self) -> str:
+        """The store's codec, pinned in the manifest by its first save."""
+        codec = self._manifest.get("codec")
+        if codec is None:
+            # Stores from before the codec was pinned keep their newest segment's
+            segments = sorted(self._manifest["segments"].items())
+            codec = segments[-1][1]["codec"] if segments else config.DESCRIPTION_CODEC
+            if codec not in ("zlib", "zstd"):
+                raise ValueError(f"unknown DESCRIPTION_CODEC: {codec}")
+            self._manifest["codec"] = codec
+        if codec == "zstd" and zstandard is None:
+            raise RuntimeError("this description store uses zstd; install the zstandard package")
+        return codec
+
+    def _train(self, codec: str):
+        """Build the compression dictionary from the paragraphs stored so far."""
+        if codec == "zstd":
+            samples = [p.encode() for p in self.paragraphs.values() if p]
+            try:
+                dictionary = zstandard.train_dictionary(config.DESCRIPTION_DICT_SIZE, samples).as_bytes()
+            except zstandard.ZstdError as e:
+                print(f"[Descriptions] Could not train dictionary: {e}")
+                return
+        else:
+            # zlib looks back at most 32 KiB, and matches nearer the end are
+            # cheaper, so the most shared paragraphs go last
+            common = sorted(self.paragraphs, key=lambda h: self.ref_counts[h])
+            dictionary = "\n".join(self.paragraphs[h] for h in common).encode()[-32768:]
+
+        filename = f"dictionary.{codec}"
+        _write_atomic(self.path / filename, dictionary)
+        self._manifest["dictionaries"][codec] = {
+            "file": filename,
+            "sha1": hashlib.sha1(dictionary).hexdigest(),
+        }
+
+
+def _compress(data: bytes, codec: str, dictionary: Optional[bytes]) -> bytes:
+    if codec == "zstd":
+        dict_data = zstandard.ZstdCompressionDict(dictionary) if dictionary else None
+        return zstandard.ZstdCompressor(level=19, dict_data=dict_data).compress(data)
+    compressor = zlib.compressobj(9, zdict=dictionary) if dictionary else zlib.compressobj(9)
+    return compressor.compress(data) + compressor.flush()
+
+
+def _decompress(data: bytes, codec: str, dictionary: Optional[bytes]) -> bytes:
+    if codec == "zstd":
+        if zstandard is None:
+            raise RuntimeError("this description store uses zstd; install the zstandard package")
+        dict_data = zstandard.ZstdCompressionDict(dictionary) if dictionary else None
+        return zstandard.ZstdDecompressor(dict_data=dict_data).decompress(data)
+    decompressor = zlib.decompressobj(zdict=dictionary) if dictionary else zlib.decompressobj()
+    return decompressor.decompress(data) + decompressor.flush()
+
+
+def _write_atomic(path: Path, data: bytes):
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+_store: Optional[DescriptionStore] = None
+_store_lock = threading.Lock()
+
+
+def get_description_store() -> DescriptionStore:
+    """Process-wide description store."""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = DescriptionStore()
+        return _store
@@ -0,0 +1,85 @@
+"""Deadline index and archival of closed postings."""
+
+import json
+from bisect import bisect_left, insort
+from datetime import date, timedelta
+from typing import Iterable, Optional
+
+import config
+from scrapers.job import Job, is_exact_deadline, parse_deadline
+
+
+class DeadlineIndex:
+    """Job IDs sorted by deadline, so closed postings are found with one bisect."""
+
+    def __init__(self, jobs: Iterable[Job] = ()):
+        self._entries: list[tuple[str, str]] = sorted(
+            (job.deadline_date, job.id) for job in jobs if job.deadline_date
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(self, job: Job):
+        if job.deadline_date:
+            insort(self._entries, (job.deadline_date, job.id))
+
+    def remove(self, job: Job):
+        entry = (job.deadline_date, job.id)
+        i = bisect_left(self._entries, entry)
+        if i < len(self._entries) and self._entries[i] == entry:
+            del self._entries[i]
+
+    def closed_before(self, day: str) -> list[str]:
+        """IDs of jobs whose deadline is before an ISO date."""
+        return [job_id for _, job_id in self._entries[:bisect_left(self._entries, (day,))]]
+
+    def closing_between(self, start: str, end: str) -> list[str]:
+        """IDs of jobs with a deadline from start up to and including end."""
+        lo = bisect_left(self._entries, (start,))
+        hi = bisect_left(self._entries, (end, "\uffff"))
+        return [job_id for _, job_id in self._entries[lo:hi]]
+
+
+def archive_expired(ctx, today: Optional[date] = None) -> list[Job]:
+    """
+    Move jobs past their deadline from the working set to the cold archive.
+
+    Deadlines are re-read first, as of the day each job was scraped, so
+    stored jobs get a deadline_date if they have none and dates misread by
+    an older parser are corrected. A deadline without a year is only a
+    guess, so it gets DEADLINE_GUESS_GRACE_DAYS before the job is archived.
+    Archived jobs are appended to JOBS_ARCHIVE_FILE, one JSON object per
+    line, and dropped from jobs and matches.
+    """
+    reparsed = False
+    for job in ctx.jobs:
+        if job.deadline:
+            deadline_date = parse_deadline(job.deadline, date.fromisoformat(job.scraped_at[:10]))
+            if deadline_date != job.deadline_date:
+                job.deadline_date = deadline_date
+                reparsed = True
+    if reparsed:
+        ctx.jobs = ctx.jobs  # Re-index and save the parsed dates
+
+    today = today or date.today()
+    guess_cutoff = (today - timedelta(days=config.DEADLINE_GUESS_GRACE_DAYS)).isoformat()
+    closed = set(ctx.deadlines.closed_before(today.isoformat()))
+    expired = [
+        job for job in ctx.jobs
+        if job.id in closed and (is_exact_deadline(job.deadline) or job.deadline_date < guess_cutoff)
+    ]
+    if not expired:
+        return []
+    closed = {job.id for job in expired}
+
+    with open(config.JOBS_ARCHIVE_FILE, "a") as f:
+        for job in expired:
+            f.write(json.dumps(job.to_dict()) + "\n")
+
+    ctx.jobs = [job for job in ctx.jobs if job.id not in closed]
+    if any(m.id in closed for m in ctx.matches):
+        ctx.matches = [m for m in ctx.matches if m.id not in closed]
+
+    print(f"[Expiry] Archived {len(expired)} closed jobs to {config.JOBS_ARCHIVE_FILE.name}")
+    return expired
@@ -0,0 +1,126 @@
+"""Adaptive per-query polling driven by each query's observed yield."""
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Iterable, Optional
+
+import config
+from scrapers import BaseScraper
+
+
+class PollScheduler:
+    """
+    Decide which queries of each source are due, and learn from every fetch.
+
+    Each query keeps a short history of fetches (new jobs, latency, requests,
+    errors) and its own polling interval. A fetch that finds new jobs halves
+    the interval, an empty one stretches it, and a failing one backs off, all
+    within POLL_MIN_INTERVAL and POLL_MAX_INTERVAL. Queries not yet due are
+    skipped, so request volume follows where new postings actually appear.
+    """
+
+    def __init__(self, known_ids: Optional[Iterable[str]] = None, path: Optional[Path] = None):
+        self.path = path or config.POLL_HISTORY_FILE
+        self.known_ids = set(known_ids or ())
+        self.state = self._load()
+        self._lock = threading.Lock()
+
+    def _load(self) -> dict:
+        if not self.path.exists():
+            return {}
+        with open(self.path, "r") as f:
+            return json.load(f)
+
+    def _entry(self, source: str, query: str) -> dict:
+        return self.state.setdefault(source, {}).setdefault(query, {
+            "interval": config.POLL_BASE_INTERVAL,
+            "next_due": 0,
+            "history": [],
+        })
+
+    def is_due(self, source: str, query: str, now: Optional[float] = None) -> bool:
+        """Whether a query should be fetched on this run."""
+        entry = self.state.get(source, {}).get(query)
+        if not entry:
+            return True
+        now = now or time.time()
+        return entry["next_due"] <= now + config.POLL_DUE_TOLERANCE
+
+    def attach(self, scrapers: Iterable[BaseScraper]):
+        """Limit each scraper to its due queries and record every fetch."""
+        for scraper in scrapers:
+            due = [q for q in scraper.queries() if self.is_due(scraper.name, q)]
+            print(f"[Poll] {scraper.name}: {len(due)}/{len(scraper.queries())} queries due")
+            scraper.query_filter = lambda query, name=scraper.name: self.is_due(name, query)
+            scraper.on_query_done = self.record
+
+    def record(
+        self,
+        scraper: BaseScraper,
+        query: str,
+        job_ids: list[str],
+        latency: float,
+        requests: int,
+        errors: int,
+    ):
+        """Store one fetch in the query's history and adapt its interval."""
+        with self._lock:
+            new_jobs = 0
+            for job_id in job_ids:
+                if job_id not in self.known_ids:
+                    self.known_ids.add(job_id)
+                    new_jobs += 1
+
+            entry = self._entry(scraper.name, query)
+            entry["history"].append({
+                "at": round(time.time()),
+                "new_jobs": new_jobs,
+                "latency": round(latency, 2),
+                "requests": requests,
+                "errors": errors,
+            })
+            del entry["history"][:-config.POLL_HISTORY_SIZE]
+
+            interval = entry["interval"]
+            if requests and errors >= requests:
+                interval *= 2
+            elif new_jobs:
+                interval /= 2
+            else:
+                interval *= config.POLL_BACKOFF_FACTOR
+            interval = min(max(interval, config.POLL_MIN_INTERVAL), config.POLL_MAX_INTERVAL)
+
+            entry["interval"] = round(interval)
+            entry["next_due"] = round(time.time() - latency + interval)
+
+    def summary(self, source: str) -> dict:
+        """Per-source totals over the recorded history."""
+        fetches = [h for entry in self.state.get(source, {}).values() for h in entry["history"]]
+        requests = sum(h["requests"] for h in fetches)
+        return {
+            "fetches": len(fetches),
+            "new_jobs": sum(h["new_jobs"] for h in fetches),
+            "avg_latency": round(sum(h["latency"] for h in fetches) / len(fetches), 2) if fetches else 0,
+            "error_rate": round(sum(h["errors"] for h in fetches) / requests, 2) if requests else 0,
+        }
+
+    def report(self):
+        """Print each source's totals over the recorded history."""
+        for source in sorted(self.state):
+            s = self.summary(source)
+            if s["fetches"]:
+                print(
+                    f"[Poll] {source}: {s['new_jobs']} new jobs over {s['fetches']} fetches, "
+                    f"{s['avg_latency']}s average, {s['error_rate']:.0%} errors"
+                )
+
+    def save(self):
+        """Write the history atomically."""
+        with self._lock:
+            tmp_path = self.path.with_name(f".{self.path.name}.tmp")
+            with open(tmp_path, "w") as f:
+                json.dump(self.state, f, indent=2)
+            os.replace(tmp_path, self.path)
@@ -0,0 +1,208 @@
+"""Full-text search over all stored jobs, backed by SQLite FTS5."""
+
+import json
+import sqlite3
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+import config
+from scrapers.job import Job
+
+# bm25 column weights: a hit in the title outranks one in the description
+_BM25_WEIGHTS = "10.0, 5.0, 2.0, 1.0"
+_COLUMNS = ("title", "organization", "location", "description")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    rowid INTEGER PRIMARY KEY,
+    id TEXT UNIQUE NOT NULL,
+    content_hash TEXT,
+    source TEXT,
+    location TEXT,
+    score REAL,
+    deadline_date TEXT,
+    title TEXT,
+    organization TEXT,
+    url TEXT
+);
+CREATE INDEX IF NOT EXISTS jobs_score ON jobs(score);
+CREATE INDEX IF NOT EXISTS jobs_deadline ON jobs(deadline_date);
+CREATE TABLE IF NOT EXISTS index_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS job_text USING fts5(
+    title, organization, location, description,
+    tokenize = 'porter unicode61'
+);
+"""
+
+
+def _fts_query(text: str) -> str:
+    """
+    Turn free text into an FTS5 query: every word must match as a word or
+    the start of one ("direct" finds "Director"), and a word written as
+    column:word only matches in that column.
+    """
+    terms = []
+    for word in text.split():
+        column, _, value = word.partition(":")
+        if value and column in _COLUMNS:
+            terms.append(f'{column} : "{value.replace(chr(34), "")}"*')
+        elif word.replace('"', ""):
+            terms.append(f'"{word.replace(chr(34), "")}"*')
+    return " ".join(terms)
+
+
+class SearchIndex:
+    """
+    Ranked full-text search over title, organization, location and
+    description of every stored job, with filters on source, location,
+    score and deadline.
+
+    The index lives in SEARCH_DB_FILE and is a cache of the job store:
+    sync() brings it up to date by re-indexing only jobs whose content hash
+    changed and dropping jobs that are gone, so it is cheap to call after
+    every commit. It also records which version of the job store it saw,
+    so a store changed elsewhere (e.g. pulled from CI) is noticed.
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = path or config.SEARCH_DB_FILE
+        with self._connect() as conn:
+            conn.executescript(_SCHEMA)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Connection whose changes are committed as one transaction."""
+        conn = sqlite3.connect(self.path)
+        conn.row_factory = sqlite3.Row
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def __len__(self) -> int:
+        with self._connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+
+    @property
+    def version(self) -> Optional[str]:
+        """Job store version the index was last synced with."""
+        with self._connect() as conn:
+            row = conn.execute("SELECT value FROM index_meta WHERE key = 'store_version'").fetchone()
+        return row["value"] if row else None
+
+    def sync(self, jobs: Iterable[Job], version: Optional[str] = None):
+        """
+        Index new and edited jobs, update scores, and drop removed jobs.
+        version is the job store version the jobs were read from.
+        """
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO index_meta (key, value) VALUES ('store_version', ?)", (version,)
+            )
+            indexed = {
+                row["id"]: row
+                for row in conn.execute("SELECT rowid, id, content_hash, score FROM jobs")
+            }
+            added = updated = 0
+            seen = set()
+
+            for job in jobs:
+                seen.add(job.id)
+                content_hash = job.content_hash or job.compute_content_hash()
+                row = indexed.get(job.id)
+                if row is not None and row["content_hash"] == content_hash:
+                    if row["score"] != job.score:
+                        conn.execute("UPDATE jobs SET score = ? WHERE rowid = ?", (job.score, row["rowid"]))
+                    continue
+
+                if row is not None:
+                    self._delete(conn, row["rowid"])
+                    updated += 1
+                else:
+                    added += 1
+                cursor = conn.execute(
+                    "INSERT INTO jobs (id, content_hash, source, location, score, deadline_date, "
+                    "title, organization, url) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (job.id, content_hash, job.source, job.location, job.score,
+                     job.deadline_date, job.title, job.organization, job.url),
+                )
+                conn.execute(
+                    "INSERT INTO job_text (rowid, title, organization, location, description) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (cursor.lastrowid, job.title, job.organization, job.location, job.description or ""),
+                )
+
+            removed = [row["rowid"] for job_id, row in indexed.items() if job_id not in seen]
+            for rowid in removed:
+                self._delete(conn, rowid)
+
+        if added or updated or removed:
+            print(f"[Search] Indexed {added} new, {updated} changed, removed {len(removed)} jobs")
+
+    @staticmethod
+    def _delete(conn: sqlite3.Connection, rowid: int):
+        conn.execute("DELETE FROM jobs WHERE rowid = ?", (rowid,))
+        conn.execute("DELETE FROM job_text WHERE rowid = ?", (rowid,))
+
+    def search(
+        self,
+        text: str = "",
+        source: Optional[str] = None,
+        location: Optional[str] = None,
+        min_score: Optional[float] = None,
+        max_score: Optional[float] = None,
+        closing_after: Optional[str] = None,
+        closing_before: Optional[str] = None,
+        ids: Optional[Iterable[str]] = None,
+        limit: int = 20,
+    ) -> list[dict]:
+        """
+        Jobs matching the text and filters, best first.
+
+        Rows carry id, title, organization, location, source, score,
+        deadline_date and url. Without text, results are ordered by score.
+        Deadlines are ISO dates; ids restricts results to those job IDs.
+        """
+        where, params = [], []
+        if text.strip():
+            where.append("job_text MATCH ?")
+            params.append(_fts_query(text))
+        if source:
+            where.append("j.source = ?")
+            params.append(source)
+        if location:
+            where.append("j.location LIKE ?")
+            params.append(f"%{location}%")
+        if min_score is not None:
+            where.append("j.score >= ?")
+            params.append(min_score)
+        if max_score is not None:
+            where.append("j.score <= ?")
+            params.append(max_score)
+        if closing_after:
+            where.append("j.deadline_date >= ?")
+            params.append(closing_after)
+        if closing_before:
+            where.append("j.deadline_date <= ?")
+            params.append(closing_before)
+        if ids is not None:
+            where.append("j.id IN (SELECT value FROM json_each(?))")
+            params.append(json.dumps(list(ids)))
+
+        rank = f"bm25(job_text, {_BM25_WEIGHTS})" if text.strip() else "-COALESCE(j.score, 0)"
+        sql = (
+            "SELECT j.id, j.title, j.organization, j.location, j.source, j.score, "
+            f"j.deadline_date, j.url, {rank} AS rank "
+            "FROM job_text JOIN jobs j ON j.rowid = job_text.rowid "
+            f"{'WHERE ' + ' AND '.join(where) if where else ''} "
+            "ORDER BY rank LIMIT ?"
+        )
+        params.append(limit)
+
+        with self._connect() as conn:
+            return [dict(row) for row in conn.execute(sql, params)]
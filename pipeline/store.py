@@ -0,0 +1,182 @@
+"""JSON persistence for jobs and matches."""
+
+import hashlib
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+import config
+from scrapers.job import Job
+from .descriptions import get_description_store
+
+# Shards whose file did not match the manifest's hash when read, rewritten
+# by the next save
+_stale_shards: set[str] = set()
+
+
+def _shard_name(job: Job) -> str:
+    """Shard a job is stored in: the month it was first scraped."""
+    return (job.scraped_at or "")[:7] or "undated"
+
+
+def _write_atomic(path: Path, text: str):
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    with open(tmp_path, "w") as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+
+def _read_manifest() -> dict:
+    if not config.JOBS_MANIFEST_FILE.exists():
+        return {}
+    with open(config.JOBS_MANIFEST_FILE, "r") as f:
+        return json.load(f)
+
+
+def _migrate_legacy_jobs():
+    """Split a single jobs.json into monthly shards, then remove it."""
+    with open(config.JOBS_FILE, "r") as f:
+        data = json.load(f)
+    jobs = [Job.from_dict(j) for j in data.get("jobs", [])]
+    save_jobs(jobs, data.get("meta", {}))
+    config.JOBS_FILE.unlink()
+    print(f"[Store] Migrated {len(jobs)} jobs from {config.JOBS_FILE.name} to {config.JOBS_DIR.name}/")
+
+
+def read_jobs() -> tuple[list[Job], dict]:
+    """Load jobs from every shard, and their metadata (e.g. the scorer fingerprint)."""
+    if not config.JOBS_MANIFEST_FILE.exists() and config.JOBS_FILE.exists():
+        _migrate_legacy_jobs()
+
+    manifest = _read_manifest()
+    descriptions = get_description_store()
+    jobs, all_refs = [], []
+    for name, entry in sorted(manifest.get("shards", {}).items()):
+        with open(config.JOBS_DIR / entry["file"], "r") as f:
+            text = f.read()
+        if hashlib.sha1(text.encode()).hexdigest() != entry["sha1"]:
+            print(f"[Store] {entry['file']} does not match the manifest; it will be rewritten on the next save")
+            _stale_shards.add(name)
+        for row in json.loads(text)["jobs"]:
+            job = Job.from_dict(row)
+            refs = row.get("description_ref")
+            if refs is not None:
+                job.defer_description(descriptions.loader(refs))
+                all_refs.append(refs)
+            jobs.append(job)
+
+    if all_refs:
+        descriptions.recount(all_refs)
+    return jobs, manifest.get("meta", {})
+
+
+def store_version() -> Optional[str]:
+    """When the job store last changed (the manifest's timestamp), or None if empty."""
+    return _read_manifest().get("last_updated")
+
+
+def load_jobs() -> list[Job]:
+    """Load jobs from the shard files."""
+    return read_jobs()[0]
+
+
+def save_jobs(jobs: list[Job], meta: dict = None, dirty: Optional[set[str]] = None):
+    """
+    Save jobs into one file per scrape month, listed in a manifest.
+
+    With DESCRIPTION_STORE on, each job's description is saved as a list of
+    paragraph hashes into the description store.
+
+    Each shard is serialised and compared with the hash the manifest holds
+    for it; only shards whose content changed are written, and shards left
+    empty are deleted. A run that adds this month's jobs touches one shard
+    and the manifest, which keeps the committed diff small.
+
+    dirty names the shards that may have changed since the jobs were read;
+    the others keep their manifest entry without being serialised. None
+    (the default) checks every shard.
+    """
+    config.JOBS_DIR.mkdir(parents=True, exist_ok=True)
+    old = _read_manifest()
+    old_shards = old.get("shards", {})
+
+    by_shard: dict[str, list[Job]] = {}
+    for job in jobs:
+        by_shard.setdefault(_shard_name(job), []).append(job)
+
+    refs = {}
+    if config.DESCRIPTION_STORE:
+        # Paragraphs are saved before the shards that refer to them
+        descriptions = get_description_store()
+        refs = {id(job): descriptions.refs(job) for job in jobs}
+        descriptions.recount(refs.values())
+        descriptions.save()
+
+    shards = {}
+    written = 0
+    for name, shard_jobs in sorted(by_shard.items()):
+        old_entry = old_shards.get(name)
+        if (
+            dirty is not None and name not in dirty and name not in _stale_shards
+            and old_entry and old_entry["count"] == len(shard_jobs)
+            and (config.JOBS_DIR / old_entry["file"]).exists()
+        ):
+            shards[name] = old_entry
+            continue
+
+        if config.DESCRIPTION_STORE:
+            rows = []
+            for job in shard_jobs:
+                row = job.to_dict(description=False)
+                row["description_ref"] = refs[id(job)]
+                rows.append(row)
+        else:
+            rows = [job.to_dict() for job in shard_jobs]
+        text = json.dumps({"jobs": rows}, indent=2)
+        sha1 = hashlib.sha1(text.encode()).hexdigest()
+        entry = {"file": f"{name}.json", "count": len(rows), "sha1": sha1}
+        if old_entry != entry or name in _stale_shards or not (config.JOBS_DIR / entry["file"]).exists():
+            _write_atomic(config.JOBS_DIR / entry["file"], text)
+            written += 1
+        shards[name] = entry
+    _stale_shards.clear()
+
+    for name in old_shards.keys() - shards.keys():
+        (config.JOBS_DIR / old_shards[name]["file"]).unlink(missing_ok=True)
+
+    meta = meta or {}
+    if shards == old_shards and meta == old.get("meta", {}):
+        return  # Nothing changed; leave the manifest's timestamp alone
+
+    manifest = {
+        "shards": shards,
+        "meta": meta,
+        "last_updated": datetime.utcnow().isoformat(),
+    }
+    _write_atomic(config.JOBS_MANIFEST_FILE, json.dumps(manifest, indent=2))
+    if written:
+        print(f"[Store] Wrote {written} of {len(shards)} job shards")
+
+
+def load_matches() -> list[Job]:
+    """Load matched jobs from JSON file."""
+    if not config.MATCHES_FILE.exists():
+        return []
+
+    with open(config.MATCHES_FILE, "r") as f:
+        data = json.load(f)
+
+    return [Job.from_dict(j) for j in data.get("matches", [])]
+
+
+def save_matches(jobs: list[Job]):
+    """Save matched jobs to JSON file."""
+    data = {
+        "matches": [job.to_dict() for job in jobs],
+        "last_updated": datetime.utcnow().isoformat()
+    }
+
+    with open(config.MATCHES_FILE, "w") as f:
+        json.dump(data, f, indent=2)
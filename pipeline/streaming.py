@@ -0,0 +1,191 @@
+"""Streaming scrape -> score -> generate -> alert pipeline."""
+
+import queue
+import threading
+from typing import Optional
+
+import config
+from scrapers import get_all_scrapers, BaseScraper, Job
+from generator import CoverLetterGenerator, TemplateLetterGenerator
+from notifier import get_notifier, SentLedger, SMTPNotifier
+from .context import PipelineContext
+from .changes import ChangeDetector, NEW, UNCHANGED
+
+# Marks the end of a stage's output
+DONE = None
+
+
+class StreamingPipeline:
+    """
+    Move each job through every stage as soon as it is parsed.
+
+    One thread per scraper feeds a bounded score queue; a scorer thread
+    keeps new jobs and forwards matches to a generation thread; generated
+    high matches go on to a notification thread that sends an alert per job.
+    Bounded queues keep fast stages from running far ahead of slow ones,
+    so latency from posting to letter is one job's worth of work.
+    """
+
+    def __init__(
+        self,
+        ctx: Optional[PipelineContext] = None,
+        scrapers: Optional[list[BaseScraper]] = None,
+        queue_size: int = None,
+    ):
+        self.ctx = ctx or PipelineContext()
+        self.scrapers = scrapers if scrapers is not None else get_all_scrapers()
+        size = queue_size or config.STREAM_QUEUE_SIZE
+        self.score_queue: queue.Queue = queue.Queue(maxsize=size)
+        self.generate_queue: queue.Queue = queue.Queue(maxsize=size)
+        self.notify_queue: queue.Queue = queue.Queue(maxsize=size)
+
+        self.new_jobs: list[Job] = []
+        self.modified_jobs: list[Job] = []
+        self.new_matches: list[Job] = []
+        self.alerts_sent = 0
+        self.error: Optional[Exception] = None
+
+    def _fail(self, stage: str, error: Exception, inbox: queue.Queue, producers: int = 1):
+        """
+        Record a stage's failure and discard its input until every producer is
+        done, so upstream threads never block on a full queue.
+        """
+        print(f"[Stream] {stage} stopped: {error}")
+        self.error = self.error or error
+        while producers:
+            if inbox.get() is DONE:
+                producers -= 1
+
+    def _scrape(self, scraper: BaseScraper):
+        """Producer: push parsed jobs from one scraper."""
+        try:
+            for job in scraper.stream():
+                self.score_queue.put(job)
+        finally:
+            self.score_queue.put(DONE)
+
+    def _score(self):
+        """Keep new and modified jobs, score them and forward matches."""
+        remaining = len(self.scrapers)
+        try:
+            scorer = self.ctx.scorer
+            detector = ChangeDetector(self.ctx.jobs)
+            while remaining:
+                job = self.score_queue.get()
+                if job is DONE:
+                    remaining -= 1
+                    continue
+                status, job = detector.apply(job)
+                if status == UNCHANGED:
+                    continue
+                (self.new_jobs if status == NEW else self.modified_jobs).append(job)
+
+                try:
+                    job.score = scorer.score_job(job)
+                except Exception as e:
+                    print(f"[Stream] Error scoring {job.title}: {e}")
+                    continue
+
+                if scorer.filter_matches([job]):
+                    self.new_matches.append(job)
+                    self.generate_queue.put(job)
+        except Exception as e:
+            self._fail("Scoring", e, self.score_queue, remaining)
+        finally:
+            self.generate_queue.put(DONE)
+
+    def _generate(self):
+        """Write letters for high matches and drafts for good ones."""
+        try:
+            generator = CoverLetterGenerator(self.ctx.profile)
+            drafter = TemplateLetterGenerator(self.ctx.profile)
+            generated = 0
+            while True:
+                job = self.generate_queue.get()
+                if job is DONE:
+                    break
+
+                try:
+                    if (job.score or 0) >= config.SCORE_THRESHOLD_HIGH:
+                        if generated < config.MAX_COVER_LETTERS_PER_RUN:
+                            print(f"[CoverLetter] Generating for: {job.title} ({job.score}%)")
+                            path = generator.generate_and_save(job)
+                            if path:
+                                job.cover_letter_path = str(path)
+                                generated += 1
+                        self.notify_queue.put(job)
+                    elif config.TEMPLATE_DRAFTS_FOR_GOOD_MATCHES:
+                        job.cover_letter_path = str(drafter.generate_and_save(job))
+                except Exception as e:
+                    print(f"[Stream] Error generating for {job.title}: {e}")
+        except Exception as e:
+            self._fail("Generation", e, self.generate_queue)
+        finally:
+            self.notify_queue.put(DONE)
+
+    def _notify(self):
+        """Send an alert for each high match not yet sent to a recipient."""
+        ledger = None
+        try:
+            notifier = get_notifier()
+            ledger = SentLedger()
+            queued = notifier.outbox.queued_jobs() if isinstance(notifier, SMTPNotifier) else {}
+            recipients = [e.strip() for e in config.EMAIL_TO.split(",") if e.strip()]
+
+            while True:
+                job = self.notify_queue.get()
+                if job is DONE:
+                    break
+                if not config.STREAM_ALERT_HIGH_MATCHES:
+                    continue
+
+                for email in recipients:
+                    if ledger.seen(email, job.id) or job.id in queued.get(email, ()):
+                        continue
+                    stats = {"total_scanned": len(self.new_jobs), "high_matches": 1}
+                    try:
+                        if notifier.send_digest([job], [], stats, email):
+                            # The SMTP outbox records the job once it is delivered
+                            if not isinstance(notifier, SMTPNotifier):
+                                ledger.record(email, [job])
+                            self.alerts_sent += 1
+                    except Exception as e:
+                        print(f"[Stream] Error alerting {email}: {e}")
+        except Exception as e:
+            self._fail("Alerting", e, self.notify_queue)
+        finally:
+            if ledger is not None:
+                ledger.save()
+
+    def run(self) -> list[Job]:
+        """
+        Run all stages to completion and merge results into the context.
+        Re-raises the first error that stopped a stage, after merging.
+        """
+        threads = [
+            threading.Thread(target=self._scrape, args=(scraper,), name=f"scrape-{scraper.name}")
+            for scraper in self.scrapers
+        ]
+        threads += [
+            threading.Thread(target=self._score, name="score"),
+            threading.Thread(target=self._generate, name="generate"),
+            threading.Thread(target=self._notify, name="notify"),
+        ]
+
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        if self.new_jobs or self.modified_jobs:
+            self.ctx.jobs = self.ctx.jobs + self.new_jobs
+        if self.new_matches or self.modified_jobs:
+            # Modified jobs were re-scored and may have left or re-entered the matches
+            changed = {job.id for job in self.modified_jobs}
+            matches = [m for m in self.ctx.matches if m.id not in changed] + self.new_matches
+            matches.sort(key=lambda j: j.score or 0, reverse=True)
+            self.ctx.matches = matches
+
+        if self.error:
+            raise self.error
+        return self.new_matches
@@ -0,0 +1,129 @@
+"""Long-running watch daemon with per-source polling schedules."""
+
+import heapq
+import json
+import os
+import signal
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+import config
+from scrapers import get_all_scrapers, BaseScraper
+from notifier import SMTPNotifier
+from .context import PipelineContext
+from .expiry import archive_expired
+from .polling import PollScheduler
+from .streaming import StreamingPipeline
+
+
+class WatchDaemon:
+    """
+    Poll each source on its own interval from one warm process.
+
+    The profile, fitted scorer, jobs and matches stay in memory between
+    polls, so each poll costs only the network requests and the work on new
+    jobs. After every poll the context is committed and the schedule is
+    checkpointed, so a restart picks up where the previous process stopped.
+    SIGINT and SIGTERM finish the current poll and exit cleanly.
+    """
+
+    def __init__(
+        self,
+        ctx: Optional[PipelineContext] = None,
+        scrapers: Optional[list[BaseScraper]] = None,
+        state_path: Optional[Path] = None,
+    ):
+        self.ctx = ctx or PipelineContext()
+        self.scrapers = {s.name: s for s in (scrapers if scrapers is not None else get_all_scrapers())}
+        self.state_path = state_path or config.WATCH_STATE_FILE
+        self.state = self._load_state()
+        self.scheduler: Optional[PollScheduler] = None
+        self._stop = threading.Event()
+
+    def _load_state(self) -> dict:
+        if not self.state_path.exists():
+            return {"sources": {}}
+        with open(self.state_path, "r") as f:
+            return json.load(f)
+
+    def interval(self, name: str) -> float:
+        """Polling interval for a source, in seconds."""
+        return config.WATCH_POLL_INTERVALS.get(name, config.WATCH_DEFAULT_INTERVAL)
+
+    def stop(self, *args):
+        """Request shutdown after the current poll."""
+        if not self._stop.is_set():
+            print("[Watch] Shutting down after current poll...")
+        self._stop.set()
+
+    def poll(self, scraper: BaseScraper) -> int:
+        """Poll one source through the streaming pipeline; returns new matches."""
+        pipeline = StreamingPipeline(self.ctx, scrapers=[scraper])
+        matches = pipeline.run()
+        print(
+            f"[Watch] {scraper.name}: {len(pipeline.new_jobs)} new jobs, "
+            f"{len(matches)} matches, {pipeline.alerts_sent} alerts"
+        )
+        if pipeline.alerts_sent and config.EMAIL_BACKEND == "smtp":
+            SMTPNotifier().drain()
+        return len(matches)
+
+    def checkpoint(self):
+        """Archive closed jobs, then persist jobs, matches and the polling schedule."""
+        archive_expired(self.ctx)
+        self.ctx.commit()
+        if self.scheduler:
+            self.scheduler.save()
+        self.state["last_checkpoint"] = datetime.utcnow().isoformat()
+        tmp_path = self.state_path.with_name(f".{self.state_path.name}.tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(self.state, f, indent=2)
+        os.replace(tmp_path, self.state_path)
+
+    def run(self):
+        """Poll sources as they come due until stopped."""
+        if not self.scrapers:
+            print("[Watch] No sources to watch")
+            return
+
+        signal.signal(signal.SIGINT, self.stop)
+        signal.signal(signal.SIGTERM, self.stop)
+
+        # Warm up once so the first poll does not pay for it
+        self.ctx.scorer.attach_prefilter(list(self.scrapers.values()))
+        self.ctx.load()
+
+        if config.ADAPTIVE_POLLING:
+            self.scheduler = PollScheduler(job.id for job in self.ctx.jobs)
+            self.scheduler.attach(self.scrapers.values())
+
+        sources = self.state.setdefault("sources", {})
+        schedule = [(sources.get(name, {}).get("next_due", 0), name) for name in self.scrapers]
+        heapq.heapify(schedule)
+        print(f"[Watch] Watching {len(schedule)} sources")
+
+        try:
+            while not self._stop.is_set():
+                due, name = schedule[0]
+                wait = due - time.time()
+                if wait > 0:
+                    self._stop.wait(wait)
+                    continue
+
+                heapq.heappop(schedule)
+                started = time.time()
+                try:
+                    self.poll(self.scrapers[name])
+                except Exception as e:
+                    print(f"[Watch] {name}: poll failed: {e}")
+
+                next_due = started + self.interval(name)
+                sources[name] = {"last_poll": started, "next_due": next_due}
+                heapq.heappush(schedule, (next_due, name))
+                self.checkpoint()
+        finally:
+            self.checkpoint()
+            print("[Watch] Stopped")
@@ -1,28 +1,61 @@
-"""Job scrapers package."""
-
-from .base import BaseScraper, Job
-from .reliefweb import ReliefWebScraper
-from .ethiojobs import EthioJobsScraper
-from .unjobs import UNJobsScraper
-from .devex import DevExScraper
-from .developmentaid import DevelopmentAidScraper
-
-__all__ = [
-    "BaseScraper",
-    "Job",
-    "ReliefWebScraper",
-    "EthioJobsScraper",
-    "UNJobsScraper",
-    "DevExScraper",
-    "DevelopmentAidScraper",
-]
+"""
+Job scrapers package.
+
+Names are imported from their submodules on first access, so code that
+only needs Job does not load requests, lxml and the scrapers.
+"""
+
+import importlib
+
+import config
+
+_EXPORTS = {
+    "BaseScraper": ".base",
+    "Job": ".job",
+    "CircuitBreaker": ".circuit",
+    "CircuitOpenError": ".circuit",
+    "HTTPClient": ".http",
+    "get_client": ".http",
+    "ResponseArchive": ".archive",
+    "get_archive": ".archive",
+    "SourceSpec": ".engine",
+    "SpecScraper": ".engine",
+    "ReliefWebScraper": ".reliefweb",
+    "EthioJobsScraper": ".ethiojobs",
+    "UNJobsScraper": ".unjobs",
+    "DevExScraper": ".devex",
+    "DevelopmentAidScraper": ".developmentaid",
+    "QueryPlanner": ".planner",
+    "plan_queries": ".planner",
+}
+
+__all__ = list(_EXPORTS) + ["get_all_scrapers"]
+
+
+def __getattr__(name: str):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
 
 def get_all_scrapers():
     """Return instances of all available scrapers."""
-    return [
+    from .reliefweb import ReliefWebScraper
+    from .ethiojobs import EthioJobsScraper
+    from .unjobs import UNJobsScraper
+    from .devex import DevExScraper
+    from .developmentaid import DevelopmentAidScraper
+    from .planner import plan_queries
+
+    scrapers = [
         ReliefWebScraper(),
         EthioJobsScraper(),
         UNJobsScraper(),
         DevExScraper(),
         DevelopmentAidScraper(),
     ]
+    if config.USE_QUERY_PLANNER:
+        plan_queries(scrapers)
+    return scrapers
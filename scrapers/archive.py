@@ -0,0 +1,177 @@
+"""Append-only archive of fetched responses, for re-parsing offline."""
+
+import gzip
+import hashlib
+import json
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Iterator, Optional
+
+import requests
+
+import config
+
+
+class ArchiveMiss(Exception):
+    """Raised when replaying a URL that was never archived."""
+
+
+class ResponseArchive:
+    """
+    WARC-like store of every fetched listing and detail page.
+
+    Bodies are appended to monthly segment files, one gzip member per record,
+    so a segment is a valid .gz file and a record can be read back with a
+    single seek. An index (index.jsonl) maps each fetch to its source, query,
+    URL, time and byte range. A body identical to the URL's previous fetch is
+    indexed again but not stored twice.
+
+    Every fetch stays readable: replaying as of a point in time serves each
+    URL as it was fetched then, so past listing pages can be re-parsed too.
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = path or config.RESPONSE_ARCHIVE_DIR
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.index_path = self.path / "index.jsonl"
+        self._lock = threading.Lock()
+        self._fetches: dict[str, list[dict]] = {}  # URL -> index entries, oldest first
+        self._loaded = False
+
+    def _load_index(self):
+        if self._loaded:
+            return
+        for entry in self.iter_entries():
+            self._fetches.setdefault(entry["url"], []).append(entry)
+        self._loaded = True
+
+    def record(self, source: str, query: Optional[str], url: str, response: requests.Response):
+        """Append one fetched response."""
+        body = response.content
+        sha1 = hashlib.sha1(body).hexdigest()
+        fetched_at = datetime.utcnow().isoformat()
+
+        with self._lock:
+            self._load_index()
+            entry = {
+                "source": source,
+                "query": query,
+                "url": url,
+                "fetched_at": fetched_at,
+                "status": response.status_code,
+                "encoding": response.encoding,
+                "sha1": sha1,
+            }
+
+            previous = self._fetches.get(url, [None])[-1]
+            if previous and previous["sha1"] == sha1:
+                entry.update(segment=previous["segment"], offset=previous["offset"], length=previous["length"])
+            else:
+                header = (
+                    "WARC/1.1\r\n"
+                    "WARC-Type: response\r\n"
+                    f"WARC-Target-URI: {url}\r\n"
+                    f"WARC-Date: {fetched_at}Z\r\n"
+                    f"Content-Type: {response.headers.get('Content-Type', '')}\r\n"
+                    f"Content-Length: {len(body)}\r\n\r\n"
+                ).encode()
+                record = gzip.compress(header + body)
+                segment = f"{fetched_at[:7]}.warc.gz"
+                with open(self.path / segment, "ab") as f:
+                    offset = f.tell()
+                    f.write(record)
+                entry.update(segment=segment, offset=offset, length=len(record))
+
+            with open(self.index_path, "a") as f:
+                f.write(json.dumps(entry) + "\n")
+            self._fetches.setdefault(url, []).append(entry)
+
+    def _read(self, entry: dict) -> bytes:
+        with open(self.path / entry["segment"], "rb") as f:
+            f.seek(entry["offset"])
+            record = gzip.decompress(f.read(entry["length"]))
+        return record.split(b"\r\n\r\n", 1)[1]
+
+    def response(self, url: str, as_of: Optional[str] = None) -> requests.Response:
+        """
+        Archived response for a URL, as a requests.Response: the latest one,
+        or with as_of (an ISO time) the first fetch at or after it, falling
+        back to the last one before it.
+        """
+        with self._lock:
+            self._load_index()
+            fetches = self._fetches.get(url)
+        if not fetches:
+            raise ArchiveMiss(f"not archived: {url}")
+        entry = fetches[-1]
+        if as_of:
+            entry = next((e for e in fetches if e["fetched_at"] >= as_of), entry)
+
+        response = requests.Response()
+        response.status_code = entry["status"]
+        response._content = self._read(entry)
+        response.encoding = entry["encoding"]
+        response.url = url
+        return response
+
+    def queries(self, source: str) -> list[str]:
+        """Listing queries archived for a source, in first-seen order."""
+        return list(dict.fromkeys(query for query, _ in self.snapshots(source)))
+
+    def snapshots(self, source: str) -> list[tuple[str, str]]:
+        """
+        (query, fetched_at) of every distinct version of a source's listing
+        pages, oldest first. A query's listing is the first URL fetched for it.
+        """
+        with self._lock:
+            self._load_index()
+            fetches = [e for entries in self._fetches.values() for e in entries if e["source"] == source]
+
+        listing_urls: dict[str, str] = {}
+        snapshots = []
+        last_sha1: dict[str, str] = {}
+        for entry in sorted(fetches, key=lambda e: e["fetched_at"]):
+            query = entry["query"]
+            if not query or listing_urls.setdefault(query, entry["url"]) != entry["url"]:
+                continue
+            if last_sha1.get(query) != entry["sha1"]:
+                last_sha1[query] = entry["sha1"]
+                snapshots.append((query, entry["fetched_at"]))
+        return snapshots
+
+    def as_of(self, fetched_at: str) -> "ArchiveView":
+        """The archive as it was when fetched_at's fetch was made."""
+        return ArchiveView(self, fetched_at)
+
+    def iter_entries(self) -> Iterator[dict]:
+        """Every index entry, oldest first."""
+        if not self.index_path.exists():
+            return
+        with open(self.index_path, "r") as f:
+            for line in f:
+                yield json.loads(line)
+
+
+class ArchiveView:
+    """Replay source serving each URL as archived at one point in time."""
+
+    def __init__(self, archive: ResponseArchive, as_of: str):
+        self.archive = archive
+        self.as_of = as_of
+
+    def response(self, url: str) -> requests.Response:
+        return self.archive.response(url, self.as_of)
+
+
+_archive: Optional[ResponseArchive] = None
+_archive_lock = threading.Lock()
+
+
+def get_archive() -> ResponseArchive:
+    """Process-wide response archive."""
+    global _archive
+    with _archive_lock:
+        if _archive is None:
+            _archive = ResponseArchive()
+        return _archive
@@ -1,52 +1,19 @@
 """Base scraper class with common functionality."""
 
-import hashlib
 import time
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field, asdict
-from datetime import datetime
-from typing import Optional
+from datetime import date
+from typing import Callable, Iterator, Optional
 
 import requests
-from tenacity import retry, stop_after_attempt, wait_exponential
+from tenacity import Retrying, retry_if_exception, stop_after_attempt, wait_exponential
 
 import config
-
-
-@dataclass
-class Job:
-    """Represents a job posting."""
-
-    id: str
-    title: str
-    organization: str
-    location: str
-    description: str
-    url: str
-    source: str
-    posted_date: Optional[str] = None
-    deadline: Optional[str] = None
-    salary: Optional[str] = None
-    job_type: Optional[str] = None  # Full-time, Part-time, Consultant
-    experience_required: Optional[str] = None
-    scraped_at: str = field(default_factory=lambda: datetime.utcnow().isoformat())
-    score: Optional[float] = None
-    cover_letter_path: Optional[str] = None
-
-    def to_dict(self) -> dict:
-        """Convert to dictionary."""
-        return asdict(self)
-
-    @classmethod
-    def from_dict(cls, data: dict) -> "Job":
-        """Create from dictionary."""
-        return cls(**{k: v for k, v in data.items() if k in cls.__dataclass_fields__})
-
-    @staticmethod
-    def generate_id(url: str, title: str) -> str:
-        """Generate unique ID from URL and title."""
-        content = f"{url}:{title}".encode()
-        return hashlib.md5(content).hexdigest()[:12]
+import metrics
+from .job import Job, is_exact_deadline, parse_deadline
+from .archive import get_archive
+from .http import get_client
+from .circuit import CircuitOpenError, get_breaker, is_transient, retry_budget, save_breakers
 
 
 class BaseScraper(ABC):
@@ -55,13 +22,34 @@ class BaseScraper(ABC):
     name: str = "base"
     base_url: str = ""
 
-    def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            "User-Agent": "curl/7.79.1",
-            "Accept": "*/*",
-        })
+    # Query templates filled in by the query planner, e.g. "/jobs?country={}"
+    LOCATION_QUERY: Optional[str] = None
+    KEYWORD_QUERY: Optional[str] = None
+
+    def __init__(self, queries: Optional[list[str]] = None):
+        self.http = get_client()
+        self.session = self.http.session
         self._last_request_time = 0
+        self.query_overrides = queries
+        self.request_count = 0
+        self.error_count = 0
+        self.breaker = get_breaker(self.name)
+
+        # Every fetched body is archived; with replay set, fetches are served
+        # from that archive instead of the network
+        self.archive = get_archive() if config.ARCHIVE_RESPONSES else None
+        self.replay = None
+        self._query: Optional[str] = None
+
+        # Set by the poll scheduler: which queries to fetch this run, and a
+        # callback receiving (scraper, query, job_ids, latency, requests, errors)
+        self.query_filter: Optional[Callable[[str], bool]] = None
+        self.on_query_done: Optional[Callable] = None
+
+        # Set by JobScorer.attach_prefilter: (title, location, organization) -> bool
+        self.prefilter: Optional[Callable[[str, str, str], bool]] = None
+        self.prefilter_audit = False
+        self.prefiltered = 0
 
     def _rate_limit(self):
         """Enforce rate limiting between requests."""
@@ -70,29 +58,155 @@ class BaseScraper(ABC):
             time.sleep(config.REQUEST_DELAY - elapsed)
         self._last_request_time = time.time()
 
-    @retry(
-        stop=stop_after_attempt(config.MAX_RETRIES),
-        wait=wait_exponential(multiplier=1, min=2, max=10)
-    )
     def fetch(self, url: str) -> requests.Response:
-        """Fetch URL with rate limiting and retries."""
+        """
+        Fetch URL with rate limiting and retries.
+
+        Only transient errors (connection errors, 403/429 and 5xx) are
+        retried, and each retry spends from the shared retry budget. Fails
+        fast with CircuitOpenError while the source's circuit is open.
+        """
+        if self.replay:
+            return self.replay.response(url)
+
+        retrying = Retrying(
+            stop=stop_after_attempt(config.MAX_RETRIES) | self._stop_retrying,
+            wait=wait_exponential(multiplier=1, min=2, max=10),
+            retry=retry_if_exception(is_transient),
+            reraise=True,
+        )
+        for attempt in retrying:
+            if attempt.retry_state.attempt_number > 1:
+                metrics.inc("http_retries_total", source=self.name)
+            with attempt:
+                if not self.breaker.allow():
+                    raise CircuitOpenError(f"circuit open for {self.name}")
+                return self._fetch_once(url)
+
+    def _fetch_once(self, url: str) -> requests.Response:
         self._rate_limit()
-        response = self.session.get(url, timeout=config.REQUEST_TIMEOUT)
-        response.raise_for_status()
+        self.request_count += 1
+        metrics.inc("http_requests_total", source=self.name)
+        try:
+            with metrics.timed("http_request_seconds", source=self.name):
+                response = self.http.get(url, timeout=config.REQUEST_TIMEOUT)
+            metrics.inc("http_response_bytes_total", len(response.content), source=self.name)
+            response.raise_for_status()
+        except Exception as e:
+            self.error_count += 1
+            metrics.inc("http_errors_total", source=self.name)
+            if is_transient(e):
+                self.breaker.record_failure()
+            raise
+        self.breaker.record_success()
+        if self.archive:
+            self.archive.record(self.name, self._query, url, response)
         return response
 
+    def _stop_retrying(self, retry_state) -> bool:
+        """Give up once the circuit has opened or the retry budget is spent."""
+        return self.breaker.is_open or not retry_budget.spend()
+
+    def _passes_prefilter(self, title: str, location: str, organization: str) -> bool:
+        """Whether a listing is worth fetching its detail page for."""
+        if not self.prefilter or self.prefilter(title, location, organization):
+            return True
+        self.prefiltered += 1
+        if self.prefilter_audit:
+            print(f"[{self.name}] Would skip: {title} ({location or 'no location'})")
+        return self.prefilter_audit
+
+    def _report_prefilter(self):
+        if self.prefiltered:
+            verb = "Would skip" if self.prefilter_audit else "Skipped"
+            print(f"[{self.name}] {verb} {self.prefiltered} listings below the reachable score")
+
     @abstractmethod
-    def scrape(self) -> list[Job]:
-        """Scrape jobs from the source. Must be implemented by subclasses."""
+    def default_queries(self) -> list[str]:
+        """Feed URLs, search paths or categories this source is polled with."""
         pass
 
+    def queries(self) -> list[str]:
+        """Queries to poll: planner overrides if set, else the defaults."""
+        if self.query_overrides is not None:
+            return self.query_overrides
+        return self.default_queries()
+
+    @abstractmethod
+    def scrape_query(self, query: str) -> Iterator[Job]:
+        """Yield jobs for a single query. Must be implemented by subclasses."""
+        pass
+
+    def scrape(self) -> list[Job]:
+        """Scrape jobs from every due query."""
+        return list(self.iter_jobs())
+
+    def iter_jobs(self) -> Iterator[Job]:
+        """Yield unique, still open jobs from every due query as they are parsed."""
+        seen = set()
+        today = date.today().isoformat()
+
+        for query in self.queries():
+            if self.query_filter and not self.query_filter(query):
+                continue
+            if self.breaker.is_open:
+                print(f"[{self.name}] Circuit open, skipping remaining queries")
+                break
+
+            self._query = query
+            started = time.time()
+            requests_before, errors_before = self.request_count, self.error_count
+            job_ids = []
+
+            for job in self.scrape_query(query):
+                job_ids.append(job.id)
+                if job.deadline and not job.deadline_date:
+                    job.deadline_date = parse_deadline(job.deadline)
+                if job.deadline_date and job.deadline_date < today and is_exact_deadline(job.deadline):
+                    continue  # Already closed; a date without a year may be misread
+                if job.id not in seen:
+                    seen.add(job.id)
+                    yield job
+                if self.breaker.is_open:
+                    break
+
+            if self.on_query_done:
+                self.on_query_done(
+                    self, query, job_ids, time.time() - started,
+                    self.request_count - requests_before,
+                    self.error_count - errors_before,
+                )
+
+    def stream(self) -> Iterator[Job]:
+        """Run the scraper with error handling, yielding jobs as they are parsed."""
+        count = 0
+        self.prefiltered = 0
+        try:
+            print(f"[{self.name}] Starting scrape...")
+            for job in self.iter_jobs():
+                count += 1
+                yield job
+        except Exception as e:
+            print(f"[{self.name}] Error: {e}")
+        finally:
+            save_breakers()  # Also when the consumer stops early and closes the stream
+        metrics.inc("jobs_total", count, stage="scrape", source=self.name)
+        print(f"[{self.name}] Found {count} jobs")
+        self._report_prefilter()
+
     def run(self) -> list[Job]:
         """Run the scraper with error handling."""
+        self.prefiltered = 0
         try:
             print(f"[{self.name}] Starting scrape...")
-            jobs = self.scrape()
+            with metrics.timed("stage_seconds", stage="scrape", source=self.name):
+                jobs = self.scrape()
+            metrics.inc("jobs_total", len(jobs), stage="scrape", source=self.name)
             print(f"[{self.name}] Found {len(jobs)} jobs")
+            self._report_prefilter()
             return jobs
         except Exception as e:
             print(f"[{self.name}] Error: {e}")
             return []
+        finally:
+            save_breakers()
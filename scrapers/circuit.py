@@ -0,0 +1,159 @@
+"""Per-source circuit breakers and a shared retry budget."""
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+import requests
+
+import config
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of fetching when a source's circuit is open."""
+
+
+def is_transient(error: Exception) -> bool:
+    """Whether a fetch error says the source is down or blocking us."""
+    if isinstance(error, requests.HTTPError) and error.response is not None:
+        status = error.response.status_code
+        return status in (403, 429) or status >= 500
+    return isinstance(error, requests.RequestException)
+
+
+class RetryBudget:
+    """
+    Token bucket shared by every scraper's retries.
+
+    Each retry spends one token; tokens refill slowly over time, so a single
+    run, or a burst inside the watch daemon, can only spend so much time
+    retrying before failing requests give up after their first attempt.
+    """
+
+    def __init__(self, capacity: int = None, refill_per_hour: int = None):
+        self.capacity = capacity or config.RETRY_BUDGET
+        self.refill_rate = (refill_per_hour or config.RETRY_BUDGET) / 3600
+        self.tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def spend(self) -> bool:
+        """Take one retry token; False if the budget is exhausted."""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.refill_rate)
+            self._updated = now
+            if self.tokens < 1:
+                return False
+            self.tokens -= 1
+            return True
+
+
+class CircuitBreaker:
+    """
+    Stop calling a source after repeated failures.
+
+    Closed: requests flow and consecutive failures are counted. After
+    CIRCUIT_FAILURE_THRESHOLD failures the circuit opens and every fetch
+    fails fast. Once the cooldown has passed, a later run lets one probe
+    request through (half-open): success closes the circuit, failure opens
+    it again with a doubled cooldown.
+    """
+
+    def __init__(self, name: str, state: dict, store: "BreakerStore"):
+        self.name = name
+        self.state = state
+        self._store = store
+
+    @property
+    def is_open(self) -> bool:
+        """Open and still cooling down, so requests would fail fast."""
+        return (
+            self.state["state"] == OPEN
+            and time.time() - self.state["opened_at"] < self.state["cooldown"]
+        )
+
+    def allow(self) -> bool:
+        """Whether a request may be sent now."""
+        with self._store.lock:
+            if self.state["state"] == OPEN:
+                if self.is_open:
+                    return False
+                self.state["state"] = HALF_OPEN
+                print(f"[{self.name}] Circuit half-open, probing")
+            return True
+
+    def record_success(self):
+        with self._store.lock:
+            if self.state["state"] != CLOSED:
+                print(f"[{self.name}] Circuit closed")
+            self.state.update(state=CLOSED, failures=0, cooldown=config.CIRCUIT_COOLDOWN)
+
+    def record_failure(self):
+        with self._store.lock:
+            self.state["failures"] += 1
+            if self.state["state"] == HALF_OPEN:
+                cooldown = min(self.state["cooldown"] * 2, config.CIRCUIT_MAX_COOLDOWN)
+                self._trip(cooldown)
+            elif self.state["state"] == CLOSED and self.state["failures"] >= config.CIRCUIT_FAILURE_THRESHOLD:
+                self._trip(self.state["cooldown"])
+
+    def _trip(self, cooldown: float):
+        self.state.update(state=OPEN, opened_at=time.time(), cooldown=cooldown)
+        print(f"[{self.name}] Circuit open after {self.state['failures']} failures; "
+              f"skipping source for {cooldown / 60:.0f} min")
+
+
+class BreakerStore:
+    """Circuit breaker states for all sources, persisted between runs."""
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = path or config.CIRCUIT_STATE_FILE
+        self.lock = threading.RLock()
+        self.states = {}
+        if self.path.exists():
+            with open(self.path, "r") as f:
+                self.states = json.load(f)
+
+    def get(self, name: str) -> CircuitBreaker:
+        with self.lock:
+            state = self.states.setdefault(name, {
+                "state": CLOSED,
+                "failures": 0,
+                "opened_at": 0,
+                "cooldown": config.CIRCUIT_COOLDOWN,
+            })
+        return CircuitBreaker(name, state, self)
+
+    def save(self):
+        """Write all states atomically."""
+        with self.lock:
+            tmp_path = self.path.with_name(f".{self.path.name}.tmp")
+            with open(tmp_path, "w") as f:
+                json.dump(self.states, f, indent=2)
+            os.replace(tmp_path, self.path)
+
+
+_store: Optional[BreakerStore] = None
+retry_budget = RetryBudget()
+
+
+def get_breaker(name: str) -> CircuitBreaker:
+    """Circuit breaker for a source, backed by the shared state file."""
+    global _store
+    if _store is None:
+        _store = BreakerStore()
+    return _store.get(name)
+
+
+def save_breakers():
+    """Persist circuit states if any breaker was used."""
+    if _store is not None:
+        _store.save()
@@ -0,0 +1,172 @@
+"""Generic listing/detail scraper driven by declarative source specs."""
+
+from dataclasses import dataclass, field
+from typing import Iterator, Optional
+from urllib.parse import urljoin
+
+import lxml.html
+from lxml import etree
+from lxml.cssselect import CSSSelector
+
+import config
+from .base import BaseScraper, Job
+
+
+def _compile(selectors: list[str]) -> list[CSSSelector]:
+    return [CSSSelector(s, translator="html") for s in selectors]
+
+
+def _first(selectors: list[CSSSelector], element) -> Optional[etree._Element]:
+    """First match of the first selector that matches anything."""
+    for selector in selectors:
+        matches = selector(element)
+        if matches:
+            return matches[0]
+    return None
+
+
+def element_text(element) -> str:
+    """
+    Text of an element: its text nodes stripped and joined, as the old
+    BeautifulSoup scrapers read them. Job IDs hash the title, so this must
+    not change or every stored job comes back under a new ID.
+    """
+    return "".join(s.strip() for s in element.itertext() if s.strip())
+
+
+@dataclass
+class SourceSpec:
+    """
+    Where to find jobs on a source's pages.
+
+    Each selector is a list of CSS selector groups tried in order, so a
+    fallback is just another entry. Selectors are compiled to lxml XPath
+    once, when the spec is created.
+    """
+
+    queries: list[str]
+    listing: list[str]
+    title: list[str]
+    fields: dict[str, list[str]] = field(default_factory=dict)  # Job field -> selectors
+    defaults: dict[str, str] = field(default_factory=dict)
+    location_fallback: str = ""  # Stored when no location is found, after the pre-filter
+    description: list[str] = field(default_factory=list)
+    next_page: list[str] = field(default_factory=list)
+    listing_limit: int = 30
+    min_title_length: int = 1
+    description_limit: int = 5000
+
+    def __post_init__(self):
+        self.listing_selectors = _compile(self.listing)
+        self.title_selectors = _compile(self.title)
+        self.field_selectors = {name: _compile(s) for name, s in self.fields.items()}
+        self.description_selectors = _compile(self.description)
+        self.next_page_selectors = _compile(self.next_page)
+
+    def select_listings(self, doc) -> list:
+        for selector in self.listing_selectors:
+            items = selector(doc)
+            if items:
+                return items[:self.listing_limit]
+        return []
+
+
+class SpecScraper(BaseScraper):
+    """
+    Scraper for sources whose listing and detail pages a SourceSpec describes.
+
+    Pages are parsed once with lxml and queried with the spec's compiled
+    selectors. Subclasses only declare a spec, and override
+    finish_fields() for source-specific clean-up.
+    """
+
+    spec: SourceSpec
+
+    def default_queries(self) -> list[str]:
+        return self.spec.queries
+
+    def scrape_query(self, query: str) -> Iterator[Job]:
+        """Scrape jobs from one listing page and up to SCRAPER_MAX_PAGES after it."""
+        url = urljoin(self.base_url, query)
+
+        for _ in range(config.SCRAPER_MAX_PAGES):
+            try:
+                response = self.fetch(url)
+                doc = lxml.html.fromstring(response.content, base_url=url)
+                items = self.spec.select_listings(doc)
+            except Exception as e:
+                print(f"[{self.name}] Error scraping {query}: {e}")
+                return
+
+            for item in items:
+                job = self.parse_listing(item, url)
+                if job:
+                    yield job
+
+            next_link = _first(self.spec.next_page_selectors, doc)
+            if next_link is None or not next_link.get("href"):
+                return
+            url = urljoin(url, next_link.get("href"))
+
+    def parse_listing(self, item, page_url: str) -> Optional[Job]:
+        """Parse a job from one listing element."""
+        try:
+            link = _first(self.spec.title_selectors, item)
+            if link is None:
+                return None
+
+            title = element_text(link)
+            url = urljoin(page_url, link.get("href", ""))
+            if len(title) < self.spec.min_title_length or not url:
+                return None
+
+            fields = dict(self.spec.defaults)
+            for name, selectors in self.spec.field_selectors.items():
+                elem = _first(selectors, item)
+                if elem is not None:
+                    fields[name] = element_text(elem)
+            self.finish_fields(fields, item)
+
+            organization = fields.pop("organization", "Not specified")
+            location = fields.pop("location", "")
+
+            # Skip the detail page if the listing cannot reach the threshold
+            if not self._passes_prefilter(title, location, organization):
+                return None
+
+            return Job(
+                id=Job.generate_id(url, title),
+                title=title,
+                organization=organization,
+                location=location or self.spec.location_fallback,
+                description=self.get_description(url),
+                url=url,
+                source=self.name,
+                **fields,
+            )
+
+        except Exception as e:
+            print(f"[{self.name}] Error parsing listing: {e}")
+            return None
+
+    def finish_fields(self, fields: dict, item):
+        """Hook for source-specific fixes to the extracted fields."""
+
+    def get_description(self, url: str) -> str:
+        """Fetch the job description from its detail page."""
+        if not self.spec.description_selectors:
+            return ""
+        try:
+            response = self.fetch(url)
+            doc = lxml.html.fromstring(response.content)
+            elem = _first(self.spec.description_selectors, doc)
+            if elem is None:
+                return ""
+
+            etree.strip_elements(elem, "script", "style", with_tail=False)
+            text = "\n".join(s.strip() for s in elem.itertext() if s.strip())
+            return text[:self.spec.description_limit]
+
+        except Exception as e:
+            print(f"[{self.name}] Error fetching description: {e}")
+            return ""
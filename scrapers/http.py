@@ -0,0 +1,119 @@
+"""Shared HTTP client used by all scrapers."""
+
+import threading
+from typing import Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+import config
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+
+class HTTPClient:
+    """
+    One keep-alive connection pool per host, shared by every scraper.
+
+    Scrapers hitting the same host (listing pages then detail pages) reuse
+    warm connections instead of paying a TCP and TLS handshake per request.
+    Hosts listed in HTTP2_HOSTS go through an HTTP/2 client when httpx is
+    installed; responses are converted to requests.Response so callers see
+    one interface either way.
+    """
+
+    def __init__(self):
+        self.session = requests.Session()
+        self.session.headers.update({
+            "User-Agent": "curl/7.79.1",
+            "Accept": "*/*",
+        })
+        adapter = HTTPAdapter(
+            pool_connections=config.HTTP_POOL_HOSTS,
+            pool_maxsize=config.HTTP_POOL_SIZE,
+            pool_block=False,
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self._adapter = adapter
+
+        self._http2 = None
+        self._http2_requests = 0
+        if config.HTTP2_HOSTS and httpx:
+            try:
+                self._http2 = httpx.Client(http2=True, headers=dict(self.session.headers))
+            except ImportError:
+                print("[HTTP] h2 not installed, HTTP/2 disabled")
+
+    def get(self, url: str, timeout: float = None) -> requests.Response:
+        """GET a URL through the pooled session or the HTTP/2 client."""
+        timeout = timeout or config.REQUEST_TIMEOUT
+        if self._http2 and urlsplit(url).hostname in config.HTTP2_HOSTS:
+            return self._get_http2(url, timeout)
+        return self.session.get(url, timeout=timeout)
+
+    def _get_http2(self, url: str, timeout: float) -> requests.Response:
+        try:
+            r = self._http2.get(url, timeout=timeout, follow_redirects=True)
+        except httpx.TimeoutException as e:
+            raise requests.Timeout(str(e)) from e
+        except httpx.TransportError as e:
+            raise requests.ConnectionError(str(e)) from e
+
+        self._http2_requests += 1
+        response = requests.Response()
+        response.status_code = r.status_code
+        response.headers = CaseInsensitiveDict(r.headers)
+        response._content = r.content
+        response.encoding = r.encoding
+        response.url = str(r.url)
+        response.reason = r.reason_phrase
+        return response
+
+    def stats(self) -> dict:
+        """Requests and new connections per host, from urllib3's pools."""
+        hosts = {}
+        pools = self._adapter.poolmanager.pools
+        for key in list(pools.keys()):
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            host = hosts.setdefault(pool.host, {"requests": 0, "connections": 0})
+            host["requests"] += pool.num_requests
+            host["connections"] += pool.num_connections
+        for host in hosts.values():
+            host["reused"] = host["requests"] - host["connections"]
+        if self._http2_requests:
+            hosts["http2"] = {"requests": self._http2_requests}
+        return hosts
+
+    def report(self):
+        """Print connection reuse per host."""
+        for host, s in sorted(self.stats().items()):
+            if "connections" in s:
+                print(f"[HTTP] {host}: {s['requests']} requests over {s['connections']} connections")
+            else:
+                print(f"[HTTP] {host}: {s['requests']} requests")
+
+    def close(self):
+        self.session.close()
+        if self._http2:
+            self._http2.close()
+
+
+_client: Optional[HTTPClient] = None
+_client_lock = threading.Lock()
+
+
+def get_client() -> HTTPClient:
+    """Process-wide HTTP client."""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = HTTPClient()
+        return _client
@@ -0,0 +1,258 @@
+"""Job record and helpers for normalizing scraped fields."""
+
+import hashlib
+import re
+import sys
+from datetime import date, datetime, timedelta
+from typing import Callable, Optional
+
+
+def _intern(value):
+    return sys.intern(value) if type(value) is str else value
+
+
+class Job:
+    """
+    Represents a job posting.
+
+    Jobs are slotted, and strings repeated across thousands of postings
+    (source, organization, location, job type) are interned, so a bulk load
+    holds one copy of each. The description can be deferred to a loader
+    that runs on first access.
+    """
+
+    __slots__ = (
+        "id", "title", "organization", "location", "url", "source",
+        "posted_date", "deadline", "salary", "job_type", "experience_required",
+        "scraped_at", "score", "cover_letter_path", "content_hash", "deadline_date",
+        "_description", "_load_description",
+    )
+
+    def __init__(
+        self,
+        id: str,
+        title: str,
+        organization: str,
+        location: str,
+        description: str,
+        url: str,
+        source: str,
+        posted_date: Optional[str] = None,
+        deadline: Optional[str] = None,
+        salary: Optional[str] = None,
+        job_type: Optional[str] = None,  # Full-time, Part-time, Consultant
+        experience_required: Optional[str] = None,
+        scraped_at: Optional[str] = None,
+        score: Optional[float] = None,
+        cover_letter_path: Optional[str] = None,
+        content_hash: Optional[str] = None,
+        deadline_date: Optional[str] = None,  # ISO date parsed from deadline
+    ):
+        self.id = id
+        self.title = title
+        self.organization = _intern(organization)
+        self.location = _intern(location)
+        self._description = description
+        self._load_description = None
+        self.url = url
+        self.source = _intern(source)
+        self.posted_date = posted_date
+        self.deadline = deadline
+        self.salary = salary
+        self.job_type = _intern(job_type)
+        self.experience_required = experience_required
+        self.scraped_at = scraped_at or datetime.utcnow().isoformat()
+        self.score = score
+        self.cover_letter_path = cover_letter_path
+        self.content_hash = content_hash
+        self.deadline_date = deadline_date
+
+    @property
+    def description(self) -> str:
+        if self._description is None and self._load_description is not None:
+            self._description = self._load_description()
+        return self._description
+
+    @description.setter
+    def description(self, value: str):
+        self._description = value
+        self._load_description = None
+
+    @property
+    def description_loader(self) -> Optional[Callable[[], str]]:
+        """Loader the description came from, kept after it has run."""
+        return self._load_description
+
+    def defer_description(self, loader: Callable[[], str]):
+        """Load the description with loader the first time it is read."""
+        self._description = None
+        self._load_description = loader
+
+    def __repr__(self) -> str:
+        return f"Job(id={self.id!r}, title={self.title!r}, organization={self.organization!r}, source={self.source!r})"
+
+    def __eq__(self, other) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    __hash__ = None
+
+    def state(self) -> tuple:
+        """Every stored field, cheaply comparable to spot jobs changed since a load."""
+        description = self._load_description if self._load_description is not None else self._description
+        return (
+            self.id, self.title, self.organization, self.location, self.url, self.source,
+            self.posted_date, self.deadline, self.salary, self.job_type, self.experience_required,
+            self.scraped_at, self.score, self.cover_letter_path, self.content_hash, self.deadline_date,
+            description,
+        )
+
+    def to_dict(self, description: bool = True) -> dict:
+        """Convert to dictionary, optionally leaving out the description."""
+        data = {
+            "id": self.id,
+            "title": self.title,
+            "organization": self.organization,
+            "location": self.location,
+            "url": self.url,
+            "source": self.source,
+            "posted_date": self.posted_date,
+            "deadline": self.deadline,
+            "salary": self.salary,
+            "job_type": self.job_type,
+            "experience_required": self.experience_required,
+            "scraped_at": self.scraped_at,
+            "score": self.score,
+            "cover_letter_path": self.cover_letter_path,
+            "content_hash": self.content_hash,
+            "deadline_date": self.deadline_date,
+        }
+        if description:
+            data["description"] = self.description
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Job":
+        """Create from dictionary, ignoring unknown keys."""
+        job = cls.__new__(cls)
+        get = data.get
+        job.id = data["id"]
+        job.title = data["title"]
+        job.organization = _intern(data["organization"])
+        job.location = _intern(data["location"])
+        job._description = get("description", "")
+        job._load_description = None
+        job.url = data["url"]
+        job.source = _intern(data["source"])
+        job.posted_date = get("posted_date")
+        job.deadline = get("deadline")
+        job.salary = get("salary")
+        job.job_type = _intern(get("job_type"))
+        job.experience_required = get("experience_required")
+        job.scraped_at = get("scraped_at") or datetime.utcnow().isoformat()
+        job.score = get("score")
+        job.cover_letter_path = get("cover_letter_path")
+        job.content_hash = get("content_hash")
+        job.deadline_date = get("deadline_date")
+        return job
+
+    @staticmethod
+    def generate_id(url: str, title: str) -> str:
+        """Generate unique ID from URL and title."""
+        content = f"{url}:{title}".encode()
+        return hashlib.md5(content).hexdigest()[:12]
+
+    def compute_content_hash(self) -> str:
+        """Fingerprint of the posting's content, ignoring whitespace and case."""
+        fields = (self.title, self.organization, self.location, self.deadline, self.description)
+        content = "\x1f".join(_normalize(f) for f in fields).encode()
+        return hashlib.md5(content).hexdigest()[:16]
+
+    def repost_key(self) -> Optional[str]:
+        """Organization and description fingerprint, to spot re-posts under a new title or URL."""
+        description = _normalize(self.description)
+        if len(description) < 200:
+            return None  # Too little text to tell postings apart
+        content = f"{_normalize(self.organization)}\x1f{description}".encode()
+        return hashlib.md5(content).hexdigest()[:16]
+
+
+def _normalize(text: Optional[str]) -> str:
+    return " ".join((text or "").lower().split())
+
+
+_MONTHS = {
+    name: number
+    for number, names in enumerate((
+        "jan january", "feb february", "mar march", "apr april", "may", "jun june",
+        "jul july", "aug august", "sep sept september", "oct october", "nov november",
+        "dec december",
+    ), start=1)
+    for name in names.split()
+}
+_MONTH = r"(" + "|".join(sorted(_MONTHS, key=len, reverse=True)) + r")\.?"
+_DAY = r"(?<!\d)(\d{1,2})(?:st|nd|rd|th)?"
+_YEAR = r"(?:,?[\s/.-]+(\d{4}))?(?!\d)"
+
+# Day, month and year groups of each accepted form. Numeric dates are day
+# first, and without a year need a slash or dot so ranges like "2-3 weeks"
+# are not read as dates. Compiled on first use, as lookups never parse dates.
+_DATE_FORMS = [
+    (_DAY + r"[\s-]+(?:of\s+)?" + _MONTH + _YEAR + r"\b", (1, 2, 3)),
+    (r"\b" + _MONTH + r"\s+" + _DAY + r"\b" + _YEAR, (2, 1, 3)),
+    (r"(?<!\d)(\d{1,2})[/.-](\d{1,2})[/.-](\d{4})(?!\d)", (1, 2, 3)),
+    (r"(?<!\d)(\d{1,2})[/.](\d{1,2})(?![/.]?\d)(?!\s*(?:days?|weeks?|months?|years?)\b)()", (1, 2, 3)),
+]
+
+
+def _find_date(text: str) -> Optional[tuple[int, int, Optional[int]]]:
+    """Day, month and year (None if not given) of the first date in text."""
+    found = []
+    for pattern, (day, month, year) in _DATE_FORMS:
+        match = re.search(pattern, text, re.IGNORECASE)
+        if match:
+            found.append((match.start(), match.group(day), match.group(month), match.group(year)))
+    if not found:
+        return None
+    _, day, month, year = min(found)
+    month = _MONTHS[month.lower()] if not month.isdigit() else int(month)
+    return int(day), month, int(year) if year else None
+
+
+def parse_deadline(text: Optional[str], today: Optional[date] = None) -> Optional[str]:
+    """
+    Normalize a free-text deadline ("Closing date: 30 Nov 2026", "15 Nov",
+    "30/11/2026", "2026-12-01") to an ISO date. Numeric dates are read day
+    first. A date without a year is taken in the current year, or the next
+    one if it would be long past. Returns None for text without a date, such
+    as "Open until filled" or "3 months", and for dates outside one year back
+    to two years ahead, which are misreadings rather than deadlines.
+    """
+    if not text or not re.search(r"\d", text):
+        return None
+
+    today = today or date.today()
+    iso = re.search(r"(?<!\d)\d{4}-\d{2}-\d{2}(?!\d)", text)
+    try:
+        if iso:
+            parsed = date.fromisoformat(iso.group())
+        else:
+            found = _find_date(text)
+            if found is None:
+                return None
+            day, month, year = found
+            parsed = date(year or today.year, month, day)
+            if year is None and parsed < today - timedelta(days=180):
+                parsed = parsed.replace(year=parsed.year + 1)
+    except ValueError:
+        return None
+
+    if not today - timedelta(days=365) <= parsed <= today + timedelta(days=730):
+        return None
+    return parsed.isoformat()
+
+
+def is_exact_deadline(text: Optional[str]) -> bool:
+    """Whether a deadline states its year, so its parsed date is not a guess."""
+    return bool(text and re.search(r"(?<!\d)\d{4}(?!\d)", text))
@@ -0,0 +1,117 @@
+"""Query planner deriving each source's search URLs from CV profiles."""
+
+import re
+import time
+from itertools import chain, zip_longest
+from pathlib import Path
+from typing import Iterable, Optional
+from urllib.parse import quote_plus
+
+import config
+from .base import BaseScraper
+
+
+def _words(text: str) -> frozenset[str]:
+    """Normalized word set of a role, used to compare queries."""
+    return frozenset(re.findall(r"[a-z0-9&]+", text.lower()))
+
+
+class QueryPlanner:
+    """
+    Turn the target roles and locations of one or more profiles into queries.
+
+    Roles and locations from all profiles are merged: duplicates collapse to
+    one query, regions expand to their countries, and a keyword query is
+    dropped when a broader one covers it (searching "country director"
+    already returns every "deputy country director" posting).
+
+    A source never gets more queries per run than its built-in list. Default
+    queries no template can produce, such as UNJobs duty-station pages, are
+    kept. Location and role queries alternate, and when there are more than
+    fit, each run takes the next window of them
+    (QUERY_PLANNER_ROTATION_PERIOD), so every role and location is searched
+    within a few runs.
+    """
+
+    def __init__(self, profiles: Iterable):
+        profiles = list(profiles)
+        self.roles = self.merge_roles(r for p in profiles for r in p.target_roles)
+        self.locations = self.merge_locations(l for p in profiles for l in p.target_locations)
+
+    @staticmethod
+    def merge_roles(roles: Iterable[str]) -> list[str]:
+        """Unique roles, without those subsumed by a broader role."""
+        unique = {}
+        for role in roles:
+            key = _words(role)
+            if key and key not in unique:
+                unique[key] = role.strip()
+        return [role for key, role in unique.items() if not any(other < key for other in unique)]
+
+    @staticmethod
+    def merge_locations(locations: Iterable[str]) -> list[str]:
+        """Unique countries, with regions expanded and non-places dropped."""
+        merged = []
+        seen = set()
+        for location in locations:
+            if location.lower() in config.NON_GEOGRAPHIC_LOCATIONS:
+                continue
+            for country in config.REGION_COUNTRIES.get(location, [location]):
+                if country.lower() not in seen:
+                    seen.add(country.lower())
+                    merged.append(country)
+        return merged
+
+    def plan(self, scraper: BaseScraper, now: Optional[float] = None) -> Optional[list[str]]:
+        """Queries for one source, or None if it has no query templates."""
+        templates = [t for t in (scraper.LOCATION_QUERY, scraper.KEYWORD_QUERY) if t]
+        if not templates:
+            return None
+
+        defaults = scraper.default_queries()
+        prefixes = [t.split("{}")[0] for t in templates]
+        kept = [q for q in defaults if not any(q.startswith(p) for p in prefixes)]
+
+        locations, roles = [], []
+        if scraper.LOCATION_QUERY:
+            locations = [scraper.LOCATION_QUERY.format(quote_plus(loc)) for loc in self.locations]
+        if scraper.KEYWORD_QUERY:
+            for role in self.roles:
+                keywords = f"{role} {config.QUERY_PLANNER_KEYWORD_SCOPE}".strip().lower()
+                roles.append(scraper.KEYWORD_QUERY.format(quote_plus(keywords)))
+        planned = [q for q in chain.from_iterable(zip_longest(locations, roles)) if q]
+        planned = [q for q in dict.fromkeys(planned) if q not in kept]
+
+        cap = min(config.QUERY_PLANNER_MAX_QUERIES, len(defaults) or config.QUERY_PLANNER_MAX_QUERIES)
+        limit = max(cap - len(kept), 0)
+        if len(planned) <= limit:
+            return kept + planned
+        if not limit:
+            print(f"[Planner] {scraper.name}: no room for planned queries beside its fixed pages")
+            return kept
+
+        runs = -(-len(planned) // limit)
+        print(f"[Planner] {scraper.name}: {len(planned)} planned queries, {limit} per run; "
+              f"all are covered every {runs} runs")
+        period = int((time.time() if now is None else now) // config.QUERY_PLANNER_ROTATION_PERIOD)
+        start = period * limit % len(planned)
+        return kept + (planned + planned)[start:start + limit]
+
+
+def plan_queries(scrapers: list[BaseScraper], profile_paths: Optional[list[Path]] = None):
+    """Replace each scraper's default queries with ones planned from profiles."""
+    from matcher import CVProfile
+
+    try:
+        profiles = [CVProfile.load(path) for path in (profile_paths or config.QUERY_PLANNER_PROFILES)]
+    except FileNotFoundError as e:
+        print(f"[Planner] {e}; using default queries")
+        return
+
+    planner = QueryPlanner(profiles)
+    for scraper in scrapers:
+        queries = planner.plan(scraper)
+        if queries is not None:
+            scraper.query_overrides = queries
+            print(f"[Planner] {scraper.name}: {len(queries)} queries "
+                  f"(was {len(scraper.default_queries())})")
@@ -2,7 +2,7 @@
 
 import re
 from datetime import datetime
-from typing import Optional
+from typing import Iterator, Optional
 from urllib.parse import quote
 
 import feedparser
@@ -17,6 +17,9 @@ class ReliefWebScraper(BaseScraper):
     name = "reliefweb"
     base_url = "https://reliefweb.int"
 
+    # Templates for queries planned from the CV profile
+    LOCATION_QUERY = "https://reliefweb.int/jobs/rss.xml?search=country.exact%3A%22{}%22"
+
     # RSS feed URLs for target countries
     RSS_FEEDS = [
         "https://reliefweb.int/jobs/rss.xml?search=country.exact%3A%22Ethiopia%22",
@@ -26,28 +29,16 @@ class ReliefWebScraper(BaseScraper):
         "https://reliefweb.int/jobs/rss.xml?search=country.exact%3A%22Uganda%22",
     ]
 
-    def scrape(self) -> list[Job]:
-        """Scrape jobs from ReliefWeb RSS feeds."""
-        jobs = []
-
-        for feed_url in self.RSS_FEEDS:
-            feed_jobs = self._scrape_feed(feed_url)
-            jobs.extend(feed_jobs)
-
-        # Remove duplicates based on ID
-        seen = set()
-        unique_jobs = []
-        for job in jobs:
-            if job.id not in seen:
-                seen.add(job.id)
-                unique_jobs.append(job)
+    def default_queries(self) -> list[str]:
+        """RSS feeds polled for this source."""
+        return self.RSS_FEEDS
 
-        return unique_jobs
+    def scrape_query(self, query: str) -> Iterator[Job]:
+        """Scrape jobs from one RSS feed."""
+        return self._scrape_feed(query)
 
-    def _scrape_feed(self, feed_url: str) -> list[Job]:
+    def _scrape_feed(self, feed_url: str) -> Iterator[Job]:
         """Scrape jobs from a single RSS feed."""
-        jobs = []
-
         try:
             # Use session to fetch with proper headers
             response = self.fetch(feed_url)
@@ -56,13 +47,11 @@ class ReliefWebScraper(BaseScraper):
             for entry in feed.entries[:30]:  # Limit per feed
                 job = self._parse_entry(entry)
                 if job:
-                    jobs.append(job)
+                    yield job
 
         except Exception as e:
             print(f"[{self.name}] Error scraping feed: {e}")
 
-        return jobs
-
     def _parse_entry(self, entry) -> Optional[Job]:
         """Parse a job from RSS entry."""
         try:
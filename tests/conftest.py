@@ -0,0 +1,23 @@
+"""Shared fixtures: tests run against a scratch data directory."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import config
+
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    """Point every config path under data/ at a temporary directory."""
+    for name, value in list(vars(config).items()):
+        if isinstance(value, Path) and value.is_relative_to(config.DATA_DIR) and value != config.DATA_DIR:
+            monkeypatch.setattr(config, name, tmp_path / value.relative_to(config.DATA_DIR))
+    monkeypatch.setattr(config, "DATA_DIR", tmp_path)
+    monkeypatch.setattr("pipeline.descriptions._store", None)  # Bound to the old path
+    monkeypatch.setattr("pipeline.store._stale_shards", set())
+    return tmp_path
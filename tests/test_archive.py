@@ -0,0 +1,52 @@
+"""Response archive replay of past fetches."""
+
+from datetime import datetime, timedelta
+
+import requests
+
+from scrapers import archive as archive_module
+from scrapers.archive import ResponseArchive
+
+
+def _response(body: str) -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response._content = body.encode()
+    response.encoding = "utf-8"
+    return response
+
+
+def _clock(monkeypatch):
+    times = iter(datetime(2026, 10, 1) + timedelta(minutes=i) for i in range(100))
+
+    class Clock(datetime):
+        @classmethod
+        def utcnow(cls):
+            return next(times)
+
+    monkeypatch.setattr(archive_module, "datetime", Clock)
+
+
+def test_replays_every_listing_version(data_dir, monkeypatch):
+    _clock(monkeypatch)
+    archive = ResponseArchive()
+    # Three runs; the listing is unchanged in the second
+    archive.record("devex", "q", "https://x/list", _response("list v1"))
+    archive.record("devex", "q", "https://x/job/1", _response("job 1 v1"))
+    archive.record("devex", "q", "https://x/list", _response("list v1"))
+    archive.record("devex", "q", "https://x/job/1", _response("job 1 v1"))
+    archive.record("devex", "q", "https://x/list", _response("list v2"))
+    archive.record("devex", "q", "https://x/job/1", _response("job 1 v2"))
+    archive.record("unjobs", "u", "https://y/list", _response("other"))
+
+    reloaded = ResponseArchive()
+    snapshots = reloaded.snapshots("devex")
+    assert [query for query, _ in snapshots] == ["q", "q"]
+    assert reloaded.queries("devex") == ["q"]
+
+    first, second = (reloaded.as_of(fetched_at) for _, fetched_at in snapshots)
+    assert first.response("https://x/list").text == "list v1"
+    assert first.response("https://x/job/1").text == "job 1 v1"
+    assert second.response("https://x/list").text == "list v2"
+    assert second.response("https://x/job/1").text == "job 1 v2"
+    assert reloaded.response("https://x/job/1").text == "job 1 v2"
@@ -0,0 +1,36 @@
+"""Tests for scrape-time change detection."""
+
+from pipeline.changes import ChangeDetector, MODIFIED, UNCHANGED
+from scrapers.job import Job
+
+
+def _job(description: str, deadline: str = "30 Nov 2026") -> Job:
+    return Job(
+        id="job-1", title="Country Director", organization="NRC", location="Nairobi",
+        description=description, url="https://example.org/jobs/1", source="devex",
+        deadline=deadline,
+    )
+
+
+def test_failed_detail_fetch_leaves_the_stored_job_alone():
+    stored = _job("Lead the country programme.")
+    stored.score = 82.0
+    stored.cover_letter_path = "letters/job-1.md"
+    detector = ChangeDetector([stored])
+
+    status, job = detector.apply(_job(""))
+
+    assert status == UNCHANGED
+    assert job.description == "Lead the country programme."
+    assert job.score == 82.0
+    assert job.cover_letter_path == "letters/job-1.md"
+
+
+def test_edit_without_a_description_keeps_the_stored_one():
+    detector = ChangeDetector([_job("Lead the country programme.")])
+
+    status, job = detector.apply(_job("", deadline="15 Dec 2026"))
+
+    assert status == MODIFIED
+    assert job.deadline == "15 Dec 2026"
+    assert job.description == "Lead the country programme."
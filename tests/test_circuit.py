@@ -0,0 +1,23 @@
+"""Tests for circuit breaker persistence."""
+
+import json
+
+import config
+from scrapers.job import Job
+from scrapers.unjobs import UNJobsScraper
+
+
+def test_stream_closed_early_still_saves_breakers(data_dir, monkeypatch):
+    monkeypatch.setattr("scrapers.circuit._store", None)  # Bound to the old path
+    scraper = UNJobsScraper()
+    scraper.iter_jobs = lambda: (
+        Job(id=str(i), title="Driver", organization="WFP", location="Lima", description="",
+            url=f"https://unjobs.org/vacancies/{i}", source=scraper.name)
+        for i in range(3)
+    )
+
+    stream = scraper.stream()
+    next(stream)
+    stream.close()
+
+    assert scraper.name in json.loads(config.CIRCUIT_STATE_FILE.read_text())
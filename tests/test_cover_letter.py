@@ -0,0 +1,78 @@
+"""Tests for the streaming cover letter generator."""
+
+import pytest
+
+import config
+from generator import cover_letter
+from generator.cover_letter import CoverLetterGenerator
+from matcher.profile import CVProfile
+from scrapers.job import Job
+
+
+@pytest.fixture
+def profile():
+    return CVProfile(name="A. Candidate", skills=["Budget management"], donors_experience=["ECHO"])
+
+
+@pytest.fixture
+def job():
+    return Job(
+        id="job-1", title="Country Director", organization="NRC", location="Nairobi",
+        description="Lead the country programme.", url="https://example.org/1", source="devex", score=82.0,
+    )
+
+
+def test_missing_package_is_reported_as_such(data_dir, profile, job, monkeypatch, capsys):
+    monkeypatch.setattr(cover_letter, "genai", None)
+    monkeypatch.setattr(config, "GOOGLE_API_KEY", "key")
+
+    generator = CoverLetterGenerator(profile)
+
+    assert generator.generate_and_save(job) is None
+    out = capsys.readouterr().out
+    assert "google-generativeai is not installed" in out
+    assert "API key" not in out
+
+
+class Chunk:
+    def __init__(self, text):
+        self.text = text
+
+
+class FakeModel:
+    def __init__(self, chunks):
+        self.chunks = chunks
+        self.prompts = []
+
+    def generate_content(self, prompt, stream=False):
+        self.prompts.append(prompt)
+        return [Chunk(text) for text in self.chunks]
+
+
+def _interrupted(generator, job, text="Dear Hiring Manager,\nI led"):
+    part_path = generator._partial_path(job)
+    part_path.write_text(generator._letter_header(job) + text)
+    return part_path
+
+
+def test_resume_completes_the_letter(data_dir, profile, job):
+    generator = CoverLetterGenerator(profile)
+    generator.model = FakeModel([" NRC's response", " in Somalia."])
+    part_path = _interrupted(generator, job)
+
+    path = generator.generate_and_save(job)
+
+    assert path is not None and not part_path.exists()
+    assert "Dear Hiring Manager,\nI led NRC's response in Somalia." in path.read_text()
+    assert "Dear Hiring Manager,\nI led" in generator.model.prompts[0]
+
+
+def test_empty_resume_keeps_the_partial_letter(data_dir, profile, job):
+    generator = CoverLetterGenerator(profile)
+    generator.model = FakeModel([])
+    part_path = _interrupted(generator, job)
+    before = part_path.read_text()
+
+    assert generator.generate_and_save(job) is None
+    assert part_path.read_text() == before
+    assert not list(generator.output_dir.glob("*.md"))
@@ -0,0 +1,89 @@
+"""Tests for deadline parsing and archival of closed postings."""
+
+from datetime import date, timedelta
+
+import pytest
+
+from pipeline.expiry import DeadlineIndex, archive_expired
+from scrapers.base import BaseScraper
+from scrapers.job import Job, parse_deadline
+
+TODAY = date(2026, 10, 18)
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("Closing date: 30 Nov 2026", "2026-11-30"),
+    ("30/11/2026", "2026-11-30"),
+    ("2026-12-01", "2026-12-01"),
+    ("Nov 30, 2026", "2026-11-30"),
+    ("15 Nov", "2026-11-15"),
+    ("apply by 5 January", "2027-01-05"),
+    # Stray numbers are not years
+    ("2 positions, closes 30 Nov", "2026-11-30"),
+    ("1 year contract, deadline 12 Dec", "2026-12-12"),
+    ("2 positions, closes 30 Nov 2026", "2026-11-30"),
+    # Durations and implausible dates are not deadlines
+    ("2-3 weeks", None),
+    ("3 months", None),
+    ("Open until filled", None),
+    ("30 Nov 1999", None),
+    ("30 Nov 2031", None),
+])
+def test_parse_deadline(text, expected):
+    assert parse_deadline(text, TODAY) == expected
+
+
+class FakeContext:
+    def __init__(self, jobs):
+        self.matches = []
+        self.jobs = jobs
+
+    @property
+    def jobs(self):
+        return self._jobs
+
+    @jobs.setter
+    def jobs(self, jobs):
+        self._jobs = jobs
+        self.deadlines = DeadlineIndex(jobs)
+
+
+def _job(job_id: str, deadline: str, scraped_at: str = "2026-10-01T00:00:00") -> Job:
+    return Job(
+        id=job_id, title="Programme Manager", organization="NRC", location="Nairobi",
+        description="", url=f"https://example.org/{job_id}", source="devex",
+        deadline=deadline, scraped_at=scraped_at,
+    )
+
+
+def test_archive_expired_keeps_guessed_deadlines_through_the_grace_period(data_dir):
+    misread = _job("misread", "2 positions, closes 30 Nov")
+    misread.deadline_date = "2002-11-30"  # From the old parser
+    ctx = FakeContext([
+        misread,
+        _job("closed", "Closing date: 10 Oct 2026"),
+        _job("guessed", "10 Oct"),
+        _job("stale", "1 Sep", scraped_at="2026-08-20T00:00:00"),
+    ])
+
+    expired = archive_expired(ctx, TODAY)
+
+    assert sorted(job.id for job in expired) == ["closed", "stale"]
+    assert sorted(job.id for job in ctx.jobs) == ["guessed", "misread"]
+    assert misread.deadline_date == "2026-11-30"
+
+
+def test_scraping_drops_only_listings_that_certainly_closed(data_dir):
+    past = date.today() - timedelta(days=3)
+
+    class Scraper(BaseScraper):
+        name = "fake"
+
+        def default_queries(self):
+            return ["q"]
+
+        def scrape_query(self, query):
+            yield _job("closed", past.strftime("%d %b %Y"))
+            yield _job("guessed", past.strftime("%d %b"))
+
+    assert [job.id for job in Scraper().iter_jobs()] == ["guessed"]
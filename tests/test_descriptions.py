@@ -0,0 +1,71 @@
+"""Tests for the deduplicated description store."""
+
+import json
+from datetime import datetime
+
+import config
+from pipeline import descriptions
+from pipeline.descriptions import DescriptionStore
+from scrapers.job import Job
+
+DISCLAIMER = "UNICEF is a smoke-free environment."
+
+
+def _job(job_id: str, description: str) -> Job:
+    return Job(
+        id=job_id, title="Nutrition Specialist", organization="UNICEF", location="Nairobi",
+        description=description, url=f"https://example.org/{job_id}", source="unjobs",
+    )
+
+
+def test_codec_is_pinned_by_the_first_save(data_dir, monkeypatch):
+    store = DescriptionStore()
+    store.refs(_job("a", "Lead the nutrition programme."))
+    store.save()
+
+    monkeypatch.setattr(config, "DESCRIPTION_CODEC", "zstd")
+    store = DescriptionStore()
+    refs = store.refs(_job("b", "Support the cluster."))
+    store.save()
+
+    manifest = json.loads(store.manifest_path.read_text())
+    assert manifest["codec"] == "zlib"
+    assert {s["codec"] for s in manifest["segments"].values()} == {"zlib"}
+    assert DescriptionStore().text(refs) == "Support the cluster."
+
+
+def test_body_is_the_same_before_and_after_a_reload(data_dir):
+    store = DescriptionStore()
+    jobs = [_job(str(i), f"Duty {i}.\n{DISCLAIMER}") for i in range(config.DESCRIPTION_BOILERPLATE_MIN_JOBS)]
+    all_refs = [store.refs(job) for job in jobs]
+    store.recount(all_refs)
+    store.save()
+
+    fresh = _job("new", f"Design the survey.\n{DISCLAIMER}")
+    reloaded = _job("new", "")
+    reloaded.defer_description(store.loader(store.refs(fresh)))
+
+    assert store.body(fresh) == "Design the survey."
+    assert store.body(reloaded) == store.body(fresh)
+
+
+def test_saves_never_rewrite_an_earlier_days_segment(data_dir, monkeypatch):
+    days = iter([datetime(2026, 10, 17, 6), datetime(2026, 10, 18, 6)])
+
+    class Clock(datetime):
+        @classmethod
+        def utcnow(cls):
+            return next(days)
+
+    monkeypatch.setattr(descriptions, "datetime", Clock)
+    store = DescriptionStore()
+    store.refs(_job("a", "Lead the nutrition programme."))
+    store.save()
+    first = {p.name: p.read_bytes() for p in store.path.glob("*.json.zlib")}
+
+    store.refs(_job("b", "Support the cluster."))
+    store.save()
+
+    assert list(first) == ["2026-10-17.json.zlib"]
+    assert (store.path / "2026-10-17.json.zlib").read_bytes() == first["2026-10-17.json.zlib"]
+    assert (store.path / "2026-10-18.json.zlib").exists()
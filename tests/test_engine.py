@@ -0,0 +1,30 @@
+"""Tests for the spec-driven HTML scrapers."""
+
+import lxml.html
+
+from scrapers.job import Job
+from scrapers.unjobs import UNJobsScraper
+
+ROW = """
+<table><tr>
+  <td><a href="/vacancies/123">Programme <b>Officer</b></a></td>
+  <td>UNICEF</td>
+</tr></table>
+"""
+
+
+def test_listing_text_and_prefilter_location_match_the_old_scraper(data_dir):
+    scraper = UNJobsScraper()
+    seen = []
+    scraper.prefilter = lambda title, location, organization: seen.append(location) or True
+    scraper.get_description = lambda url: "Run the programme."
+
+    item = lxml.html.fromstring(ROW).find(".//tr")
+    job = scraper.parse_listing(item, "https://unjobs.org/search?q=kenya")
+
+    # Job IDs hash the title, so it must read as the old parser read it
+    assert job.title == "ProgrammeOfficer"
+    assert job.id == Job.generate_id("https://unjobs.org/vacancies/123", "ProgrammeOfficer")
+    assert job.organization == "UNICEF"
+    assert seen == [""]
+    assert job.location == "UN Duty Station"
@@ -0,0 +1,61 @@
+"""Tests for the query planner."""
+
+import config
+from matcher.profile import CVProfile
+from scrapers.planner import QueryPlanner
+
+
+class FakeScraper:
+    name = "fake"
+    LOCATION_QUERY = "/search?country={}"
+    KEYWORD_QUERY = "/search?keyword={}"
+
+    def __init__(self, defaults):
+        self.defaults = defaults
+
+    def default_queries(self):
+        return self.defaults
+
+
+ROLES = [f"Role {chr(ord('A') + i)}" for i in range(8)]
+LOCATIONS = ["Ethiopia", "Kenya", "Uganda"]
+
+
+def planner() -> QueryPlanner:
+    return QueryPlanner([CVProfile(target_roles=ROLES, target_locations=LOCATIONS)])
+
+
+def test_never_more_queries_than_the_built_in_list():
+    scraper = FakeScraper(["/search?country=Ethiopia", "/search?keyword=x", "/search?keyword=y"])
+
+    assert len(planner().plan(scraper, now=0)) == 3
+
+
+def test_locations_and_roles_alternate():
+    scraper = FakeScraper(["/search?country=x"] * 4)
+
+    queries = planner().plan(scraper, now=0)
+
+    assert [q.split("?")[1].split("=")[0] for q in queries] == ["country", "keyword", "country", "keyword"]
+
+
+def test_rotation_covers_every_role_and_location(capsys):
+    scraper = FakeScraper(["/search?country=x"] * 4)
+    p = planner()
+
+    covered = set()
+    for run in range(3):
+        covered.update(p.plan(scraper, now=run * config.QUERY_PLANNER_ROTATION_PERIOD))
+
+    assert len(covered) == len(ROLES) + len(LOCATIONS)
+    assert "11 planned queries, 4 per run; all are covered every 3 runs" in capsys.readouterr().out
+
+
+def test_fixed_pages_are_kept():
+    scraper = FakeScraper(["/duty_stations/addis-ababa", "/search?country=x", "/search?country=y"])
+    scraper.KEYWORD_QUERY = None
+
+    queries = planner().plan(scraper, now=0)
+
+    assert queries[0] == "/duty_stations/addis-ababa"
+    assert len(queries) == 3
@@ -0,0 +1,19 @@
+"""Tests for adaptive polling."""
+
+from pipeline.polling import PollScheduler
+
+
+class FakeScraper:
+    name = "devex"
+
+
+def test_report_prints_per_source_totals(data_dir, capsys):
+    scheduler = PollScheduler(known_ids=["old"])
+    scheduler.record(FakeScraper(), "/jobs?q=director", ["old", "new1", "new2"], 1.0, 2, 0)
+    scheduler.record(FakeScraper(), "/jobs?q=manager", [], 3.0, 2, 1)
+
+    assert scheduler.summary("devex") == {
+        "fetches": 2, "new_jobs": 2, "avg_latency": 2.0, "error_rate": 0.25,
+    }
+    scheduler.report()
+    assert "[Poll] devex: 2 new jobs over 2 fetches, 2.0s average, 25% errors" in capsys.readouterr().out
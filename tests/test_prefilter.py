@@ -0,0 +1,86 @@
+"""Tests for the listing pre-filter."""
+
+import lxml.html
+import pytest
+
+import config
+from matcher.profile import CVProfile
+from matcher.scorer import JobScorer
+from scrapers.unjobs import UNJobsScraper
+
+
+@pytest.fixture
+def profile():
+    return CVProfile(
+        target_roles=["Country Director"], target_locations=["Ethiopia"],
+        skills=["Budget management"], donors_experience=["ECHO", "EU"],
+    )
+
+
+ROW = """
+<table><tr>
+  <td><a href="/vacancies/42">Driver</a></td>
+  <td><span class="location">Lima, Peru</span></td>
+</tr></table>
+"""
+
+
+def _parse_row(profile):
+    scraper = UNJobsScraper()
+    fetched = []
+    scraper.get_description = lambda url: fetched.append(url) or "Drive the team."
+    JobScorer(profile).attach_prefilter([scraper])
+    job = scraper.parse_listing(lxml.html.fromstring(ROW).find(".//tr"), "https://unjobs.org/search?q=peru")
+    return scraper, job, fetched
+
+
+def test_default_config_flags_a_listing_that_cannot_match(data_dir, profile, monkeypatch, capsys):
+    monkeypatch.delenv("PREFILTER_MODE", raising=False)
+
+    scraper, job, fetched = _parse_row(profile)
+
+    # Audit by default: still fetched, but logged as a skip
+    assert job is not None and fetched
+    assert scraper.prefiltered == 1
+    assert "Would skip: Driver (Lima, Peru)" in capsys.readouterr().out
+
+
+def test_on_mode_skips_the_detail_fetch(data_dir, profile, monkeypatch):
+    monkeypatch.setenv("PREFILTER_MODE", "on")
+    monkeypatch.setattr(config, "PREFILTER_MODE", "on")
+
+    scraper, job, fetched = _parse_row(profile)
+
+    assert job is None and not fetched
+    assert scraper.prefiltered == 1
+
+
+def test_listings_that_can_match_pass(data_dir, profile):
+    scorer = JobScorer(profile)
+
+    assert scorer.passes_prefilter("Country Director", "Addis Ababa, Ethiopia")
+    assert scorer.passes_prefilter("Senior Programme Manager", "Lima, Peru")
+    assert not scorer.passes_prefilter("Driver", "Lima, Peru")
+
+
+def test_true_ceilings_never_skip(data_dir, profile):
+    profile.prefilter = {"ceilings": {"skills": 100, "experience": 100, "donor": 100}}
+    scorer = JobScorer(profile)
+
+    # Worst listing: no title match, unknown location, no donor in the name
+    assert scorer.max_reachable_score("Driver", "Lima, Peru") >= 56
+
+
+def test_profile_caps_the_donor_ceiling(data_dir, profile):
+    before = JobScorer(profile).max_reachable_score("Driver", "Lima, Peru")
+    profile.donors_experience = []
+
+    assert JobScorer(profile).max_reachable_score("Driver", "Lima, Peru") == before - 4
+
+
+def test_lowered_ceilings_are_lossy(data_dir, profile):
+    profile.prefilter = {"ceilings": {"skills": 30, "experience": 40, "donor": 30}}
+    scorer = JobScorer(profile)
+
+    assert not scorer.passes_prefilter("Driver", "Lima, Peru")
+    assert scorer.passes_prefilter("Country Director", "Addis Ababa, Ethiopia")
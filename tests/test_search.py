@@ -0,0 +1,45 @@
+"""Tests for the full-text search index."""
+
+import pytest
+
+import main
+from pipeline import PipelineContext
+from pipeline.store import save_jobs, save_matches
+from scrapers.job import Job
+
+
+def _job(job_id: str, title: str, organization: str = "WFP") -> Job:
+    return Job(
+        id=job_id, title=title, organization=organization, location="Nairobi",
+        description="", url=f"https://example.org/{job_id}", source="devex",
+    )
+
+
+def test_index_catches_up_with_a_store_changed_elsewhere(data_dir, monkeypatch):
+    monkeypatch.setattr("config.DESCRIPTION_STORE", False)
+    save_jobs([_job("a", "Logistics Officer")])
+    assert [hit["id"] for hit in main._open_search_index().search("logistics")] == ["a"]
+
+    # e.g. job data pulled from the scrape workflow, which skips the index
+    save_jobs([_job("a", "Logistics Officer"), _job("b", "Logistics Manager")])
+
+    hits = main._open_search_index().search("logistics")
+    assert sorted(hit["id"] for hit in hits) == ["a", "b"]
+
+
+@pytest.mark.parametrize("term", ["Direct", "Norweg", "country dir", "gian Refugee", "nrc-1"])
+def test_apply_finds_jobs_by_partial_words(data_dir, term):
+    director = _job("nrc-1", "Country Director", "Norwegian Refugee Council")
+    save_jobs([director, _job("wfp-1", "Logistics Officer")])
+    save_matches([director])
+
+    job = main._find_job(term, PipelineContext())
+
+    assert job is not None and job.id == "nrc-1"
+
+
+@pytest.mark.parametrize("term", ["Direct", "Norweg", "country dir", "organization:norw"])
+def test_search_matches_word_prefixes(data_dir, term):
+    save_jobs([_job("nrc-1", "Country Director", "Norwegian Refugee Council")])
+
+    assert [hit["id"] for hit in main._open_search_index().search(term)] == ["nrc-1"]
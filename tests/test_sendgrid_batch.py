@@ -0,0 +1,108 @@
+"""Tests for batched digest delivery against the mock SendGrid endpoint."""
+
+import pytest
+
+import config
+from notifier.email import DIGEST_TOKEN, DigestRecipient, EmailNotifier
+from notifier.mock_sendgrid import MockSendGridServer
+from scrapers.job import Job
+
+
+def make_job(n: int, score: float = 80) -> Job:
+    return Job(
+        id=f"job{n}", title=f"Country Director {n}", organization="NRC", location="Nairobi",
+        url=f"https://example.org/{n}", source="reliefweb", description="Lead the programme.",
+        score=score,
+    )
+
+
+@pytest.fixture
+def mock_sendgrid(monkeypatch):
+    def start(reject=()):
+        server = MockSendGridServer(reject=set(reject)).start()
+        servers.append(server)
+        monkeypatch.setattr(config, "SENDGRID_API_KEY", "test-key")
+        monkeypatch.setattr(config, "SENDGRID_API_HOST", server.url)
+        return server
+
+    servers = []
+    yield start
+    for server in servers:
+        server.stop()
+
+
+def test_shared_jobs_are_sent_once_as_sections(mock_sendgrid):
+    mock = mock_sendgrid()
+    shared, own = make_job(1), make_job(2)
+    recipients = [
+        DigestRecipient("a@example.org", high_matches=[shared, own]),
+        DigestRecipient("b@example.org", high_matches=[shared]),
+    ]
+
+    results = EmailNotifier().send_batch(recipients)
+
+    assert results == {"a@example.org": None, "b@example.org": None}
+    assert len(mock.requests) == 1
+    request = mock.requests[0]
+    assert len(request["personalizations"]) == 2
+    assert len(request["sections"]) == 2
+    # Job cards travel as section tags, not inline in each substitution
+    for personalization in request["personalizations"]:
+        assert shared.title not in personalization["substitutions"][DIGEST_TOKEN]
+
+    delivered = {m["to"]: m for m in mock.delivered}
+    assert shared.title in delivered["a@example.org"]["html"]
+    assert own.title in delivered["a@example.org"]["html"]
+    assert shared.title in delivered["b@example.org"]["html"]
+    assert own.title not in delivered["b@example.org"]["html"]
+    assert delivered["a@example.org"]["subject"] != delivered["b@example.org"]["subject"]
+
+
+def test_oversized_substitution_falls_back_to_own_message(mock_sendgrid, monkeypatch):
+    mock = mock_sendgrid()
+    monkeypatch.setattr(config, "SENDGRID_SUBSTITUTION_LIMIT", 200)
+
+    results = EmailNotifier().send_batch([DigestRecipient("a@example.org", high_matches=[make_job(1)])])
+
+    assert results == {"a@example.org": None}
+    assert len(mock.requests) == 1
+    assert "substitutions" not in mock.requests[0]["personalizations"][0]
+    assert "Country Director 1" in mock.delivered[0]["html"]
+
+
+def test_batches_split_at_personalization_limit(mock_sendgrid, monkeypatch):
+    mock = mock_sendgrid()
+    monkeypatch.setattr(config, "SENDGRID_MAX_PERSONALIZATIONS", 2)
+    recipients = [DigestRecipient(f"user{i}@example.org", high_matches=[make_job(i)]) for i in range(3)]
+
+    results = EmailNotifier().send_batch(recipients)
+
+    assert all(error is None for error in results.values())
+    assert [len(r["personalizations"]) for r in mock.requests] == [2, 1]
+    assert sorted(m["to"] for m in mock.delivered) == sorted(r.email for r in recipients)
+
+
+def test_rejected_personalization_is_dropped_and_rest_resent(mock_sendgrid):
+    mock = mock_sendgrid(reject={"bad@example.org"})
+    recipients = [
+        DigestRecipient("a@example.org", high_matches=[make_job(1)]),
+        DigestRecipient("bad@example.org", high_matches=[make_job(1)]),
+        DigestRecipient("c@example.org", high_matches=[make_job(2)]),
+    ]
+
+    results = EmailNotifier().send_batch(recipients)
+
+    assert results["a@example.org"] is None
+    assert results["c@example.org"] is None
+    assert results["bad@example.org"] == "Rejected recipient"
+    assert len(mock.requests) == 2
+    assert sorted(m["to"] for m in mock.delivered) == ["a@example.org", "c@example.org"]
+
+
+def test_invalid_address_is_reported_without_a_request(mock_sendgrid):
+    mock = mock_sendgrid()
+
+    results = EmailNotifier().send_batch([DigestRecipient("not-an-address", high_matches=[make_job(1)])])
+
+    assert results == {"not-an-address": "Invalid email address"}
+    assert mock.requests == []
@@ -0,0 +1,137 @@
+"""Tests for the SMTP outbox and connection pool against a local aiosmtpd server."""
+
+import smtplib
+import socket
+
+import pytest
+from aiosmtpd.controller import Controller
+
+import config
+from notifier.smtp import Outbox, SMTPConnectionPool, SMTPNotifier
+from scrapers.job import Job
+
+
+class Recorder:
+    def __init__(self):
+        self.messages = []
+
+    async def handle_DATA(self, server, session, envelope):
+        self.messages.append(envelope)
+        return "250 OK"
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture
+def smtp_config(monkeypatch):
+    monkeypatch.setattr(config, "SMTP_HOST", "127.0.0.1")
+    monkeypatch.setattr(config, "SMTP_PORT", free_port())
+    monkeypatch.setattr(config, "SMTP_STARTTLS", False)
+    monkeypatch.setattr(config, "SMTP_USER", "")
+    monkeypatch.setattr(config, "REQUEST_TIMEOUT", 2)
+    monkeypatch.setattr(config, "EMAIL_FROM", "jobs@example.org")
+
+
+@pytest.fixture
+def smtp_server(smtp_config):
+    recorder = Recorder()
+    controller = Controller(recorder, hostname=config.SMTP_HOST, port=config.SMTP_PORT)
+    controller.start()
+    yield recorder
+    controller.stop()
+
+
+def make_job() -> Job:
+    return Job(
+        id="job1", title="Country Director", organization="NRC", location="Nairobi",
+        url="https://example.org/1", source="reliefweb", description="Lead the programme.", score=80,
+    )
+
+
+def test_queued_digests_are_delivered_and_removed(data_dir, smtp_server):
+    notifier = SMTPNotifier()
+    for email in ["a@example.org", "b@example.org", "c@example.org"]:
+        assert notifier.send_digest([make_job()], [], {}, to_email=email)
+
+    assert notifier.drain() == (3, 0)
+    assert sorted(e.rcpt_tos[0] for e in smtp_server.messages) == [
+        "a@example.org", "b@example.org", "c@example.org",
+    ]
+    assert list(config.OUTBOX_DIR.iterdir()) == []
+
+
+def test_failed_delivery_is_retried_later_then_dead_lettered(data_dir, smtp_config, monkeypatch):
+    monkeypatch.setattr(config, "MAX_RETRIES", 1)
+    monkeypatch.setattr(config, "OUTBOX_MAX_ATTEMPTS", 2)
+    monkeypatch.setattr(config, "OUTBOX_RETRY_DELAY", 0)
+    outbox = Outbox()
+    notifier = SMTPNotifier(outbox)
+    notifier.send_digest([make_job()], [], {}, to_email="a@example.org")
+
+    assert notifier.drain() == (0, 1)  # No server listening
+    assert len(outbox) == 1 and len(list(config.OUTBOX_DIR.glob("*.json"))) == 1
+
+    assert notifier.drain() == (0, 1)
+    assert len(outbox) == 0
+    assert list(config.OUTBOX_DIR.glob("*.json")) == []
+    assert len(list(outbox.dead_path.glob("*.eml"))) == 1
+    assert len(list(outbox.dead_path.glob("*.json"))) == 1
+
+
+def test_pool_frees_slot_when_reconnect_fails(smtp_server, monkeypatch):
+    pool = SMTPConnectionPool(size=1)
+    conn = pool.acquire()
+    pool.release(conn)
+
+    def dropped():
+        raise OSError("connection reset")
+
+    def refused(*args, **kwargs):
+        raise ConnectionRefusedError("refused")
+
+    smtp = smtplib.SMTP
+    monkeypatch.setattr(conn, "noop", dropped)
+    monkeypatch.setattr(smtplib, "SMTP", refused)
+    with pytest.raises(ConnectionRefusedError):
+        pool.acquire()
+    assert pool._created == 0
+
+    monkeypatch.setattr(smtplib, "SMTP", smtp)
+    conn = pool.acquire()
+    assert conn.noop()[0] == 250
+    pool.release(conn)
+    pool.close()
+
+
+def test_pool_wait_times_out_when_exhausted(smtp_server, monkeypatch):
+    monkeypatch.setattr(config, "REQUEST_TIMEOUT", 0.1)
+    pool = SMTPConnectionPool(size=1)
+    conn = pool.acquire()
+
+    with pytest.raises(TimeoutError):
+        pool.acquire()
+
+    pool.release(conn)
+    pool.close()
+
+
+def test_jobs_are_recorded_in_ledger_on_delivery_not_on_queue(data_dir, smtp_server):
+    from notifier.ledger import SentLedger
+
+    notifier = SMTPNotifier()
+    job = make_job()
+    notifier.send_digest([job], [], {}, to_email="a@example.org")
+
+    assert not SentLedger().seen("a@example.org", job.id)
+    assert notifier.outbox.queued_jobs() == {"a@example.org": {job.id}}
+    unseen, already = SentLedger().split("a@example.org", [job], notifier.outbox.queued_jobs()["a@example.org"])
+    assert (unseen, already) == ([], 1)
+
+    notifier.drain()
+
+    assert SentLedger().seen("a@example.org", job.id)
+    assert notifier.outbox.queued_jobs() == {}
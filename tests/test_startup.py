@@ -0,0 +1,49 @@
+"""Lookup commands must start without loading the heavy dependencies."""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+from conftest import ROOT
+from pipeline.store import save_jobs, save_matches
+from scrapers.job import Job
+
+HEAVY = {"sklearn", "numpy", "scipy", "requests", "lxml", "bs4", "feedparser", "tenacity", "sendgrid"}
+
+
+def _imported_modules(stderr: str) -> set[str]:
+    """Top-level packages named in -X importtime output."""
+    modules = set()
+    for line in stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            name = line.rsplit("|", 1)[1].strip()
+            modules.add(name.split(".")[0])
+    return modules
+
+
+@pytest.mark.parametrize("argv", [
+    ["list"],
+    ["list", "nutrition"],
+    ["apply"],
+    ["search", "nutrition", "--location", "Kenya"],
+])
+def test_lookup_commands_skip_heavy_imports(data_dir, argv):
+    job = Job(
+        id="abc123", title="Nutrition Specialist", organization="UNICEF", location="Nairobi, Kenya",
+        description="Lead the nutrition programme.\nUNICEF is a smoke-free environment.",
+        url="https://example.org/abc123", source="unjobs", score=81.0,
+    )
+    save_jobs([job])
+    save_matches([job])
+
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "main.py", *argv],
+        cwd=ROOT, env={**os.environ, "DATA_DIR": str(data_dir)},
+        capture_output=True, text=True, timeout=60,
+    )
+
+    assert result.returncode == 0, result.stdout + result.stderr
+    assert "Nutrition Specialist" in result.stdout
+    assert not HEAVY & _imported_modules(result.stderr)
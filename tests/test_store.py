@@ -0,0 +1,64 @@
+"""Tests for the sharded job store."""
+
+import json
+
+import config
+from pipeline import store
+from pipeline.context import PipelineContext
+from scrapers.job import Job
+
+
+def _job(job_id: str, scraped_at: str) -> Job:
+    return Job(
+        id=job_id, title="WASH Officer", organization="UNICEF", location="Addis Ababa",
+        description=f"Duties of {job_id}.\nUNICEF is a smoke-free environment.",
+        url=f"https://example.org/{job_id}", source="reliefweb", scraped_at=scraped_at,
+    )
+
+
+def test_legacy_file_is_migrated_to_shards(data_dir):
+    jobs = [_job("sep", "2026-09-03T08:00:00"), _job("oct", "2026-10-01T08:00:00")]
+    config.JOBS_FILE.write_text(json.dumps({"jobs": [j.to_dict() for j in jobs], "meta": {"scorer": "abc"}}))
+
+    loaded, meta = store.read_jobs()
+
+    assert not config.JOBS_FILE.exists()
+    assert sorted(p.name for p in config.JOBS_DIR.glob("20*.json")) == ["2026-09.json", "2026-10.json"]
+    assert meta == {"scorer": "abc"}
+    assert [job.to_dict() for job in loaded] == [job.to_dict() for job in jobs]
+
+
+def test_unchanged_shard_is_neither_serialised_nor_rewritten(data_dir, monkeypatch):
+    store.save_jobs([_job("sep", "2026-09-03T08:00:00"), _job("oct", "2026-10-01T08:00:00")])
+    september = config.JOBS_DIR / "2026-09.json"
+    before = september.stat().st_mtime_ns
+
+    serialised = []
+    to_dict = Job.to_dict
+    monkeypatch.setattr(Job, "to_dict", lambda self, *a, **kw: serialised.append(self.id) or to_dict(self, *a, **kw))
+
+    ctx = PipelineContext()
+    ctx.jobs[1].score = 80.0
+    ctx.jobs = ctx.jobs + [_job("new", "2026-10-02T08:00:00")]
+    ctx.commit()
+
+    assert sorted(serialised) == ["new", "oct"]
+    assert september.stat().st_mtime_ns == before
+    assert [job.score for job in store.load_jobs()] == [None, 80.0, None]
+
+
+def test_shard_not_matching_the_manifest_is_rewritten(data_dir, capsys):
+    store.save_jobs([_job("sep", "2026-09-03T08:00:00"), _job("oct", "2026-10-01T08:00:00")])
+    september = config.JOBS_DIR / "2026-09.json"
+    saved = september.read_text()
+    september.write_text(json.dumps(json.loads(saved)))  # Same jobs, different bytes
+
+    ctx = PipelineContext()
+    ctx.jobs[1].score = 80.0
+    ctx.jobs = ctx.jobs
+    ctx.commit()
+
+    assert "2026-09.json does not match the manifest" in capsys.readouterr().out
+    assert september.read_text() == saved
+    manifest = json.loads(config.JOBS_MANIFEST_FILE.read_text())
+    assert manifest["shards"]["2026-09"]["count"] == 1
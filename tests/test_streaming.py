@@ -0,0 +1,99 @@
+"""Tests for the streaming pipeline's failure handling."""
+
+import threading
+
+import pipeline.streaming as streaming
+from matcher.profile import CVProfile
+from pipeline.streaming import StreamingPipeline
+from scrapers.job import Job
+
+JOBS = 200  # Far more than the queues hold
+
+
+class FakeScraper:
+    name = "fake"
+
+    def __init__(self):
+        self.produced = 0
+
+    def stream(self):
+        for i in range(JOBS):
+            self.produced += 1
+            yield Job(
+                id=f"job{i}", title=f"Country Director {i}", organization="NRC",
+                location="Nairobi", url=f"https://example.org/{i}", source=self.name,
+                description="Lead the programme.",
+            )
+
+
+class FakeScorer:
+    def score_job(self, job):
+        return 90
+
+    def filter_matches(self, jobs):
+        return jobs
+
+
+class FakeContext:
+    def __init__(self, broken_profile: bool = False):
+        self.broken_profile = broken_profile
+        self.jobs = []
+        self.matches = []
+
+    @property
+    def profile(self):
+        if self.broken_profile:
+            raise FileNotFoundError("CV profile not found")
+        return CVProfile(name="Sam Doe")
+
+    @property
+    def scorer(self):
+        if self.broken_profile:
+            raise FileNotFoundError("CV profile not found")
+        return FakeScorer()
+
+
+def run_with_timeout(pipeline: StreamingPipeline, timeout: float = 10):
+    """Run the pipeline in a thread; fail the test instead of hanging."""
+    outcome = {}
+
+    def target():
+        try:
+            outcome["result"] = pipeline.run()
+        except Exception as e:
+            outcome["error"] = e
+
+    thread = threading.Thread(target=target, daemon=True)
+    thread.start()
+    thread.join(timeout)
+    assert not thread.is_alive(), "pipeline deadlocked"
+    return outcome
+
+
+def test_scorer_setup_failure_does_not_deadlock(data_dir):
+    scraper = FakeScraper()
+    pipeline = StreamingPipeline(FakeContext(broken_profile=True), scrapers=[scraper], queue_size=5)
+
+    outcome = run_with_timeout(pipeline)
+
+    assert isinstance(outcome["error"], FileNotFoundError)
+    assert scraper.produced == JOBS
+
+
+def test_notifier_setup_failure_does_not_deadlock(data_dir, monkeypatch):
+    def broken_notifier():
+        raise ValueError("bad notifier config")
+
+    monkeypatch.setattr(streaming, "get_notifier", broken_notifier)
+    monkeypatch.setattr(streaming.config, "MAX_COVER_LETTERS_PER_RUN", 0)
+    scraper = FakeScraper()
+    ctx = FakeContext()
+    pipeline = StreamingPipeline(ctx, scrapers=[scraper], queue_size=5)
+
+    outcome = run_with_timeout(pipeline)
+
+    assert isinstance(outcome["error"], ValueError)
+    assert scraper.produced == JOBS
+    # Scoring finished, so its results still reach the context
+    assert len(ctx.jobs) == JOBS
+    assert len(ctx.matches) == JOBS
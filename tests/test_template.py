@@ -0,0 +1,66 @@
+"""Tests for template cover letter drafts."""
+
+import pytest
+
+from generator.template import TemplateLetterGenerator
+from matcher.profile import CVProfile
+from scrapers.job import Job
+
+
+@pytest.fixture
+def profile():
+    return CVProfile(
+        name="Sam Doe",
+        years_experience=8,
+        skills=["EU-funded program management", "Budget management", "GIS/mapping"],
+        languages=["French", "English"],
+        sectors=["Humanitarian", "WASH"],
+        organizations_worked=["IOM"],
+        donors_experience=["ECHO"],
+    )
+
+
+def make_job(description: str) -> Job:
+    return Job(
+        id="1", title="Programme Manager", organization="NRC", location="Nairobi",
+        url="https://example.org/1", source="reliefweb", description=description,
+    )
+
+
+def test_draft_uses_template_phrases_filled_from_profile(data_dir, profile):
+    letter = TemplateLetterGenerator(profile).generate(
+        make_job("Humanitarian WASH programme funded by ECHO; budget management required.")
+    )
+
+    assert "program management experience in humanitarian and WASH" in letter
+    assert "strong track record with ECHO compliance" in letter
+    assert "I am fluent in French and English." in letter
+    assert letter.endswith("Kind regards,\nSam Doe")
+
+
+def test_draft_makes_no_claims_missing_from_profile(data_dir, profile):
+    letter = TemplateLetterGenerator(profile).generate(make_job("Humanitarian response."))
+
+    for claim in ["short notice", "complex operating contexts", "Led teams", "Managed budgets",
+                  "consortium management", "["]:
+        assert claim not in letter
+
+
+def test_draft_keeps_case_of_acronyms_and_mixed_case_terms(data_dir, profile):
+    letter = TemplateLetterGenerator(profile).generate(
+        make_job("EU-funded program management, budget management and GIS/mapping.")
+    )
+
+    assert "EU-funded program management" in letter
+    assert "eU-funded" not in letter
+    assert "budget management" in letter
+    assert "GIS/mapping" in letter
+
+
+def test_missing_template_leaves_out_key_phrases(data_dir, profile, tmp_path):
+    letter = TemplateLetterGenerator(profile, template_path=tmp_path / "missing.md").generate(
+        make_job("Humanitarian programme funded by ECHO.")
+    )
+
+    assert "track record" not in letter
+    assert "Dear Hiring Manager" in letter
@@ -0,0 +1,46 @@
+"""The plain-Python TF-IDF model must score exactly like scikit-learn."""
+
+import pytest
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.metrics.pairwise import cosine_similarity
+
+import config
+from matcher import tfidf
+from matcher.tfidf import VECTORIZER_PARAMS, TfidfModel
+
+PROFILE = (
+    "Humanitarian programme management, budget management, donor reporting for ECHO and EU, "
+    "nutrition and food security, team leadership, monitoring and evaluation, "
+    "emergency response in East Africa"
+)
+
+
+@pytest.mark.parametrize("description", [
+    "Lead the nutrition programme and manage the budget. Report to ECHO and other donors.",
+    "Monitoring and evaluation specialist for food security projects in Ethiopia and Kenya.",
+    "The Country Director provides team leadership for emergency response across East Africa.",
+    "Accountant: payroll, invoices and month-end closing.",
+    "BUDGET management; Budget-management; budget   management!",
+    "",
+])
+def test_matches_scikit_learn(data_dir, description):
+    vectorizer = TfidfVectorizer(**VECTORIZER_PARAMS).fit([PROFILE])
+    expected = cosine_similarity(vectorizer.transform([PROFILE]), vectorizer.transform([description]))[0, 0]
+
+    model = TfidfModel.fit([PROFILE])
+    cached = TfidfModel.cached(PROFILE)
+    reloaded = TfidfModel.cached(PROFILE)  # Now read from the cache file
+
+    for m in (model, cached, reloaded):
+        assert m.similarity(m.transform(PROFILE), m.transform(description)) == pytest.approx(expected, abs=1e-12)
+
+
+def test_cache_is_refit_after_a_scikit_learn_upgrade(data_dir, monkeypatch):
+    TfidfModel.cached(PROFILE)
+    before = {p.name for p in config.SCORER_CACHE_DIR.glob("tfidf-*.pkl")}
+
+    monkeypatch.setattr(tfidf, "_sklearn_version", lambda: "99.0")
+    TfidfModel.cached(PROFILE)
+    after = {p.name for p in config.SCORER_CACHE_DIR.glob("tfidf-*.pkl")}
+
+    assert before and after and before != after
@@ -0,0 +1,18 @@
+"""Tests for the watch daemon."""
+
+from pipeline.context import PipelineContext
+from pipeline.watch import WatchDaemon
+
+
+def test_watch_without_sources_returns(data_dir, capsys):
+    WatchDaemon(PipelineContext(), scrapers=[]).run()
+
+    assert "No sources to watch" in capsys.readouterr().out
+
+
+def test_context_load_reads_jobs_and_matches_once(data_dir):
+    ctx = PipelineContext()
+    ctx.load()
+
+    assert ctx.jobs == [] and ctx.matches == []
+    assert not ctx.jobs_dirty and not ctx.matches_dirty